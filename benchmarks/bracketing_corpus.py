@@ -0,0 +1,66 @@
+"""Benchmark corpus for the bracketed methods.
+
+Run from the repository root with:
+
+    python -m benchmarks.bracketing_corpus
+
+For every problem it prints the number of iterations and function evaluations each method needs, or the error it
+raises. The stagnation cases are convex or concave over a wide bracket, where one endpoint of the standard False
+Position method never moves.
+"""
+import time
+
+from src.algorithms.bisection import bisection
+from src.algorithms.false_position import VARIANTS, false_position
+from src.utils.function_evaluation import get_function
+
+# (expression, a, b, description)
+CORPUS = [
+    ("x**3 - 2*x - 5", 2, 3, "classic cubic"),
+    ("exp(-x) - x", 0, 1, "transcendental"),
+    ("cos(x) - x", 0, 1, "transcendental"),
+    ("x**2 - 612", 10, 30, "square root"),
+    # Stagnation cases
+    ("exp(x) - 10", 0, 10, "stagnation: convex, wide bracket"),
+    ("x**10 - 1", 0, 1.3, "stagnation: steep convex"),
+    ("log(x)", 0.1, 50, "stagnation: concave, wide bracket"),
+    ("1 - 1/x**2", 0.5, 20, "stagnation: concave with asymptote"),
+    ("x*exp(x) - 1", -1, 5, "stagnation: convex, fast growth"),
+]
+
+
+def count_evaluations(f):
+    """Wrap f so that its number of evaluations is counted."""
+    def wrapper(x):
+        wrapper.count += 1
+        return f(x)
+
+    wrapper.count = 0
+    return wrapper
+
+
+def run_method(solve, expr, a, b, tol, max_iter):
+    """Run one method on one problem and describe the outcome."""
+    f = count_evaluations(get_function(expr))
+    start = time.perf_counter()
+    try:
+        _, n = solve(f, a, b, tol, max_iter)
+    except ValueError:
+        return "failed"
+    elapsed = time.perf_counter() - start
+    return f"{n:4d} it {f.count:4d} ev {elapsed * 1e6:7.0f} us"
+
+
+def main(tol=1e-10, max_iter=100):
+    methods = [("bisection", bisection)]
+    for variant in VARIANTS:
+        methods.append((f"fp-{variant}", lambda f, a, b, t, m, v=variant: false_position(f, a, b, t, m, variant=v)))
+
+    for expr, a, b, description in CORPUS:
+        print(f"{expr} on [{a}, {b}] ({description})")
+        for name, solve in methods:
+            print(f"    {name:20s} {run_method(solve, expr, a, b, tol, max_iter)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark of the GUI cold start.
+
+Run from the repository root with:
+
+    python -m benchmarks.gui_startup [--max-window-ms MS]
+
+It prints the import time of the GUI and of its heavy dependencies, each measured in a fresh interpreter, then the
+time until the main window is shown and until the deferred libraries are loaded. The window is created with the
+offscreen Qt platform, so no display is needed. With --max-window-ms the script exits with an error when the
+window takes longer than that to appear, so it can guard the startup time in CI.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+MODULES = ["numpy", "PyQt5.QtWidgets", "sympy", "matplotlib.pyplot", "src.gui.plotting", "src.gui.main_gui"]
+
+# Runs in a fresh interpreter and prints the two startup times in seconds
+STARTUP_SCRIPT = """
+import time
+start = time.perf_counter()
+from PyQt5.QtWidgets import QApplication
+import src.gui.main_gui as gui
+gui.app = QApplication([])
+gui.window = gui.RootFinderApp()
+gui.window.show()
+gui.app.processEvents()
+shown = time.perf_counter() - start
+while not gui.window.libraries_loaded:
+    gui.app.processEvents()
+    time.sleep(0.001)
+print(shown, time.perf_counter() - start)
+"""
+
+
+def import_time(module):
+    """Returns the cumulative import time of a module in seconds, measured with python -X importtime."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True, check=True)
+    # The last line is the top-level module, its second column the cumulative time in microseconds
+    return int(result.stderr.strip().splitlines()[-1].split("|")[1]) / 1e6
+
+
+def startup_time():
+    """Returns the seconds until the main window is shown and until the deferred libraries are loaded."""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    result = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT], capture_output=True, text=True, check=True,
+                            env=env)
+    shown, loaded = map(float, result.stdout.split())
+    return shown, loaded
+
+
+def main(max_window_ms=None):
+    print(f"{'import':<20} {'time (ms)':>10}")
+    for module in MODULES:
+        print(f"{module:<20} {import_time(module) * 1000:>10.0f}")
+
+    shown, loaded = startup_time()
+    print()
+    print(f"window shown after      {shown * 1000:.0f} ms")
+    print(f"libraries loaded after  {loaded * 1000:.0f} ms")
+
+    if max_window_ms is not None and shown * 1000 > max_window_ms:
+        sys.exit(f"The window took {shown * 1000:.0f} ms to appear, over the budget of {max_window_ms:.0f} ms.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-window-ms", type=float, help="fail when the window takes longer to appear")
+    main(parser.parse_args().max_window_ms)
@@ -1,22 +1,32 @@
-def bisection(f, a, b, tol=1e-5, max_iter=100):
-    """Bisection method for finding a root of a function.
+from src.utils.solve_limits import limit_evaluations
+from src.utils.solver_iteration import run_to_completion
+
+
+def bisection_iter(f, a, b, tol=1e-5, max_iter=100, max_fev=None, deadline=None, cancel_token=None):
+    """Generator form of the bisection method, yielding the solver state after every iteration.
 
     Parameters:
-    - f (function): Function to find the root of.
-    - a, b (float): The interval [a, b] within which to search for the root.
-    - tol (float): The tolerance level for stopping the algorithm.
-    - max_iter (int): Maximum number of iterations.
+    - f, a, b, tol, max_iter, max_fev, deadline, cancel_token: As in bisection.
+
+    Yields:
+    - state (dict): The iteration count "n", the midpoint "x", its function value "fx" and the updated bracket "a",
+      "b".
 
     Returns:
-    - x (float): The root of the function.
-    - n (int): The number of iterations required to reach the root.
+    - (x, n) (tuple): The root and the number of iterations, as the value of the StopIteration.
 
     Raises: - ValueError: If the function does not change sign within the interval [a, b] or the maximum number of
     iterations is exceeded.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors that carry the
+      best iterate so far.
     """
 
+    # Check the evaluation limits before every evaluation
+    [f] = limit_evaluations([f], max_fev, deadline, cancel_token)
+
     # Check if the function changes sign within the interval [a, b]
-    if f(a) * f(b) > 0:
+    f_a = f(a)
+    if f_a * f(b) > 0:
         raise ValueError("The function does not change sign within the interval [a, b].")
 
     # Initialize variables
@@ -25,22 +35,48 @@ def bisection(f, a, b, tol=1e-5, max_iter=100):
     # Loop until the root is found or the maximum number of iterations is reached
     while abs(b - a) > tol and n < max_iter:
         x = (a + b) / 2
+        f_x = f(x)
 
         # Check if the function value at the root approximation is sufficiently close to zero
-        if abs(f(x)) <= tol:
+        if abs(f_x) <= tol:
             return x, n
 
         # Check if the root is in the interval [a, x] or [x, b]
-        if f(a) * f(x) < 0:
+        if f_a * f_x < 0:
             b = x
         else:
-            a = x
+            a, f_a = x, f_x
 
         # Update iteration count
         n += 1
+        yield {"n": n, "x": x, "fx": f_x, "a": a, "b": b}
 
     # Check for convergence
     if n == max_iter:
         raise ValueError("Exceeded maximum iterations. Adjust the initial interval, tolerance, or try another method.")
 
     return (a + b) / 2, n
+
+
+def bisection(f, a, b, tol=1e-5, max_iter=100, max_fev=None, deadline=None, cancel_token=None):
+    """Bisection method for finding a root of a function.
+
+    Parameters:
+    - f (function): Function to find the root of.
+    - a, b (float): The interval [a, b] within which to search for the root.
+    - tol (float): The tolerance level for stopping the algorithm.
+    - max_iter (int): Maximum number of iterations.
+    - max_fev (int, optional): Maximum number of function evaluations, derivatives included.
+    - deadline (float, optional): The time.monotonic() value after which no further evaluation is started.
+    - cancel_token (CancellationToken, optional): A token that cancels the solve when set.
+
+    Returns:
+    - x (float): The root of the function.
+    - n (int): The number of iterations required to reach the root.
+
+    Raises: - ValueError: If the function does not change sign within the interval [a, b] or the maximum number of
+    iterations is exceeded.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors that carry the
+      best iterate so far.
+    """
+    return run_to_completion(bisection_iter(f, a, b, tol, max_iter, max_fev, deadline, cancel_token))
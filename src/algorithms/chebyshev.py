@@ -0,0 +1,185 @@
+import numpy as np
+from numpy.polynomial import chebyshev
+
+from src.utils.function_evaluation import as_vectorized
+from src.utils.solve_limits import limit_evaluations
+
+# The first degree tried, doubled until the Chebyshev coefficients have decayed
+MIN_DEGREE = 16
+
+# Above this degree the proxy is split in two rather than solved with one colleague matrix
+MAX_COLLEAGUE_DEGREE = 50
+
+# Where a proxy on [-1, 1] is split: slightly off center, so that a root at the midpoint is not found by both halves
+SPLIT_POINT = -0.004849834917525
+
+# Eigenvalues of the colleague matrix further than this from the real axis are not real roots
+IMAG_TOL = 1e-8
+
+# Number of vectorized Newton steps used to polish the roots of the proxy on f itself
+POLISH_STEPS = 3
+
+
+def _chebyshev_points(n):
+    """The n + 1 Chebyshev extreme points cos(pi * j / n) on [-1, 1], from 1 down to -1."""
+    return np.cos(np.pi * np.arange(n + 1) / n)
+
+
+def _coefficients(values):
+    """Chebyshev coefficients of the polynomial interpolating values at the Chebyshev points, with one real FFT."""
+    n = len(values) - 1
+    # The even extension turns the cosine sums into a discrete Fourier transform
+    extended = np.concatenate([values, values[-2:0:-1]])
+    coeffs = np.fft.rfft(extended).real[:n + 1] / n
+    coeffs[0] /= 2
+    coeffs[n] /= 2
+    return coeffs
+
+
+def _chop(coeffs, threshold):
+    """Drop the trailing coefficients that are not above the threshold, keeping at least the constant term."""
+    significant = np.nonzero(np.abs(coeffs) > threshold)[0]
+    return coeffs[:significant[-1] + 1] if significant.size else coeffs[:1]
+
+
+def _colleague_roots(coeffs):
+    """The real roots in [-1, 1] of a Chebyshev series, as the eigenvalues of its colleague matrix."""
+    n = len(coeffs) - 1
+    if n == 0:
+        return np.empty(0)
+    if n == 1:
+        roots = np.array([-coeffs[0] / coeffs[1]])
+    else:
+        # x T_k = (T_{k-1} + T_{k+1}) / 2, with the highest term replaced using the series itself
+        colleague = np.diag(np.full(n - 1, 0.5), 1) + np.diag(np.full(n - 1, 0.5), -1)
+        colleague[0, 1] = 1
+        colleague[-1, :] -= coeffs[:n] / (2 * coeffs[n])
+        roots = np.linalg.eigvals(colleague)
+
+    roots = roots[(np.abs(roots.imag) <= IMAG_TOL) & (np.abs(roots.real) <= 1 + IMAG_TOL)]
+    return np.clip(roots.real, -1, 1)
+
+
+def _proxy_roots(coeffs, threshold):
+    """The real roots in [-1, 1] of a Chebyshev series, splitting the interval while the degree is too high.
+
+    Each half is interpolated again at the same number of points, which it needs fewer coefficients to resolve.
+    """
+    coeffs = _chop(coeffs, threshold)
+    n = len(coeffs) - 1
+    if n <= MAX_COLLEAGUE_DEGREE:
+        return _colleague_roots(coeffs)
+
+    t = _chebyshev_points(n)
+    roots = []
+    for lo, hi in [(-1, SPLIT_POINT), (SPLIT_POINT, 1)]:
+        half = _coefficients(chebyshev.chebval(lo + (hi - lo) * (t + 1) / 2, coeffs))
+        roots.append(lo + (hi - lo) * (_proxy_roots(half, threshold) + 1) / 2)
+    return np.concatenate(roots)
+
+
+def chebyshev_roots(f, a, b, df=None, tol=1e-13, max_degree=2 ** 12, max_fev=None, deadline=None,
+                    cancel_token=None):
+    """Find all the real roots of a smooth function on an interval with a Chebyshev proxy.
+
+    f is sampled at Chebyshev points, and the degree of the interpolant is doubled until its Chebyshev coefficients
+    have decayed to tol. The points of each degree include those of the previous one, so no sample is taken twice.
+    The roots of the interpolant are the real eigenvalues of its colleague matrix, with the interval split recursively
+    when the degree is high. They are then polished with a few Newton steps on f itself. For smooth functions every
+    root is found to near machine precision with a few hundred evaluations of f, without any starting point or sign
+    change.
+
+    Parameters:
+    - f (function): Function to find the roots of. Vectorized functions are sampled in one call per degree.
+    - a, b (float): The interval [a, b] within which to search for roots.
+    - df (function, optional): Derivative of the function for the polishing steps. Defaults to the derivative of the
+      interpolant, which costs no evaluations.
+    - tol (float): The size, relative to the largest coefficient, below which a Chebyshev coefficient is negligible.
+    - max_degree (int): Maximum degree of the interpolant.
+    - max_fev (int, optional): Maximum number of pointwise evaluations of f and df together.
+    - deadline (float, optional): The time.monotonic() value after which no further evaluation is started.
+    - cancel_token (CancellationToken, optional): A token that cancels the solve when set.
+
+    Returns:
+    - roots (ndarray): The roots in [a, b], sorted.
+    - n (int): The number of evaluations of f.
+
+    Raises:
+    - ValueError: If a >= b, if f is not finite at a sample point, or if the coefficients have not decayed at the
+      maximum degree, which happens when f is not smooth on the interval.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors, with no best
+      iterate since the method does not iterate on a single point.
+    """
+    if not a < b:
+        raise ValueError("The interval must satisfy a < b.")
+
+    f = as_vectorized(f)
+    funcs = [f] if df is None else [f, as_vectorized(df)]
+    f, *derivative = limit_evaluations(funcs, max_fev, deadline, cancel_token, track_best=False, count_elements=True)
+
+    def to_interval(t):
+        return (a + b) / 2 + (b - a) / 2 * t
+
+    def sample(t):
+        # Poles and domain errors are reported below, as non-finite values
+        with np.errstate(all="ignore"):
+            return np.asarray(f(to_interval(t)), dtype=float)
+
+    # Sample at the Chebyshev points of increasing degree until the coefficients decay
+    n = MIN_DEGREE
+    values = sample(_chebyshev_points(n))
+    nfev = n + 1
+    while True:
+        if not np.all(np.isfinite(values)):
+            raise ValueError("The function is not finite on the whole interval.")
+        coeffs = _coefficients(values)
+        threshold = tol * np.max(np.abs(coeffs))
+        if np.all(np.abs(coeffs[-max(2, n // 8):]) <= threshold):
+            break
+        if 2 * n > max_degree:
+            raise ValueError("The Chebyshev coefficients did not decay up to the maximum degree. The function may not "
+                             "be smooth on the interval.")
+
+        # The new points lie halfway between the previous ones
+        n *= 2
+        refined = np.empty(n + 1)
+        refined[::2] = values
+        refined[1::2] = sample(_chebyshev_points(n)[1::2])
+        values = refined
+        nfev += n // 2
+
+    # A function that is zero on the whole interval has no isolated roots
+    if threshold == 0:
+        return np.empty(0), nfev
+
+    roots = np.unique(to_interval(_proxy_roots(coeffs, threshold)))
+    if roots.size == 0:
+        return roots, nfev
+
+    # The derivative of the interpolant, rescaled from [-1, 1] to [a, b]
+    if derivative:
+        df = derivative[0]
+    else:
+        derivative_coeffs = chebyshev.chebder(_chop(coeffs, threshold)) * 2 / (b - a)
+
+        def df(x):
+            return chebyshev.chebval((2 * x - a - b) / (b - a), derivative_coeffs)
+
+    # Polish on f, keeping only the Newton steps that reduce |f|
+    with np.errstate(all="ignore"):
+        fx = np.asarray(f(roots), dtype=float)
+        nfev += roots.size
+        for _ in range(POLISH_STEPS):
+            candidates = np.clip(roots - fx / df(roots), a, b)
+            f_candidates = np.asarray(f(candidates), dtype=float)
+            nfev += roots.size
+            better = np.isfinite(f_candidates) & (np.abs(f_candidates) < np.abs(fx))
+            if not better.any():
+                break
+            roots = np.where(better, candidates, roots)
+            fx = np.where(better, f_candidates, fx)
+
+    # Roots found on both sides of a split, or polished onto each other, are reported once
+    roots = np.sort(roots)
+    distinct = np.concatenate([[True], np.diff(roots) > 1e-12 * (b - a)])
+    return roots[distinct], nfev
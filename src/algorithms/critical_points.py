@@ -0,0 +1,84 @@
+import math
+
+import numpy as np
+
+from src.utils.function_evaluation import evaluate_many
+
+# Number of points of the vectorized pass over the interval
+CRITICAL_POINT_SAMPLES = 2001
+
+
+def _bisect_brackets(g, lo, hi, g_lo, tol):
+    """Refine the roots of g in the brackets [lo, hi] where it changes sign, by bisection on all of them at once."""
+    steps = max(0, math.ceil(math.log2(np.max(hi - lo) / tol))) if lo.size else 0
+    for _ in range(min(steps, 64)):
+        mid = (lo + hi) / 2
+        same_sign_as_lo = np.sign(evaluate_many(g, mid)) == np.sign(g_lo)
+        lo = np.where(same_sign_as_lo, mid, lo)
+        hi = np.where(same_sign_as_lo, hi, mid)
+    return (lo + hi) / 2
+
+
+def _sign_change_roots(f, g, x, values, tol):
+    """The roots of g where it changes sign between the samples, and the direction of each change.
+
+    Samples where g is exactly zero between two values of opposite signs are roots themselves. Sign changes at a pole
+    of g or of f, where g grows instead of vanishing, are dropped.
+
+    Returns:
+    - roots (ndarray): The roots, sorted.
+    - rising (ndarray): Boolean mask of the roots where g goes from negative to positive.
+    """
+    finite = np.isfinite(values)
+    crossing = np.flatnonzero((values[:-1] * values[1:] < 0) & finite[:-1] & finite[1:])
+    refined = _bisect_brackets(g, x[crossing], x[crossing + 1], values[crossing], tol)
+    g_refined = evaluate_many(g, refined)
+    at_root = np.isfinite(g_refined) & (np.abs(g_refined) <= np.maximum(np.abs(values[crossing]),
+                                                                        np.abs(values[crossing + 1])))
+    at_root &= np.isfinite(evaluate_many(f, refined))
+
+    zero = np.flatnonzero(values[1:-1] == 0) + 1
+    zero = zero[values[zero - 1] * values[zero + 1] < 0]
+
+    roots = np.concatenate([refined[at_root], x[zero]])
+    rising = np.concatenate([values[crossing + 1][at_root] > 0, values[zero + 1] > 0])
+    order = np.argsort(roots)
+    return roots[order], rising[order]
+
+
+def critical_points(f, df, ddf, a, b, samples=CRITICAL_POINT_SAMPLES, tol=1e-12):
+    """Find the local extrema and inflection points of a function on an interval.
+
+    f' and f'' are evaluated on a grid over the interval in one vectorized pass. Every grid segment where f' changes
+    sign holds an extremum, and every one where f'' changes sign an inflection point, and all of them are refined
+    together by vectorized bisection. Extrema are classified by the sign of f'', or by the direction in which f'
+    changes sign where f'' vanishes. Critical points closer together than the grid spacing may be missed, as may
+    roots of f' or f'' that do not change sign, which are not extrema or inflection points.
+
+    Parameters:
+    - f (function): The function.
+    - df (function): Its first derivative.
+    - ddf (function): Its second derivative.
+    - a, b (float): The interval [a, b] within which to search.
+    - samples (int): The number of grid points.
+    - tol (float): The width within which each point is located.
+
+    Returns:
+    - minima (ndarray): The local minima, sorted.
+    - maxima (ndarray): The local maxima, sorted.
+    - inflections (ndarray): The inflection points, sorted.
+
+    Raises:
+    - ValueError: If a >= b.
+    """
+    if not a < b:
+        raise ValueError("The interval must satisfy a < b.")
+
+    x = np.linspace(a, b, samples)
+    extrema, rising = _sign_change_roots(f, df, x, evaluate_many(df, x), tol)
+    inflections, _ = _sign_change_roots(f, ddf, x, evaluate_many(ddf, x), tol)
+
+    # The sign of f'' tells a minimum from a maximum, and where it vanishes, f' going from negative to positive does
+    curvature = evaluate_many(ddf, extrema)
+    is_minimum = np.where(np.isfinite(curvature) & (curvature != 0), curvature > 0, rising)
+    return extrema[is_minimum], extrema[~is_minimum], inflections
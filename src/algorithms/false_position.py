@@ -1,20 +1,58 @@
-def false_position(f, a, b, tol=1e-5, max_iter=100):
-    """False Position method for finding a root of a function.
+from src.utils.solve_limits import limit_evaluations
+from src.utils.solver_iteration import run_to_completion
+
+VARIANTS = ("standard", "illinois", "pegasus", "anderson-bjorck")
+
+
+def _stale_endpoint_scale(variant, f_old, f_x):
+    """Scale factor for the function value of an endpoint that was retained twice in a row.
 
     Parameters:
-    - f (function): Function to find the root of.
-    - a, b (float): The interval [a, b] within which to search for the root.
-    - tol (float): The tolerance level for stopping the algorithm.
-    - max_iter (int): Maximum number of iterations.
+    - variant (str): One of "illinois", "pegasus" or "anderson-bjorck".
+    - f_old (float): The function value of the endpoint that was just replaced.
+    - f_x (float): The function value of the new approximation that replaced it.
 
     Returns:
-    - x (float): The root of the function.
-    - n (int): The number of iterations required to reach the root.
+    - float: The factor by which the function value of the retained endpoint is multiplied.
+    """
+    if variant == "illinois":
+        return 0.5
+    if variant == "pegasus":
+        return f_old / (f_old + f_x)
+
+    # Anderson-Björck, falling back to the Illinois factor when the ratio is not positive
+    m = 1 - f_x / f_old
+    return m if m > 0 else 0.5
+
+
+def false_position_iter(f, a, b, tol=1e-5, max_iter=100, variant="standard", max_fev=None, deadline=None,
+                        cancel_token=None):
+    """Generator form of the False Position method, yielding the solver state after every iteration.
+
+    Parameters:
+    - f, a, b, tol, max_iter, variant, max_fev, deadline, cancel_token: As in false_position.
+
+    Yields:
+    - state (dict): The iteration count "n", the new approximation "x", its function value "fx" and the updated
+      bracket "a", "b".
+
+    Returns:
+    - (x, n) (tuple): The root and the number of iterations, as the value of the StopIteration.
 
     Raises:
-    - ValueError: If the root is not in the interval [a, b], or the maximum number of iterations is exceeded.
+    - ValueError: If the variant is unknown, the root is not in the interval [a, b], or the maximum number of
+      iterations is exceeded.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors that carry the
+      best iterate so far.
     """
 
+    # Check the evaluation limits before every evaluation
+    [f] = limit_evaluations([f], max_fev, deadline, cancel_token)
+
+    # Check that the variant is supported
+    if variant not in VARIANTS:
+        raise ValueError(f"Unknown variant '{variant}'. Choose one of: {', '.join(VARIANTS)}.")
+
     # Compute the function values
     f_a = f(a)
     f_b = f(b)
@@ -26,23 +64,65 @@ def false_position(f, a, b, tol=1e-5, max_iter=100):
     # Initialize variables
     n = 0
     x = a - (f_a * (b - a)) / (f_b - f_a)
+    f_x = f(x)
+    moved = None  # The endpoint that was replaced in the previous iteration
 
     # Loop until the root is found or the maximum number of iterations is reached
-    while abs(f(x)) > tol and n < max_iter:
-        f_x = f(x)
-
+    while abs(f_x) > tol and n < max_iter:
         # Check if the root is in the interval [a, x] or [x, b]
         if f_a * f_x < 0:
+            # Scale down the stale endpoint a if b is replaced twice in a row
+            if variant != "standard" and moved == "b":
+                f_a *= _stale_endpoint_scale(variant, f_b, f_x)
             b, f_b = x, f_x
+            moved = "b"
         else:
+            # Scale down the stale endpoint b if a is replaced twice in a row
+            if variant != "standard" and moved == "a":
+                f_b *= _stale_endpoint_scale(variant, f_a, f_x)
             a, f_a = x, f_x
+            moved = "a"
 
         # Update x using the False Position formula
         x = a - (f_a * (b - a)) / (f_b - f_a)
+        f_x = f(x)
         n += 1
+        yield {"n": n, "x": x, "fx": f_x, "a": a, "b": b}
 
     # Check for convergence
     if n == max_iter:
         raise ValueError("Exceeded maximum iterations. Adjust the initial interval, tolerance, or try another method.")
 
     return x, n
+
+
+def false_position(f, a, b, tol=1e-5, max_iter=100, variant="standard", max_fev=None, deadline=None,
+                   cancel_token=None):
+    """False Position method for finding a root of a function.
+
+    The standard method keeps reusing the function value of an endpoint that stays fixed, which makes it converge
+    only linearly on convex or concave functions. The "illinois", "pegasus" and "anderson-bjorck" variants scale
+    down the function value of an endpoint that was retained twice in a row, which restores superlinear convergence.
+
+    Parameters:
+    - f (function): Function to find the root of.
+    - a, b (float): The interval [a, b] within which to search for the root.
+    - tol (float): The tolerance level for stopping the algorithm.
+    - max_iter (int): Maximum number of iterations.
+    - variant (str): One of "standard", "illinois", "pegasus" or "anderson-bjorck".
+    - max_fev (int, optional): Maximum number of function evaluations, derivatives included.
+    - deadline (float, optional): The time.monotonic() value after which no further evaluation is started.
+    - cancel_token (CancellationToken, optional): A token that cancels the solve when set.
+
+    Returns:
+    - x (float): The root of the function.
+    - n (int): The number of iterations required to reach the root.
+
+    Raises:
+    - ValueError: If the variant is unknown, the root is not in the interval [a, b], or the maximum number of
+      iterations is exceeded.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors that carry the
+      best iterate so far.
+    """
+    return run_to_completion(false_position_iter(f, a, b, tol, max_iter, variant, max_fev, deadline,
+                                                 cancel_token))
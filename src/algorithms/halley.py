@@ -0,0 +1,79 @@
+from src.utils.solve_limits import limit_evaluations
+from src.utils.solver_iteration import run_to_completion
+
+
+def halley_iter(f, df, ddf, x0, tol=1e-5, max_iter=100, max_fev=None, deadline=None, cancel_token=None):
+    """Generator form of Halley's method, yielding the solver state after every iteration.
+
+    Parameters:
+    - f, df, ddf, x0, tol, max_iter, max_fev, deadline, cancel_token: As in halley.
+
+    Yields:
+    - state (dict): The iteration count "n", the new approximation "x", its function value "fx" and the "step" that
+      was subtracted.
+
+    Returns:
+    - (x, n) (tuple): The root and the number of iterations, as the value of the StopIteration.
+
+    Raises:
+    - ValueError: If the denominator becomes zero or the maximum number of iterations is exceeded.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors that carry the
+      best iterate so far.
+    """
+
+    # Check the evaluation limits before every evaluation
+    f, df, ddf = limit_evaluations([f, df, ddf], max_fev, deadline, cancel_token)
+
+    # Initialize variables
+    x = x0
+    fx = f(x)
+
+    # Loop until the root is found or the maximum number of iterations is reached
+    for n in range(max_iter):
+        # Check for convergence
+        if abs(fx) < tol:
+            return x, n
+
+        # Compute the derivative values
+        dfx = df(x)
+        ddfx = ddf(x)
+
+        # Check for zero in the denominator
+        denominator = 2 * dfx ** 2 - fx * ddfx
+        if denominator == 0:
+            raise ValueError("Denominator became zero. Adjust the initial guess or use another method.")
+
+        # Update x using Halley's formula
+        step = (2 * fx * dfx) / denominator
+        x = x - step
+        fx = f(x)
+        yield {"n": n + 1, "x": x, "fx": fx, "step": step}
+
+    # Check for convergence
+    raise ValueError("Exceeded maximum iterations. Adjust the initial guess, tolerance, or try another method.")
+
+
+def halley(f, df, ddf, x0, tol=1e-5, max_iter=100, max_fev=None, deadline=None, cancel_token=None):
+    """Halley's method for finding a root of a function, with cubic convergence near simple roots.
+
+    Parameters:
+    - f (function): Function to find the root of.
+    - df (function): First derivative of the function.
+    - ddf (function): Second derivative of the function.
+    - x0 (float): Initial guess for the root.
+    - tol (float): The tolerance level for stopping the algorithm.
+    - max_iter (int): Maximum number of iterations.
+    - max_fev (int, optional): Maximum number of function evaluations, derivatives included.
+    - deadline (float, optional): The time.monotonic() value after which no further evaluation is started.
+    - cancel_token (CancellationToken, optional): A token that cancels the solve when set.
+
+    Returns:
+    - x (float): The root of the function.
+    - n (int): The number of iterations required to reach the root.
+
+    Raises:
+    - ValueError: If the denominator becomes zero or the maximum number of iterations is exceeded.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors that carry the
+      best iterate so far.
+    """
+    return run_to_completion(halley_iter(f, df, ddf, x0, tol, max_iter, max_fev, deadline, cancel_token))
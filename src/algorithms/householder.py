@@ -0,0 +1,94 @@
+from math import comb
+
+from src.utils.solve_limits import limit_evaluations
+from src.utils.solver_iteration import run_to_completion
+
+
+def householder_iter(f, derivatives, x0, tol=1e-5, max_iter=100, max_fev=None, deadline=None, cancel_token=None):
+    """Generator form of Householder's method, yielding the solver state after every iteration.
+
+    Parameters:
+    - f, derivatives, x0, tol, max_iter, max_fev, deadline, cancel_token: As in householder.
+
+    Yields:
+    - state (dict): The iteration count "n", the new approximation "x", its function value "fx" and the "step" that
+      was added.
+
+    Returns:
+    - (x, n) (tuple): The root and the number of iterations, as the value of the StopIteration.
+
+    Raises:
+    - ValueError: If no derivatives are given, the denominator becomes zero or the maximum number of iterations is
+      exceeded.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors that carry the
+      best iterate so far.
+    """
+
+    # Check that the order of the method is at least one
+    order = len(derivatives)
+    if order == 0:
+        raise ValueError("At least one derivative is required.")
+
+    # Check the evaluation limits before every evaluation
+    f, *derivatives = limit_evaluations([f, *derivatives], max_fev, deadline, cancel_token)
+
+    # Initialize variables
+    x = x0
+    fx = f(x)
+
+    # Loop until the root is found or the maximum number of iterations is reached
+    for n in range(max_iter):
+        # Check for convergence
+        if abs(fx) < tol:
+            return x, n
+
+        # Compute f and its derivatives, f_derivs[k] being the k-th derivative
+        f_derivs = [fx] + [derivative(x) for derivative in derivatives]
+
+        # The derivatives of 1/f, scaled by powers of f so that no division by f is needed:
+        # w[k] = f ** (k + 1) * (1/f)^(k)
+        w = [1]
+        for k in range(1, order + 1):
+            w.append(-sum(comb(k, j) * f_derivs[j] * fx ** (j - 1) * w[k - j] for j in range(1, k + 1)))
+
+        # Check for zero in the denominator
+        if w[order] == 0:
+            raise ValueError("Denominator became zero. Adjust the initial guess or use another method.")
+
+        # Update x using the Householder formula x + d * (1/f)^(d-1) / (1/f)^(d)
+        step = order * fx * w[order - 1] / w[order]
+        x = x + step
+        fx = f(x)
+        yield {"n": n + 1, "x": x, "fx": fx, "step": step}
+
+    # Check for convergence
+    raise ValueError("Exceeded maximum iterations. Adjust the initial guess, tolerance, or try another method.")
+
+
+def householder(f, derivatives, x0, tol=1e-5, max_iter=100, max_fev=None, deadline=None, cancel_token=None):
+    """Householder's method of general order for finding a root of a function.
+
+    With d derivatives the method converges with order d + 1 near simple roots. The first order is Newton's method
+    and the second order is Halley's method.
+
+    Parameters:
+    - f (function): Function to find the root of.
+    - derivatives (list of function): The first d derivatives of the function, in order.
+    - x0 (float): Initial guess for the root.
+    - tol (float): The tolerance level for stopping the algorithm.
+    - max_iter (int): Maximum number of iterations.
+    - max_fev (int, optional): Maximum number of function evaluations, derivatives included.
+    - deadline (float, optional): The time.monotonic() value after which no further evaluation is started.
+    - cancel_token (CancellationToken, optional): A token that cancels the solve when set.
+
+    Returns:
+    - x (float): The root of the function.
+    - n (int): The number of iterations required to reach the root.
+
+    Raises:
+    - ValueError: If no derivatives are given, the denominator becomes zero or the maximum number of iterations is
+      exceeded.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors that carry the
+      best iterate so far.
+    """
+    return run_to_completion(householder_iter(f, derivatives, x0, tol, max_iter, max_fev, deadline, cancel_token))
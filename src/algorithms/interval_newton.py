@@ -0,0 +1,142 @@
+import math
+
+from src.utils.interval_arithmetic import DomainError, Interval, outward
+from src.utils.solve_limits import SolverStopped, limit_evaluations
+
+
+def _newton_operator(m, F_m, dF_x):
+    """The interval Newton operator N(X) = m - F(m) / F'(X), with extended division.
+
+    When F'(X) contains zero the quotient is the union of up to two unbounded intervals.
+
+    Parameters:
+    - m (float): The midpoint of X.
+    - F_m (Interval): An enclosure of f(m).
+    - dF_x (Interval): An enclosure of f' over X.
+
+    Returns:
+    - list of Interval: The pieces of N(X), possibly none.
+    """
+    if 0 not in dF_x:
+        return [m - F_m / dF_x]
+
+    # Nothing can be pruned if f(m) may be zero
+    if 0 in F_m:
+        return [Interval(-math.inf, math.inf)]
+
+    # f is constant on X and nonzero at m, so X contains no root
+    if dF_x.lo == 0 and dF_x.hi == 0:
+        return []
+
+    # Divide by [dF_x.lo, 0] and [0, dF_x.hi] separately; a zero bound leaves that side unbounded
+    f_near = F_m.lo if F_m.lo > 0 else F_m.hi
+    pieces = []
+    if dF_x.lo < 0:
+        q = outward(f_near / dF_x.lo, f_near / dF_x.lo)
+        pieces.append(Interval(m - q.hi, math.inf) if F_m.lo > 0 else Interval(-math.inf, m - q.lo))
+    if dF_x.hi > 0:
+        q = outward(f_near / dF_x.hi, f_near / dF_x.hi)
+        pieces.append(Interval(-math.inf, m - q.lo) if F_m.lo > 0 else Interval(m - q.hi, math.inf))
+    return [outward(piece.lo, piece.hi) for piece in pieces]
+
+
+def _merge(enclosures):
+    """Sort enclosures and merge touching ones that are not proven to hold a unique root."""
+    merged = []
+    for lo, hi, unique in sorted(enclosures):
+        if merged and not unique and not merged[-1][2] and lo <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(hi, merged[-1][1]), False)
+        else:
+            merged.append((lo, hi, unique))
+    return merged
+
+
+def interval_newton(F, dF, lo, hi, tol=1e-5, max_iter=10000, max_fev=None, deadline=None, cancel_token=None):
+    """Interval Newton branch-and-prune method for enclosing all roots of a function in an interval.
+
+    Subintervals on which F provably has no zero are discarded, the others are contracted with the interval Newton
+    operator and split in half when it makes too little progress. Unlike the bracketed methods, no sign change is
+    required, so intervals with an even number of roots and close pairs of roots are handled as well.
+
+    Parameters:
+    - F (function): Interval extension of the function to find the roots of.
+    - dF (function): Interval extension of the derivative of the function.
+    - lo, hi (float): The interval [lo, hi] within which to search for roots.
+    - tol (float): The width below which an enclosure is no longer refined.
+    - max_iter (int): Maximum number of subintervals to process.
+    - max_fev (int, optional): Maximum number of interval evaluations of F and dF together.
+    - deadline (float, optional): The time.monotonic() value after which no further evaluation is started.
+    - cancel_token (CancellationToken, optional): A token that cancels the solve when set.
+
+    Returns:
+    - enclosures (list of tuple): Sorted (lo, hi, unique) triples. Every root in [lo, hi] lies in one of them, and
+      unique is True when the enclosure provably contains exactly one root. An enclosure with unique False may hold
+      a multiple root, several roots, or, when f only comes close to zero or its enclosures are unbounded or could not
+      be computed, none.
+    - n (int): The number of subintervals processed.
+
+    Raises:
+    - ValueError: If the maximum number of iterations is exceeded.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors, with no best
+      iterate since the method works with enclosures.
+    """
+
+    # Check the evaluation limits before every evaluation
+    F, dF = limit_evaluations([F, dF], max_fev, deadline, cancel_token, track_best=False)
+
+    # Each entry is an interval and whether it is proven to contain exactly one root
+    stack = [(Interval(lo, hi), False)]
+    enclosures = []
+    n = 0
+
+    while stack:
+        if n == max_iter:
+            raise ValueError("Exceeded maximum iterations. Adjust the interval, tolerance, or the maximum iterations.")
+        n += 1
+        x, unique = stack.pop()
+
+        # Discard the interval if f provably has no zero on it, or is undefined on all of it. Enclosures that could not
+        # be computed decide nothing, so the interval is reported as possibly holding roots.
+        try:
+            if 0 not in F(x):
+                continue
+            dF_x = dF(x)
+            m = x.midpoint
+            F_m = F(Interval(m))
+        except DomainError:
+            continue
+        except SolverStopped:
+            raise
+        except (ValueError, ArithmeticError):
+            enclosures.append((x.lo, x.hi, False))
+            continue
+
+        # Contract the interval with the Newton operator
+        pieces = [piece.intersect(x) for piece in _newton_operator(m, F_m, dF_x)]
+        pieces = [piece for piece in pieces if piece is not None]
+
+        # A Newton image strictly inside x with a nonzero derivative proves there is exactly one root
+        if len(pieces) == 1 and 0 not in dF_x and x.lo < pieces[0].lo and pieces[0].hi < x.hi:
+            unique = True
+
+        for piece in pieces:
+            if piece.width <= tol:
+                enclosures.append((piece.lo, piece.hi, unique))
+            elif unique:
+                # Once the root is proven unique, Newton contracts quickly; stop if it no longer contracts
+                if piece.width < x.width:
+                    stack.append((piece, True))
+                else:
+                    enclosures.append((piece.lo, piece.hi, True))
+            elif piece.width > x.width / 2:
+                # Split when the contraction made too little progress, unless floating point cannot split further
+                mid = piece.midpoint
+                if not piece.lo < mid < piece.hi:
+                    enclosures.append((piece.lo, piece.hi, False))
+                    continue
+                stack.append((Interval(mid, piece.hi), False))
+                stack.append((Interval(piece.lo, mid), False))
+            else:
+                stack.append((piece, False))
+
+    return _merge(enclosures), n
@@ -0,0 +1,167 @@
+import functools
+
+import numpy as np
+
+from src.utils.function_evaluation import as_vectorized
+from src.utils.parsed_expression import get_parsed_expression
+from src.utils.solve_limits import limit_evaluations
+
+# Number of samples of f in a lookup table
+TABLE_SIZE = 4097
+
+
+class InverseTable:
+    """Solve f(x) = y for many targets y against the same monotone function f on [a, b].
+
+    f is sampled once into a sorted table. Each target is bracketed by the two samples around it with searchsorted,
+    started from the linear interpolation between them, and polished with Newton steps, all the targets at once.
+    A step that leaves the bracket is replaced by a bisection step, and the bracket shrinks with every evaluation, so
+    every target converges. Use get_inverse_table to share the table of a function between calls.
+
+    Attributes:
+    - f (function): The vectorized function.
+    - df (function, optional): Its vectorized derivative. Without it, the slope of the table on the bracket is used.
+    - x, y (ndarray): The table: the sample points and the values of f there.
+    - sign (int): 1 if f is increasing, -1 if it is decreasing.
+    """
+
+    def __init__(self, f, a, b, df=None, size=TABLE_SIZE):
+        """Sample f into the table.
+
+        Parameters:
+        - f (function): The monotone function to invert. Scalar-only functions are evaluated element by element.
+        - a, b (float): The interval [a, b] on which f is inverted.
+        - df (function, optional): The derivative of the function, for the Newton steps.
+        - size (int): The number of samples in the table.
+
+        Raises:
+        - ValueError: If a >= b, if f is not finite at a sample, or if f is not monotone on the samples.
+        """
+        if not a < b:
+            raise ValueError("The interval must satisfy a < b.")
+        if size < 2:
+            raise ValueError("The table needs at least two samples.")
+
+        self.f = as_vectorized(f)
+        self.df = None if df is None else as_vectorized(df)
+        self.x = np.linspace(a, b, size)
+        with np.errstate(all="ignore"):
+            self.y = np.asarray(self.f(self.x), dtype=float)
+        if not np.all(np.isfinite(self.y)):
+            raise ValueError("The function is not finite on the whole interval.")
+
+        # Flat stretches are allowed, so that functions which saturate, like CDFs, can be inverted
+        steps = np.diff(self.y)
+        self.sign = 1 if self.y[-1] >= self.y[0] else -1
+        if self.y[-1] == self.y[0] or np.any(self.sign * steps < 0):
+            raise ValueError("The function is not monotone on the interval.")
+
+    def __call__(self, y, tol=1e-12, max_iter=50, max_fev=None, deadline=None, cancel_token=None):
+        """Find x with f(x) = y for every target.
+
+        Parameters:
+        - y (float or array_like): The targets.
+        - tol (float): The tolerance level for stopping, applied to the step and to the width of the bracket.
+        - max_iter (int): Maximum number of polishing steps. Targets that have not converged by then get their best
+          estimate.
+        - max_fev (int, optional): Maximum number of pointwise evaluations of f and df together.
+        - deadline (float, optional): The time.monotonic() value after which no further evaluation is started.
+        - cancel_token (CancellationToken, optional): A token that cancels the solve when set.
+
+        Returns:
+        - x (float or ndarray): The solutions, with the shape of y. Targets outside the range of f on [a, b] get NaN.
+
+        Raises:
+        - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve.
+        """
+        targets = np.asarray(y, dtype=float)
+        funcs = [self.f] if self.df is None else [self.f, self.df]
+        f, *derivative = limit_evaluations(funcs, max_fev, deadline, cancel_token, track_best=False,
+                                           count_elements=True)
+
+        # Work with an increasing table, flipping the values of a decreasing function
+        table = self.sign * self.y
+        goal = self.sign * targets.ravel()
+        x = np.full(goal.size, np.nan)
+        in_range = (goal >= table[0]) & (goal <= table[-1])
+
+        # The bracket of every target, and the linear interpolation within it as the starting point
+        i = np.clip(np.searchsorted(table, goal[in_range]) - 1, 0, len(table) - 2)
+        lo, hi = self.x[i], self.x[i + 1]
+        rise = table[i + 1] - table[i]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            chord = rise / (hi - lo)
+            start = np.where(rise > 0, lo + (goal[in_range] - table[i]) / chord, (lo + hi) / 2)
+        x[in_range] = start
+
+        # Lanes index the targets in range, and only the ones that have not converged are evaluated
+        active, goal = np.flatnonzero(in_range), goal[in_range]
+        lanes = np.arange(active.size)
+        with np.errstate(all="ignore"):
+            for _ in range(max_iter):
+                if lanes.size == 0:
+                    break
+                xa = x[active[lanes]]
+                residual = self.sign * np.asarray(f(xa), dtype=float) - goal[lanes]
+
+                # The root lies on the side of the current point where the residual changes sign
+                lo[lanes] = np.where(residual < 0, xa, lo[lanes])
+                hi[lanes] = np.where(residual > 0, xa, hi[lanes])
+
+                slope = self.sign * np.asarray(derivative[0](xa), dtype=float) if derivative else chord[lanes]
+                x_next = xa - residual / slope
+                outside = ~((x_next > lo[lanes]) & (x_next < hi[lanes]))
+                x_next = np.where(outside, (lo[lanes] + hi[lanes]) / 2, x_next)
+
+                done = (residual == 0) | (np.abs(x_next - xa) <= tol) | (hi[lanes] - lo[lanes] <= tol)
+                x[active[lanes]] = np.where(residual == 0, xa, x_next)
+                lanes = lanes[~done]
+
+        return x.reshape(targets.shape).item() if targets.ndim == 0 else x.reshape(targets.shape)
+
+
+@functools.lru_cache(maxsize=32)
+def get_inverse_table(f, a, b, df=None, size=TABLE_SIZE):
+    """Returns the shared InverseTable of a function on an interval, sampling it on first use.
+
+    Parameters:
+    - f (str or function): A string representing a mathematical expression, or a callable.
+    - a, b (float): The interval [a, b] on which f is inverted.
+    - df (function, optional): The derivative of a callable. The derivative of an expression is found symbolically.
+    - size (int): The number of samples in the table.
+
+    Returns:
+    - InverseTable: The table.
+    """
+    if isinstance(f, str):
+        parsed = get_parsed_expression(f)
+        return InverseTable(parsed.vectorized_function, a, b, parsed.derivative().vectorized_function, size)
+    return InverseTable(f, a, b, df, size)
+
+
+def inverse(f, y, a, b, tol=1e-12, max_iter=50, df=None, max_fev=None, deadline=None, cancel_token=None):
+    """Solve f(x) = y on [a, b] for one or many targets y, for a monotone f.
+
+    The lookup table of f on [a, b] is built on the first call and reused by later calls with the same function and
+    interval, so solving many batches of targets against the same f costs one table.
+
+    Parameters:
+    - f (str or function): The monotone function, as an expression or a callable.
+    - y (float or array_like): The targets.
+    - a, b (float): The interval [a, b] within which to search for the solutions.
+    - tol (float): The tolerance level for stopping, applied to the step and to the width of the bracket.
+    - max_iter (int): Maximum number of polishing steps.
+    - df (function, optional): The derivative of a callable f.
+    - max_fev (int, optional): Maximum number of pointwise evaluations of f and df together, beyond the table.
+    - deadline (float, optional): The time.monotonic() value after which no further evaluation is started.
+    - cancel_token (CancellationToken, optional): A token that cancels the solve when set.
+
+    Returns:
+    - x (float or ndarray): The solutions, with the shape of y. Targets outside the range of f on [a, b] get NaN.
+
+    Raises:
+    - ValueError: If a >= b, or if f is not finite or not monotone on [a, b].
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve.
+    """
+    table = get_inverse_table(f, a, b, df)
+    return table(y, tol, max_iter, max_fev, deadline, cancel_token)
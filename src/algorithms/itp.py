@@ -0,0 +1,120 @@
+import math
+
+from src.utils.solve_limits import limit_evaluations
+from src.utils.solver_iteration import run_to_completion
+
+# Default truncation parameters: the step towards the interpolation point is k1 * (b - a) ** K2, with k1 = K1 / (b - a)
+K1 = 0.2
+K2 = 2.0
+
+
+def itp_iter(f, a, b, tol=1e-5, max_iter=100, n0=0, k1=None, k2=K2, max_fev=None, deadline=None, cancel_token=None):
+    """Generator form of the ITP method, yielding the solver state after every iteration.
+
+    Parameters:
+    - f, a, b, tol, max_iter, n0, k1, k2, max_fev, deadline, cancel_token: As in itp.
+
+    Yields:
+    - state (dict): The iteration count "n", the new approximation "x", its function value "fx" and the updated
+      bracket "a", "b".
+
+    Returns:
+    - (x, n) (tuple): The root and the number of iterations, as the value of the StopIteration.
+
+    Raises:
+    - ValueError: If the function does not change sign within the interval [a, b] or the maximum number of
+      iterations is exceeded.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors that carry the
+      best iterate so far.
+    """
+
+    # Check the evaluation limits before every evaluation
+    [f] = limit_evaluations([f], max_fev, deadline, cancel_token)
+
+    # Check if the function changes sign within the interval [a, b]
+    f_a = f(a)
+    f_b = f(b)
+    if f_a * f_b > 0:
+        raise ValueError("The function does not change sign within the interval [a, b].")
+    if f_a == 0:
+        return a, 0
+    if f_b == 0:
+        return b, 0
+
+    # The number of iterations bisection needs to shrink the bracket to tol, plus the slack n0
+    k1 = K1 / (b - a) if k1 is None else k1
+    n_max = max(0, math.ceil(math.log2((b - a) / tol))) + n0
+
+    # Initialize variables
+    n = 0
+
+    # Loop until the root is found or the maximum number of iterations is reached. After n_max iterations the bracket
+    # is within tol, up to rounding.
+    while abs(b - a) > tol and n < min(max_iter, n_max):
+        x_half = (a + b) / 2
+
+        # Interpolate: the false position point
+        x_f = (f_b * a - f_a * b) / (f_b - f_a)
+
+        # Truncate: move from it towards the midpoint by at least k1 * (b - a) ** k2
+        sigma = math.copysign(1, x_half - x_f)
+        delta = k1 * (b - a) ** k2
+        x_t = x_f + sigma * delta if delta <= abs(x_half - x_f) else x_half
+
+        # Project: stay within the distance of the midpoint that still lets bisection finish in n_max iterations
+        radius = max(0.0, tol / 2 * 2 ** (n_max - n) - (b - a) / 2)
+        x = x_t if abs(x_t - x_half) <= radius else x_half - sigma * radius
+        f_x = f(x)
+
+        # Check if the root is in the interval [a, x] or [x, b]
+        if f_a * f_x < 0:
+            b, f_b = x, f_x
+        else:
+            a, f_a = x, f_x
+
+        # Update iteration count
+        n += 1
+        yield {"n": n, "x": x, "fx": f_x, "a": a, "b": b}
+
+        # Check if the function value at the root approximation is sufficiently close to zero
+        if abs(f_x) <= tol:
+            return x, n
+
+    # Check for convergence
+    if n == max_iter < n_max:
+        raise ValueError("Exceeded maximum iterations. Adjust the initial interval, tolerance, or try another method.")
+
+    return (a + b) / 2, n
+
+
+def itp(f, a, b, tol=1e-5, max_iter=100, n0=0, k1=None, k2=K2, max_fev=None, deadline=None, cancel_token=None):
+    """ITP (Interpolate, Truncate, Project) method for finding a root of a function.
+
+    Every iteration starts from the false position point, moves it towards the midpoint by a small amount so that
+    the bracket keeps shrinking on both sides, and projects it into the interval around the midpoint that still lets
+    the bracket reach tol within bisection's number of iterations plus n0. On smooth functions it converges
+    superlinearly like the interpolating methods, and it never needs more than n0 iterations more than bisection.
+
+    Parameters:
+    - f (function): Function to find the root of.
+    - a, b (float): The interval [a, b] within which to search for the root.
+    - tol (float): The tolerance level for stopping the algorithm.
+    - max_iter (int): Maximum number of iterations.
+    - n0 (int): The number of iterations allowed beyond bisection's. With 0, ITP never needs more than bisection.
+    - k1 (float, optional): The truncation factor. Defaults to K1 / (b - a).
+    - k2 (float): The truncation exponent, between 1 and 1 + (1 + sqrt(5)) / 2.
+    - max_fev (int, optional): Maximum number of function evaluations, derivatives included.
+    - deadline (float, optional): The time.monotonic() value after which no further evaluation is started.
+    - cancel_token (CancellationToken, optional): A token that cancels the solve when set.
+
+    Returns:
+    - x (float): The root of the function.
+    - n (int): The number of iterations required to reach the root.
+
+    Raises:
+    - ValueError: If the function does not change sign within the interval [a, b] or the maximum number of
+      iterations is exceeded.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors that carry the
+      best iterate so far.
+    """
+    return run_to_completion(itp_iter(f, a, b, tol, max_iter, n0, k1, k2, max_fev, deadline, cancel_token))
@@ -0,0 +1,140 @@
+import numpy as np
+
+from src.utils.clustering import cluster_roots
+from src.utils.function_evaluation import as_vectorized, is_vectorized
+from src.utils.newton_lanes import newton_lanes
+from src.utils.solve_limits import limit_evaluations
+
+
+def _secant_lanes(f, x0, x1, tol, max_iter):
+    """Run the secant method on every pair of starting points at once.
+
+    A lane converges once its step is within tol, like the scalar secant method. Lanes whose update or function
+    value leaves the finite numbers, for example because the secant is flat, are removed from the working set.
+
+    Parameters:
+    - f (function): Vectorized function to find the roots of.
+    - x0, x1 (ndarray): One-dimensional arrays of the two starting points of every lane.
+    - tol (float): The tolerance level for stopping the algorithm.
+    - max_iter (int): Maximum number of iterations.
+
+    Returns:
+    - x (ndarray): The final approximation of every lane.
+    - iterations (ndarray): The number of iterations each lane took.
+    - converged (ndarray): Boolean mask of the lanes that reached a root.
+    """
+    # Work on copies, since the lanes are updated in place
+    x0, x1 = x0.copy(), x1.copy()
+    f0, f1 = np.array(f(x0)), np.array(f(x1))
+    iterations = np.full(x1.size, max_iter, dtype=np.int32)
+    converged = np.zeros(x1.size, dtype=bool)
+    active = np.arange(x1.size)
+
+    for n in range(1, max_iter + 1):
+        xa0, xa1, fa0, fa1 = x0[active], x1[active], f0[active], f1[active]
+        x_new = xa1 - fa1 * (xa1 - xa0) / (fa1 - fa0)
+        f_new = f(x_new)
+        x0[active], f0[active], x1[active], f1[active] = xa1, fa1, x_new, f_new
+
+        # Retire the lanes whose step is within the tolerance, and the ones that left the finite numbers
+        finite = np.isfinite(x_new) & np.isfinite(f_new)
+        done = finite & (np.abs(x_new - xa1) <= tol)
+        converged[active[done]] = True
+        iterations[active[done]] = n
+
+        active = active[finite & ~done]
+        if active.size == 0:
+            break
+
+    return x1, iterations, converged
+
+
+def _summarize(x, converged, root_tol):
+    """Cluster the converged lanes into distinct roots, sorted, and count the starts that reached each one."""
+    centers, labels = cluster_roots(x[converged], root_tol)
+    order = np.argsort(centers)
+    rank = np.empty(len(centers), dtype=np.int64)
+    rank[order] = np.arange(len(centers))
+
+    root_index = np.full(x.size, -1, dtype=np.int64)
+    root_index[converged] = np.where(labels >= 0, rank[labels], -1)
+    counts = np.bincount(root_index[root_index >= 0], minlength=len(centers))
+    return centers[order], counts, root_index
+
+
+def _limited_vectorized(funcs, limits):
+    """Vectorize the functions and check the (max_fev, deadline, cancel_token) limits, counting every point evaluated.
+
+    Whether each function accepts arrays is checked before the limits are applied, so the check is not counted.
+    """
+    vectorized = [is_vectorized(func) for func in funcs]
+    limited = limit_evaluations(funcs, *limits, track_best=False, count_elements=True)
+    return [as_vectorized(func, flag) for func, flag in zip(limited, vectorized)]
+
+
+def multi_start_newton(f, df, starts, tol=1e-8, max_iter=50, root_tol=1e-6, max_fev=None, deadline=None,
+                       cancel_token=None):
+    """Newton's method from many starting points at once, to find many roots of a function in one run.
+
+    All the starting points are iterated together with NumPy. Lanes that converge, hit a zero derivative or diverge
+    are masked out as they go, and the converged ones are clustered into distinct roots.
+
+    Parameters:
+    - f (function): Function to find the roots of. Scalar-only functions are evaluated element by element.
+    - df (function): Derivative of the function.
+    - starts (array_like): The starting points, real or complex.
+    - tol (float): The tolerance level for stopping the algorithm, applied to |f(x)|.
+    - max_iter (int): Maximum number of iterations.
+    - root_tol (float): The distance within which two converged points are considered the same root.
+    - max_fev (int, optional): Maximum number of pointwise evaluations of f and df together.
+    - deadline (float, optional): The time.monotonic() value after which no further evaluation is started.
+    - cancel_token (CancellationToken, optional): A token that cancels the computation when set.
+
+    Returns:
+    - roots (ndarray): The distinct roots found, sorted.
+    - counts (ndarray): The number of starting points that converged to each root.
+    - root_index (ndarray): For each starting point, the index of its root in roots, or -1 if it did not converge.
+
+    Raises:
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the computation.
+    """
+    starts = np.asarray(starts)
+    f, df = _limited_vectorized([f, df], (max_fev, deadline, cancel_token))
+    with np.errstate(all="ignore"):
+        x, _, converged = newton_lanes(f, df, starts.ravel(), tol, max_iter)
+    roots, counts, root_index = _summarize(x, converged, root_tol)
+    return roots, counts, root_index.reshape(starts.shape)
+
+
+def multi_start_secant(f, starts, tol=1e-8, max_iter=50, root_tol=1e-6, step=1e-3, max_fev=None, deadline=None,
+                       cancel_token=None):
+    """The secant method from many starting points at once, to find many roots of a function in one run.
+
+    The second point of every lane is taken a small step from its starting point. All the lanes are iterated
+    together with NumPy, diverged lanes are masked out, and the converged ones are clustered into distinct roots.
+
+    Parameters:
+    - f (function): Function to find the roots of. Scalar-only functions are evaluated element by element.
+    - starts (array_like): The starting points, real or complex.
+    - tol (float): The tolerance level for stopping the algorithm, applied to the step.
+    - max_iter (int): Maximum number of iterations.
+    - root_tol (float): The distance within which two converged points are considered the same root.
+    - step (float): The relative distance of the second point from each starting point.
+    - max_fev, deadline, cancel_token: As in multi_start_newton.
+
+    Returns:
+    - roots (ndarray): The distinct roots found, sorted.
+    - counts (ndarray): The number of starting points that converged to each root.
+    - root_index (ndarray): For each starting point, the index of its root in roots, or -1 if it did not converge.
+
+    Raises:
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the computation.
+    """
+    starts = np.asarray(starts)
+    x0 = starts.ravel().astype(np.result_type(starts.dtype, float))
+    x1 = x0 + step * np.maximum(1.0, np.abs(x0))
+    f = _limited_vectorized([f], (max_fev, deadline, cancel_token))[0]
+    with np.errstate(all="ignore"):
+        x, _, converged = _secant_lanes(f, x0, x1, tol, max_iter)
+    roots, counts, root_index = _summarize(x, converged, root_tol)
+    return roots, counts, root_index.reshape(starts.shape)
@@ -1,43 +1,81 @@
-def newton(f, df, x0, tol=1e-5, max_iter=100):
-    """Newton method for finding a root of a function.
+from src.utils.solve_limits import limit_evaluations
+from src.utils.solver_iteration import run_to_completion
+
+
+def newton_iter(f, df, x0, tol=1e-5, max_iter=100, max_fev=None, deadline=None, cancel_token=None):
+    """Generator form of the Newton method, yielding the solver state after every iteration.
 
     Parameters:
-    - f (function): Function to find the root of.
-    - df (function): Derivative of the function.
-    - x0 (float): Initial guess for the root.
-    - tol (float): The tolerance level for stopping the algorithm.
-    - max_iter (int): Maximum number of iterations.
+    - f, df, x0, tol, max_iter, max_fev, deadline, cancel_token: As in newton.
+
+    Yields:
+    - state (dict): The iteration count "n", the new approximation "x", its function value "fx" and the Newton
+      "step" that was subtracted.
 
     Returns:
-    - x (float): The root of the function.
-    - n (int): The number of iterations required to reach the root.
+    - (x, n) (tuple): The root and the number of iterations, as the value of the StopIteration.
 
     Raises:
     - ValueError: If the derivative is zero at the initial guess or the maximum number of iterations is exceeded.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors that carry the
+      best iterate so far.
     """
 
+    # Check the evaluation limits before every evaluation
+    f, df = limit_evaluations([f, df], max_fev, deadline, cancel_token)
+
     # Check if the derivative is zero at the initial guess
     if df(x0) == 0:
         raise ValueError("Derivative is zero at the initial guess.")
 
     # Initialize variables
     x = x0
+    f_x = f(x)
     n = 0
 
     # Loop until the root is found or the maximum number of iterations is reached
-    while abs(f(x)) > tol and n < max_iter:
+    while abs(f_x) > tol and n < max_iter:
         # Check for zero in the denominator
-        if df(x) == 0:
+        df_x = df(x)
+        if df_x == 0:
             raise ValueError("Derivative is zero. Cannot continue iteration.")
 
         # Update x using the Newton formula
-        x = x - f(x) / df(x)
+        step = f_x / df_x
+        x = x - step
+        f_x = f(x)
 
         # Update iteration count
         n += 1
+        yield {"n": n, "x": x, "fx": f_x, "step": step}
 
     # Check for convergence
     if n == max_iter:
         raise ValueError("Exceeded maximum iterations. Adjust the initial guess, tolerance, or try another method.")
 
     return x, n
+
+
+def newton(f, df, x0, tol=1e-5, max_iter=100, max_fev=None, deadline=None, cancel_token=None):
+    """Newton method for finding a root of a function.
+
+    Parameters:
+    - f (function): Function to find the root of.
+    - df (function): Derivative of the function.
+    - x0 (float): Initial guess for the root.
+    - tol (float): The tolerance level for stopping the algorithm.
+    - max_iter (int): Maximum number of iterations.
+    - max_fev (int, optional): Maximum number of function evaluations, derivatives included.
+    - deadline (float, optional): The time.monotonic() value after which no further evaluation is started.
+    - cancel_token (CancellationToken, optional): A token that cancels the solve when set.
+
+    Returns:
+    - x (float): The root of the function.
+    - n (int): The number of iterations required to reach the root.
+
+    Raises:
+    - ValueError: If the derivative is zero at the initial guess or the maximum number of iterations is exceeded.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors that carry the
+      best iterate so far.
+    """
+    return run_to_completion(newton_iter(f, df, x0, tol, max_iter, max_fev, deadline, cancel_token))
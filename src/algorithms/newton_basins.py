@@ -0,0 +1,132 @@
+import numpy as np
+
+from src.utils.clustering import cluster_roots
+from src.utils.newton_lanes import newton_lanes
+from src.utils.solve_limits import limit_evaluations
+
+
+def _basins(f, df, size, get_chunk, roots, tol, max_iter, root_tol, chunk_size, out, limits):
+    """Compute the basins of attraction of a sequence of starting points, chunk by chunk.
+
+    Parameters:
+    - f, df (function): Vectorized function and derivative.
+    - size (int): The total number of starting points.
+    - get_chunk (function): Maps a (start, stop) range of flat indices to the starting points in it.
+    - roots, tol, max_iter, root_tol, chunk_size: As in newton_basins.
+    - out (tuple of ndarray): Flat arrays to write the root indices and iteration counts into, or None.
+    - limits (tuple): The (max_fev, deadline, cancel_token) evaluation limits.
+
+    Returns:
+    - root_index (ndarray): Flat array of root indices, -1 where Newton's method did not converge.
+    - iterations (ndarray): Flat array of iteration counts.
+    - roots (ndarray): The distinct roots that the indices refer to.
+    """
+    # Check the evaluation limits before every evaluation, counting each starting point evaluated
+    f, df = limit_evaluations([f, df], *limits, track_best=False, count_elements=True)
+
+    if out is None:
+        root_index = np.empty(size, dtype=np.int32)
+        iterations = np.empty(size, dtype=np.int32)
+    else:
+        root_index, iterations = out
+    roots = np.empty(0, dtype=complex) if roots is None else np.asarray(roots, dtype=complex)
+
+    for start in range(0, size, chunk_size):
+        stop = min(start + chunk_size, size)
+        z, chunk_iterations, converged = newton_lanes(f, df, get_chunk(start, stop), tol, max_iter)
+        iterations[start:stop] = chunk_iterations
+
+        # Label the converged lanes with the root they reached, discovering new roots as needed
+        roots, labels = cluster_roots(z[converged], root_tol, roots)
+        chunk_index = np.full(stop - start, -1, dtype=np.int32)
+        chunk_index[converged] = labels
+        root_index[start:stop] = chunk_index
+
+    # Push memory-mapped output to disk
+    for array in (root_index, iterations):
+        if isinstance(array, np.memmap):
+            array.flush()
+
+    return root_index, iterations, roots
+
+
+def newton_basins(f, df, starts, roots=None, tol=1e-8, max_iter=50, root_tol=1e-6, chunk_size=2 ** 18, out=None,
+                  max_fev=None, deadline=None, cancel_token=None):
+    """Vectorized complex Newton method over an array of starting points.
+
+    Parameters:
+    - f (function): Vectorized function to find the roots of, accepting complex arrays.
+    - df (function): Vectorized derivative of the function.
+    - starts (array_like): Complex starting points, of any shape.
+    - roots (array_like, optional): Known roots. Roots that are not given are discovered from the converged points.
+    - tol (float): The tolerance level for stopping the algorithm.
+    - max_iter (int): Maximum number of iterations.
+    - root_tol (float): The distance within which two converged points are considered the same root.
+    - chunk_size (int): The number of starting points processed at once, which bounds the working memory.
+    - out (tuple of ndarray, optional): Preallocated integer arrays of the shape of starts, such as np.memmap, that
+      receive the root indices and iteration counts chunk by chunk.
+    - max_fev (int, optional): Maximum number of pointwise evaluations of f and df together.
+    - deadline (float, optional): The time.monotonic() value after which no further evaluation is started.
+    - cancel_token (CancellationToken, optional): A token that cancels the computation when set.
+
+    Returns:
+    - root_index (ndarray): For each starting point, the index of the root it converged to, or -1.
+    - iterations (ndarray): For each starting point, the number of iterations taken.
+    - roots (ndarray): The distinct roots that the indices refer to.
+
+    Raises:
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the computation. Chunks that were completed are
+      already written to out.
+    """
+    starts = np.asarray(starts)
+    flat_starts = starts.ravel()
+
+    flat_out = None if out is None else tuple(array.reshape(-1) for array in out)
+
+    # Every chunk is iterated in the complex plane, even for real starting points
+    def get_chunk(start, stop):
+        return flat_starts[start:stop].astype(complex)
+
+    root_index, iterations, roots = _basins(f, df, flat_starts.size, get_chunk, roots, tol, max_iter, root_tol,
+                                            chunk_size, flat_out, (max_fev, deadline, cancel_token))
+
+    return root_index.reshape(starts.shape), iterations.reshape(starts.shape), roots
+
+
+def newton_basins_grid(f, df, re_range, im_range, resolution, roots=None, tol=1e-8, max_iter=50, root_tol=1e-6,
+                       chunk_size=2 ** 18, out=None, max_fev=None, deadline=None, cancel_token=None):
+    """Basins of attraction of Newton's method over a rectangular grid of the complex plane.
+
+    The grid points are generated chunk by chunk, so not even the starting points are held in memory all at once.
+
+    Parameters:
+    - f (function): Vectorized function to find the roots of, accepting complex arrays.
+    - df (function): Vectorized derivative of the function.
+    - re_range, im_range (tuple of float): The (min, max) limits of the real and imaginary axes.
+    - resolution (tuple of int): The (width, height) of the grid in points.
+    - roots, tol, max_iter, root_tol, chunk_size, max_fev, deadline, cancel_token: As in newton_basins.
+    - out (tuple of ndarray, optional): Preallocated integer arrays of shape (height, width), as in newton_basins.
+
+    Returns:
+    - root_index (ndarray): Array of shape (height, width) with the root index of each point, or -1. Row 0 is the
+      bottom of the grid (im_range[0]).
+    - iterations (ndarray): Array of shape (height, width) with the number of iterations taken.
+    - roots (ndarray): The distinct roots that the indices refer to.
+
+    Raises:
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the computation.
+    """
+    width, height = resolution
+    re_vals = np.linspace(re_range[0], re_range[1], width)
+    im_vals = np.linspace(im_range[0], im_range[1], height)
+
+    def get_chunk(start, stop):
+        row, col = np.divmod(np.arange(start, stop), width)
+        return re_vals[col] + 1j * im_vals[row]
+
+    flat_out = None if out is None else tuple(array.reshape(-1) for array in out)
+
+    root_index, iterations, roots = _basins(f, df, width * height, get_chunk, roots, tol, max_iter, root_tol,
+                                            chunk_size, flat_out, (max_fev, deadline, cancel_token))
+
+    return root_index.reshape(height, width), iterations.reshape(height, width), roots
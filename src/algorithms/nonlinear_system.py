@@ -0,0 +1,188 @@
+import numpy as np
+
+from src.utils.solve_limits import limit_evaluations
+from src.utils.solver_iteration import run_to_completion
+
+
+def _damped_step(F, x, fx, dx, min_step=1e-10):
+    """Backtrack along the direction dx until the residual norm decreases.
+
+    Parameters:
+    - F (function): The vector function of the system.
+    - x (ndarray): The current approximation.
+    - fx (ndarray): The value of F at x.
+    - dx (ndarray): The full step direction.
+    - min_step (float): The smallest fraction of the step to try before accepting it anyway.
+
+    Returns:
+    - x_new (ndarray): The accepted approximation.
+    - fx_new (ndarray): The value of F at x_new.
+    """
+    norm_fx = np.linalg.norm(fx)
+    t = 1.0
+    while True:
+        x_new = x + t * dx
+        fx_new = F(x_new)
+        # Accept the step once it gives a sufficient decrease of the residual
+        if np.linalg.norm(fx_new) <= (1 - 1e-4 * t) * norm_fx or t <= min_step:
+            return x_new, fx_new
+        t /= 2
+
+
+def newton_system_iter(F, J, x0, tol=1e-5, max_iter=100, max_fev=None, deadline=None, cancel_token=None):
+    """Generator form of the damped Newton method for systems, yielding the solver state after every iteration.
+
+    Parameters:
+    - F, J, x0, tol, max_iter, max_fev, deadline, cancel_token: As in newton_system.
+
+    Yields:
+    - state (dict): The iteration count "n", the new approximation "x", the value "fx" of F at it and the damped
+      "step" that was taken.
+
+    Returns:
+    - (x, n) (tuple): The root and the number of iterations, as the value of the StopIteration.
+
+    Raises:
+    - ValueError: If the Jacobian becomes singular or the maximum number of iterations is exceeded.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors that carry the
+      best iterate so far.
+    """
+
+    # Check the evaluation limits before every evaluation
+    F, J = limit_evaluations([F, J], max_fev, deadline, cancel_token)
+
+    # Initialize variables
+    x = np.array(x0, dtype=float)
+    fx = F(x)
+
+    # Loop until the root is found or the maximum number of iterations is reached
+    for n in range(max_iter):
+        # Check for convergence
+        if np.max(np.abs(fx)) <= tol:
+            return x, n
+
+        # Solve the linear system J(x) dx = -F(x) for the Newton step
+        try:
+            dx = np.linalg.solve(J(x), -fx)
+        except np.linalg.LinAlgError:
+            raise ValueError("Jacobian is singular. Adjust the initial guess or use another method.")
+
+        # Update x with a damped Newton step
+        x_new, fx = _damped_step(F, x, fx, dx)
+        step = x_new - x
+        x = x_new
+        yield {"n": n + 1, "x": x, "fx": fx, "step": step}
+
+    # Check for convergence
+    raise ValueError("Exceeded maximum iterations. Adjust the initial guess, tolerance, or try another method.")
+
+
+def newton_system(F, J, x0, tol=1e-5, max_iter=100, max_fev=None, deadline=None, cancel_token=None):
+    """Damped Newton method for finding a root of a system of nonlinear equations.
+
+    Parameters:
+    - F (function): Vector function of the system to find the root of.
+    - J (function): Jacobian matrix of the system.
+    - x0 (array_like): Initial guess for the root.
+    - tol (float): The tolerance level for stopping the algorithm, applied to the largest component of F.
+    - max_iter (int): Maximum number of iterations.
+    - max_fev (int, optional): Maximum number of evaluations of F and J together.
+    - deadline (float, optional): The time.monotonic() value after which no further evaluation is started.
+    - cancel_token (CancellationToken, optional): A token that cancels the solve when set.
+
+    Returns:
+    - x (ndarray): The root of the system.
+    - n (int): The number of iterations required to reach the root.
+
+    Raises:
+    - ValueError: If the Jacobian becomes singular or the maximum number of iterations is exceeded.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors that carry the
+      best iterate so far.
+    """
+    return run_to_completion(newton_system_iter(F, J, x0, tol, max_iter, max_fev, deadline, cancel_token))
+
+
+def broyden_system_iter(F, J, x0, tol=1e-5, max_iter=100, max_fev=None, deadline=None, cancel_token=None):
+    """Generator form of the Broyden method for systems, yielding the solver state after every iteration.
+
+    Parameters:
+    - F, J, x0, tol, max_iter, max_fev, deadline, cancel_token: As in broyden_system.
+
+    Yields:
+    - state (dict): The iteration count "n", the new approximation "x", the value "fx" of F at it and the damped
+      "step" that was taken.
+
+    Returns:
+    - (x, n) (tuple): The root and the number of iterations, as the value of the StopIteration.
+
+    Raises:
+    - ValueError: If the Jacobian approximation becomes singular or the maximum number of iterations is exceeded.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors that carry the
+      best iterate so far.
+    """
+
+    # Check the evaluation limits before every evaluation
+    F, J = limit_evaluations([F, J], max_fev, deadline, cancel_token)
+
+    # Initialize variables
+    x = np.array(x0, dtype=float)
+    fx = F(x)
+
+    # Invert the Jacobian at the initial guess
+    try:
+        H = np.linalg.inv(J(x))
+    except np.linalg.LinAlgError:
+        raise ValueError("Jacobian is singular at the initial guess.")
+
+    # Loop until the root is found or the maximum number of iterations is reached
+    for n in range(max_iter):
+        # Check for convergence
+        if np.max(np.abs(fx)) <= tol:
+            return x, n
+
+        # Take a damped quasi-Newton step
+        x_new, fx_new = _damped_step(F, x, fx, -H @ fx)
+        dx = x_new - x
+        df = fx_new - fx
+
+        # Check for zero in the denominator of the update
+        h_df = H @ df
+        denominator = dx @ h_df
+        if denominator == 0:
+            raise ValueError("Jacobian approximation became singular. Adjust the initial guess or use another method.")
+
+        # Update the inverse Jacobian approximation using the Sherman-Morrison formula
+        H += np.outer(dx - h_df, dx @ H) / denominator
+        x, fx = x_new, fx_new
+        yield {"n": n + 1, "x": x, "fx": fx, "step": dx}
+
+    # Check for convergence
+    raise ValueError("Exceeded maximum iterations. Adjust the initial guess, tolerance, or try another method.")
+
+
+def broyden_system(F, J, x0, tol=1e-5, max_iter=100, max_fev=None, deadline=None, cancel_token=None):
+    """Broyden quasi-Newton method for finding a root of a system of nonlinear equations.
+
+    The Jacobian is evaluated once at the initial guess. After that, an approximation of its inverse is kept up to
+    date with rank-one updates, so each iteration costs one evaluation of F and no linear solves.
+
+    Parameters:
+    - F (function): Vector function of the system to find the root of.
+    - J (function): Jacobian matrix of the system, only evaluated at the initial guess.
+    - x0 (array_like): Initial guess for the root.
+    - tol (float): The tolerance level for stopping the algorithm, applied to the largest component of F.
+    - max_iter (int): Maximum number of iterations.
+    - max_fev (int, optional): Maximum number of evaluations of F and J together.
+    - deadline (float, optional): The time.monotonic() value after which no further evaluation is started.
+    - cancel_token (CancellationToken, optional): A token that cancels the solve when set.
+
+    Returns:
+    - x (ndarray): The root of the system.
+    - n (int): The number of iterations required to reach the root.
+
+    Raises:
+    - ValueError: If the Jacobian approximation becomes singular or the maximum number of iterations is exceeded.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors that carry the
+      best iterate so far.
+    """
+    return run_to_completion(broyden_system_iter(F, J, x0, tol, max_iter, max_fev, deadline, cancel_token))
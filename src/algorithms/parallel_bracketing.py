@@ -0,0 +1,149 @@
+import concurrent.futures
+import os
+
+import numpy as np
+
+from src.utils.solve_limits import SolverStopped, limit_evaluations
+from src.utils.solver_iteration import run_to_completion
+
+
+def default_sections():
+    """The number of sections k when none is given: one interior point per CPU."""
+    return (os.cpu_count() or 1) + 1
+
+
+def _round_points(a, b, f_a, f_b, k, speculative):
+    """The interior points of a round: k - 1 equally spaced points, or, when speculative, the false position point of
+    the bracket and k - 2 equally spaced points."""
+    if not speculative:
+        return a + (b - a) * np.arange(1, k) / k
+    sections = a + (b - a) * np.arange(1, k - 1) / (k - 1)
+    guess = b - f_b * (b - a) / (f_b - f_a)
+    if not a < guess < b:
+        guess = (a + b) / 2
+    return np.sort(np.append(sections, guess))
+
+
+def k_section_iter(f, a, b, tol=1e-5, max_iter=100, k=None, executor=None, speculative=False, max_fev=None,
+                   deadline=None, cancel_token=None):
+    """Generator form of the parallel k-section method, yielding the solver state after every round.
+
+    Parameters:
+    - f, a, b, tol, max_iter, k, executor, speculative, max_fev, deadline, cancel_token: As in k_section.
+
+    Yields:
+    - state (dict): The round count "n", the end "x" of the updated bracket with the smallest residual, its function
+      value "fx" and the updated bracket "a", "b".
+
+    Returns:
+    - (x, n) (tuple): The root and the number of rounds, as the value of the StopIteration.
+
+    Raises:
+    - ValueError: If k < 2, if the function does not change sign within the interval [a, b] or the maximum number of
+      rounds is exceeded.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors that carry the
+      best iterate so far.
+    """
+    k = default_sections() if k is None else k
+    if k < 2 or (speculative and k < 3):
+        raise ValueError("k-section needs k >= 2, and k >= 3 with speculative points.")
+
+    owns_executor = executor is None
+    if owns_executor:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=k - 1)
+
+    def evaluate_concurrently(points):
+        return np.array(list(executor.map(f, points.tolist())), dtype=float)
+
+    # Check the evaluation limits before every round, counting each of its evaluations
+    [evaluate] = limit_evaluations([evaluate_concurrently], max_fev, deadline, cancel_token, track_best=False,
+                                   count_elements=True)
+    best = {"x": None, "fx": None}
+
+    def evaluate_tracking_best(points):
+        try:
+            values = evaluate(points)
+        except SolverStopped as stopped:
+            raise type(stopped)(best["x"], best["fx"], stopped.nfev) from None
+        i = np.argmin(np.abs(values))
+        if best["x"] is None or abs(values[i]) < abs(best["fx"]):
+            best["x"], best["fx"] = float(points[i]), float(values[i])
+        return values
+
+    try:
+        # Check if the function changes sign within the interval [a, b]
+        f_a, f_b = evaluate_tracking_best(np.array([a, b], dtype=float))
+        if f_a * f_b > 0:
+            raise ValueError("The function does not change sign within the interval [a, b].")
+
+        # Initialize variables
+        n = 0
+
+        # Loop until the root is found or the maximum number of rounds is reached
+        while abs(b - a) > tol and n < max_iter:
+            points = _round_points(a, b, f_a, f_b, k, speculative)
+            values = evaluate_tracking_best(points)
+
+            # Check if a function value at an interior point is sufficiently close to zero
+            i = np.argmin(np.abs(values))
+            if abs(values[i]) <= tol:
+                return float(points[i]), n
+
+            # Keep the first section where the function changes sign
+            xs = np.concatenate([[a], points, [b]])
+            fs = np.concatenate([[f_a], values, [f_b]])
+            j = np.flatnonzero(fs[:-1] * fs[1:] <= 0)[0]
+            a, b, f_a, f_b = xs[j], xs[j + 1], fs[j], fs[j + 1]
+
+            # Update round count
+            n += 1
+            x, f_x = (a, f_a) if abs(f_a) <= abs(f_b) else (b, f_b)
+            yield {"n": n, "x": float(x), "fx": float(f_x), "a": float(a), "b": float(b)}
+    finally:
+        if owns_executor:
+            executor.shutdown(wait=False)
+
+    # Check for convergence
+    if n == max_iter:
+        raise ValueError("Exceeded maximum iterations. Adjust the initial interval, tolerance, or try another method.")
+
+    return float((a + b) / 2), n
+
+
+def k_section(f, a, b, tol=1e-5, max_iter=100, k=None, executor=None, speculative=False, max_fev=None,
+              deadline=None, cancel_token=None):
+    """Parallel k-section method for finding a root of a function that is expensive to evaluate.
+
+    Every round evaluates f at k - 1 interior points of the bracket concurrently and keeps the section where f changes
+    sign, so the bracket shrinks by a factor of k per round instead of 2. With k - 1 workers a round takes about as
+    long as one evaluation, and reaching the same accuracy as bisection takes about log2(k) times less wall time.
+
+    With speculative points, one of the interior points is the false position point of the bracket and the others
+    divide it into k - 1 sections. The bracket still shrinks by a factor of k - 1 per round, while near a simple root
+    the false position point is close enough for |f| to drop below tol in a few rounds.
+
+    Parameters:
+    - f (function): Function to find the root of. With a process pool it must be picklable.
+    - a, b (float): The interval [a, b] within which to search for the root.
+    - tol (float): The tolerance level for stopping the algorithm.
+    - max_iter (int): Maximum number of rounds.
+    - k (int, optional): The number of sections per round. Defaults to one interior point per CPU.
+    - executor (concurrent.futures.Executor, optional): The pool that evaluates f. Defaults to a thread pool of
+      k - 1 threads for the solve, which suits functions that wait on external simulations.
+    - speculative (bool): Whether one interior point is the false position point.
+    - max_fev (int, optional): Maximum number of function evaluations, checked before every round.
+    - deadline (float, optional): The time.monotonic() value after which no further round is started.
+    - cancel_token (CancellationToken, optional): A token that cancels the solve when set.
+
+    Returns:
+    - x (float): The root of the function.
+    - n (int): The number of rounds required to reach the root.
+
+    Raises:
+    - ValueError: If k < 2, if the function does not change sign within the interval [a, b] or the maximum number of
+      rounds is exceeded.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors that carry the
+      best iterate so far.
+    """
+    return run_to_completion(k_section_iter(f, a, b, tol, max_iter, k, executor, speculative, max_fev, deadline,
+                                            cancel_token))
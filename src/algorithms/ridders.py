@@ -0,0 +1,105 @@
+import math
+
+from src.utils.solve_limits import limit_evaluations
+from src.utils.solver_iteration import run_to_completion
+
+
+def ridders_iter(f, a, b, tol=1e-5, max_iter=100, max_fev=None, deadline=None, cancel_token=None):
+    """Generator form of Ridders' method, yielding the solver state after every iteration.
+
+    Parameters:
+    - f, a, b, tol, max_iter, max_fev, deadline, cancel_token: As in ridders.
+
+    Yields:
+    - state (dict): The iteration count "n", the new approximation "x", its function value "fx" and the updated
+      bracket "a", "b".
+
+    Returns:
+    - (x, n) (tuple): The root and the number of iterations, as the value of the StopIteration.
+
+    Raises:
+    - ValueError: If the function does not change sign within the interval [a, b] or the maximum number of
+      iterations is exceeded.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors that carry the
+      best iterate so far.
+    """
+
+    # Check the evaluation limits before every evaluation
+    [f] = limit_evaluations([f], max_fev, deadline, cancel_token)
+
+    # Check if the function changes sign within the interval [a, b]
+    f_a = f(a)
+    f_b = f(b)
+    if f_a * f_b > 0:
+        raise ValueError("The function does not change sign within the interval [a, b].")
+    if f_a == 0:
+        return a, 0
+    if f_b == 0:
+        return b, 0
+
+    # Initialize variables
+    n = 0
+
+    # Loop until the root is found or the maximum number of iterations is reached
+    while abs(b - a) > tol and n < max_iter:
+        x_m = (a + b) / 2
+        f_m = f(x_m)
+
+        # Fit f(x) * exp(Q x) with a straight line through the three points, and take its root. The factor under the
+        # square root is positive, since f(a) and f(b) have opposite signs.
+        denominator = math.sqrt(f_m * f_m - f_a * f_b)
+        if denominator == 0:
+            return x_m, n
+        x = x_m + (x_m - a) * math.copysign(1, f_a - f_b) * f_m / denominator
+        f_x = f(x)
+
+        # Keep the smallest bracket out of the endpoints, the midpoint and the new approximation
+        if f_m * f_x < 0:
+            (a, f_a), (b, f_b) = sorted([(x_m, f_m), (x, f_x)])
+        elif f_a * f_x < 0:
+            b, f_b = x, f_x
+        else:
+            a, f_a = x, f_x
+
+        # Update iteration count
+        n += 1
+        yield {"n": n, "x": x, "fx": f_x, "a": a, "b": b}
+
+        # Check if the function value at the root approximation is sufficiently close to zero
+        if abs(f_x) <= tol:
+            return x, n
+
+    # Check for convergence
+    if n == max_iter:
+        raise ValueError("Exceeded maximum iterations. Adjust the initial interval, tolerance, or try another method.")
+
+    return (a + b) / 2, n
+
+
+def ridders(f, a, b, tol=1e-5, max_iter=100, max_fev=None, deadline=None, cancel_token=None):
+    """Ridders' method for finding a root of a function.
+
+    Every iteration evaluates f at the midpoint of the bracket, removes the exponential factor that makes f(a), f(m)
+    and f(b) lie on a straight line, and takes the root of that line. The new approximation always lies within the
+    bracket, and the method converges quadratically, at two evaluations per iteration.
+
+    Parameters:
+    - f (function): Function to find the root of.
+    - a, b (float): The interval [a, b] within which to search for the root.
+    - tol (float): The tolerance level for stopping the algorithm.
+    - max_iter (int): Maximum number of iterations.
+    - max_fev (int, optional): Maximum number of function evaluations, derivatives included.
+    - deadline (float, optional): The time.monotonic() value after which no further evaluation is started.
+    - cancel_token (CancellationToken, optional): A token that cancels the solve when set.
+
+    Returns:
+    - x (float): The root of the function.
+    - n (int): The number of iterations required to reach the root.
+
+    Raises:
+    - ValueError: If the function does not change sign within the interval [a, b] or the maximum number of
+      iterations is exceeded.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors that carry the
+      best iterate so far.
+    """
+    return run_to_completion(ridders_iter(f, a, b, tol, max_iter, max_fev, deadline, cancel_token))
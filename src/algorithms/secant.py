@@ -1,22 +1,35 @@
-def secant(f, x0, x1, tol=1e-5, max_iter=100):
-    """Secant method for finding a root of a function.
+from src.utils.solve_limits import limit_evaluations
+from src.utils.solver_iteration import run_to_completion
+
+
+def secant_iter(f, x0, x1, tol=1e-5, max_iter=100, max_fev=None, deadline=None, cancel_token=None):
+    """Generator form of the Secant method, yielding the solver state after every iteration.
 
     Parameters:
-    - f (function): Function to find the root of.
-    - x0, x1 (float): Two initial guesses for the root.
-    - tol (float): The tolerance level for stopping the algorithm.
-    - max_iter (int): Maximum number of iterations.
+    - f, x0, x1, tol, max_iter, max_fev, deadline, cancel_token: As in secant.
+
+    Yields:
+    - state (dict): The iteration count "n", the new approximation "x", its function value "fx" and the "step" from
+      the previous approximation.
 
     Returns:
-    - x (float): The root of the function.
-    - n (int): The number of iterations required to reach the root.
+    - (x, n) (tuple): The root and the number of iterations, as the value of the StopIteration.
 
     Raises:
     - ValueError: If a suitable root isn't found within max_iter iterations.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors that carry the
+      best iterate so far.
     """
 
+    # Check the evaluation limits before every evaluation
+    [f] = limit_evaluations([f], max_fev, deadline, cancel_token)
+
+    # Compute the function values
+    f_x0 = f(x0)
+    f_x1 = f(x1)
+
     # Explicit check for identical function values at initial guesses
-    if f(x0) == f(x1):
+    if f_x0 == f_x1:
         raise ValueError("Function values of the two guesses are the same, causing division by zero.")
 
     # Initialize variables
@@ -24,23 +37,45 @@ def secant(f, x0, x1, tol=1e-5, max_iter=100):
     x = x1
 
     while abs(x1 - x0) > tol and n < max_iter:
-        # Compute the function values
-        f_x0 = f(x0)
-        f_x1 = f(x1)
-
         # Avoid division by zero
         if f_x1 - f_x0 == 0:
             raise ValueError("Denominator approaching zero. Try different initial values or another method.")
 
         # Secant method formula
         x = x1 - f_x1 * (x1 - x0) / (f_x1 - f_x0)
+        f_x = f(x)
 
         # Prepare for the next iteration
-        x0, x1 = x1, x
+        x0, f_x0, x1, f_x1 = x1, f_x1, x, f_x
         n += 1
+        yield {"n": n, "x": x, "fx": f_x, "step": x1 - x0}
 
     # Check for convergence
     if n == max_iter:
         raise ValueError("Exceeded maximum iterations. Adjust the initial guesses, tolerance, or try another method.")
 
     return x, n
+
+
+def secant(f, x0, x1, tol=1e-5, max_iter=100, max_fev=None, deadline=None, cancel_token=None):
+    """Secant method for finding a root of a function.
+
+    Parameters:
+    - f (function): Function to find the root of.
+    - x0, x1 (float): Two initial guesses for the root.
+    - tol (float): The tolerance level for stopping the algorithm.
+    - max_iter (int): Maximum number of iterations.
+    - max_fev (int, optional): Maximum number of function evaluations, derivatives included.
+    - deadline (float, optional): The time.monotonic() value after which no further evaluation is started.
+    - cancel_token (CancellationToken, optional): A token that cancels the solve when set.
+
+    Returns:
+    - x (float): The root of the function.
+    - n (int): The number of iterations required to reach the root.
+
+    Raises:
+    - ValueError: If a suitable root isn't found within max_iter iterations.
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If a limit stops the solve. These are ValueErrors that carry the
+      best iterate so far.
+    """
+    return run_to_completion(secant_iter(f, x0, x1, tol, max_iter, max_fev, deadline, cancel_token))
@@ -0,0 +1,98 @@
+import math
+
+import numpy as np
+
+from src.utils.sample_data import INTERPOLATION_KINDS, hermite_segment, pchip_slopes, sample_chunks
+
+# Samples kept from one chunk to the next, so that the slopes of the monotone cubic near the boundary can be computed
+OVERLAP = 3
+
+
+def _windows(chunks):
+    """Prefix every chunk with the last OVERLAP samples of the previous window.
+
+    Yields:
+    - x, y (ndarray): The samples of the window.
+    - first (bool): Whether this is the first window.
+    - last (bool): Whether this is the last window.
+    """
+    window = None
+    first = True
+    for x, y in chunks:
+        if window is not None:
+            yield (*window, first, False)
+            first = False
+            x, y = np.concatenate([window[0][-OVERLAP:], x]), np.concatenate([window[1][-OVERLAP:], y])
+        window = (x, y)
+    if window is not None:
+        yield (*window, first, True)
+
+
+def _refine(x, y, segments, kind, tol):
+    """Refine the roots of the interpolant on the segments [x[i], x[i + 1]] where the samples change sign.
+
+    The interpolant is monotone on such a segment, so its single root is found by bisection, vectorized over all the
+    segments at once.
+    """
+    x0, x1, y0, y1 = x[segments], x[segments + 1], y[segments], y[segments + 1]
+    if kind == "linear":
+        return x0 - y0 * (x1 - x0) / (y1 - y0)
+
+    d0, d1 = pchip_slopes(x, y, segments), pchip_slopes(x, y, segments + 1)
+    lo, hi = x0.copy(), x1.copy()
+    # Bisection halves the widest segment until every bracket is within tol
+    steps = max(0, math.ceil(math.log2(np.max(hi - lo) / tol))) if segments.size else 0
+    for _ in range(min(steps, 64)):
+        mid = (lo + hi) / 2
+        same_sign_as_left = np.sign(hermite_segment(x0, x1, y0, y1, d0, d1, mid)) == np.sign(y0)
+        lo = np.where(same_sign_as_left, mid, lo)
+        hi = np.where(same_sign_as_left, hi, mid)
+    return (lo + hi) / 2
+
+
+def tabulated_roots(source, kind="pchip", tol=1e-12, chunk_size=1_000_000):
+    """Find every root of a function known only through samples, reading them chunk by chunk.
+
+    Binary sample files are memory-mapped and CSV files are parsed a chunk at a time, so files larger than the memory
+    can be searched. Every segment between two samples of opposite signs holds exactly one root of the interpolant,
+    which is refined on the segment. Samples that are exactly zero are roots themselves.
+
+    Parameters:
+    - source (str or tuple of array_like): The path of a sample file, in any format read by load_samples, or the x
+      and y columns themselves. The x values must be strictly increasing.
+    - kind (str): The interpolant between samples, "linear" or "pchip" (monotone cubic), as in TabulatedFunction.
+    - tol (float): The width within which a root of the monotone cubic is located.
+    - chunk_size (int): The number of samples read at once.
+
+    Returns:
+    - roots (ndarray): The roots, sorted.
+
+    Raises:
+    - ValueError: If the interpolation is unknown, or the x values are not strictly increasing.
+    """
+    if kind not in INTERPOLATION_KINDS:
+        raise ValueError(f"Unknown interpolation '{kind}'. Choose one of: {', '.join(INTERPOLATION_KINDS)}.")
+
+    # Windows must be longer than the overlap
+    chunk_size = max(chunk_size, 2 * OVERLAP)
+
+    roots = []
+    for x, y, first, last in _windows(sample_chunks(source, chunk_size)):
+        if np.any(np.diff(x) <= 0):
+            raise ValueError("The x values of the samples must be strictly increasing.")
+
+        # Every segment is handled by exactly one window. The last segment of a window waits for the next one, where
+        # the sample after it is known and the slopes at both of its ends can be computed.
+        start = 0 if first else OVERLAP - 2
+        stop = len(x) - 1 if last else len(x) - 2
+        segments = np.arange(start, stop)
+
+        # Zero samples are roots, counted at the left end of their segment, and at the very end of the data
+        zeros = segments[y[segments] == 0]
+        if last and y[-1] == 0:
+            zeros = np.append(zeros, len(x) - 1)
+        crossings = segments[y[segments] * y[segments + 1] < 0]
+
+        roots += [x[zeros], _refine(x, y, crossings, kind, tol)]
+
+    return np.sort(np.concatenate(roots)) if roots else np.empty(0)
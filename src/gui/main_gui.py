@@ -1,24 +1,58 @@
-import io
-import math
+import importlib
 import re
 import sys
+import time
 
-import matplotlib.pyplot as plt
 import numpy as np
-import sympy as sp
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
 from PyQt5.QtWidgets import *
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
-from matplotlib.figure import Figure
 
-from src.algorithms.bisection import bisection
-from src.algorithms.false_position import false_position
-from src.algorithms.modified_newton import modified_newton
-from src.algorithms.newton import newton
-from src.algorithms.secant import secant
-from src.utils.function_evaluation import get_function_and_derivatives
+from src.algorithms.bisection import bisection_iter
+from src.algorithms.critical_points import critical_points
+from src.algorithms.false_position import VARIANTS, false_position_iter
+from src.algorithms.halley import halley_iter
+from src.algorithms.householder import householder_iter
+from src.algorithms.itp import itp_iter
+from src.algorithms.modified_newton import modified_newton_iter
+from src.algorithms.newton import newton_iter
+from src.algorithms.newton_basins import newton_basins_grid
+from src.algorithms.ridders import ridders_iter
+from src.algorithms.secant import secant_iter
+from src.utils.function_evaluation import (evaluate_many, get_function, get_function_and_derivatives,
+                                           get_function_and_higher_derivatives, get_vectorized_function_and_derivatives,
+                                           is_vectorized)
+from src.utils.method_comparison import compare_methods
+from src.utils.metrics import recorded_solve
+from src.utils.parametric_solve import ParametricSolver
+from src.utils.parsed_expression import get_parsed_expression
+from src.utils.problem_batch import export_results, load_problems, solve_problems
+from src.utils.result_store import RESULT_DTYPE, STATUS_NAMES
+from src.utils.sandbox import get_sandbox, prepare_expression
+from src.utils.solve_limits import CancellationToken, Cancelled, limit_evaluations
+
+# Seconds a single calculation may run before it is stopped, so that a runaway solve does not go on forever
+SOLVE_TIME_LIMIT = 10
+
+# Milliseconds the input must stay unchanged before it is prepared, so that typing does not prepare every keystroke
+PREPARE_DELAY_MS = 250
+
+# Minimum seconds between two batches of iterates sent to the graph while a calculation runs
+PROGRESS_INTERVAL = 0.05
+
+# Number of the latest iterates shown on the graph, so that long runs do not slow the drawing down
+MAX_DRAWN_ITERATES = 500
+
+# Range and resolution of the parameter sliders, and the value a new parameter starts at
+PARAMETER_RANGE = (-10, 10)
+PARAMETER_STEPS_PER_UNIT = 100
+PARAMETER_DEFAULT = 1.0
+
+# Methods that take an interval [a, b] instead of initial guesses
+BRACKETING_METHODS = ["Bisection", "False Position", "Ridders", "ITP"]
+
+# Modules that are slow to import. They are loaded in the background once the window is shown.
+DEFERRED_MODULES = ["sympy", "matplotlib.figure", "matplotlib.backends.backend_qt5agg", "src.gui.plotting"]
 
 
 def preprocess_input(expression):
@@ -43,16 +77,9 @@ def convert_to_latex(expression):
     # Preprocess the expression to handle implicit multiplications
     python_expr = preprocess_input(expression)
 
-    # Convert to SymPy expression
-    expr = sp.sympify(python_expr)
-
-    # Convert to LaTeX
-    latex_expr = sp.latex(expr, mul_symbol='dot')
-
-    # Post-process: Remove any unwanted 'cdot' to handle implicit multiplications
-    latex_expr = latex_expr.replace('\\cdot', '')
-
-    return latex_expr, python_expr
+    # The input is parsed in the sandbox, so that a pathological expression cannot hang the process. The parsed
+    # expression is shared with the solvers, so the same input is only parsed once.
+    return prepare_expression(python_expr, order=0).latex, python_expr
 
 
 def get_dark_palette():
@@ -135,11 +162,13 @@ def toggle_dark_mode():
     # Update the LaTeX display
     window.update_latex_display()
 
-    # Update the result display
-    window.on_calculate_clicked()
+    # Update the result display, unless a calculation is running, which the button would cancel
+    if window.calculation_thread is None or not window.calculation_thread.isRunning():
+        window.on_calculate_clicked()
 
     # Update the graph display
-    window.graph_display.refresh_style()
+    if window.graph_display is not None:
+        window.graph_display.refresh_style()
 
 
 def is_float(value, allow_empty=False):
@@ -160,78 +189,424 @@ def is_int(value, allow_empty=False):
         return allow_empty and value == ""
 
 
-class GraphCanvas(FigureCanvas):
-    def __init__(self, parent=None, width=5, height=4, dpi=100):
-        self.parent = parent
-        fig = Figure(figsize=(width, height), dpi=dpi)
-        self.axes = fig.add_subplot(111)
-
-        super(GraphCanvas, self).__init__(fig)
-
-        self.toolbar = self.get_toolbar()
-        if self.toolbar:
-            configure_subplots_action = next(
-                (action for action in self.toolbar.actions() if action.text() == "Customize"), None)
-            if configure_subplots_action:
-                self.toolbar.removeAction(configure_subplots_action)
-
-        # Set initial colors
-        self.set_colors_based_on_theme()
-
-    def get_toolbar(self):
-        """Get the navigation toolbar."""
-        for widget in self.parent.findChildren(QWidget):
-            if isinstance(widget, NavigationToolbar):
-                # Remove the "Configure subplots" button
-                for action in widget.actions():
-                    if action.iconText() == 'Subplots':
-                        widget.removeAction(action)
-                return widget
+class ExpressionWorker(QObject):
+    """Prepares the typed function in the sandbox in a background thread, so that a bad input cannot freeze the window."""
+
+    # Emitted with the typed text, its Python expression and its LaTeX, or with an error message
+    finished = pyqtSignal(str, str, str, str)
+
+    def __init__(self, expression):
+        super().__init__()
+        self.expression = expression
+
+    def run(self):
+        try:
+            latex_expr, python_expr = convert_to_latex(self.expression)
+            # The live solve of the parameter sliders uses the first two derivatives
+            if get_parsed_expression(python_expr).parameters:
+                prepare_expression(python_expr, order=2)
+        except Exception as e:
+            self.finished.emit(self.expression, "", "", str(e))
+        else:
+            self.finished.emit(self.expression, python_expr, latex_expr, "")
+
+
+class CalculationWorker(QObject):
+    """Runs the selected method in a background thread, streaming its iterates back to the window."""
+
+    # Emitted first, with the x and f(x) values of the curve and the (x, f(x)) starting points
+    curve_ready = pyqtSignal(object, object, list)
+    # Emitted with the solver states of the latest iterations, at most once every PROGRESS_INTERVAL seconds
+    progress = pyqtSignal(list)
+    # Emitted with the root and the number of iterations, or with None and an error message
+    finished = pyqtSignal(object, object, str)
+
+    def __init__(self, python_expr, method, params, limits):
+        super().__init__()
+        self.python_expr = python_expr
+        self.method = method
+        self.params = params
+        self.limits = limits
+
+    def start_solver(self):
+        """Create the generator of the selected method."""
+        p, limits = self.params, self.limits
+        if self.method == "Householder":
+            f, *derivatives = get_function_and_higher_derivatives(self.python_expr, p["order"])
+            return householder_iter(f, derivatives, p["x0"], p["tol"], p["max_iter"], **limits)
+
+        f, df, ddf = get_function_and_derivatives(self.python_expr)
+        if self.method == "Bisection":
+            return bisection_iter(f, p["a"], p["b"], p["tol"], p["max_iter"], **limits)
+        if self.method == "False Position":
+            return false_position_iter(f, p["a"], p["b"], p["tol"], p["max_iter"], p["variant"], **limits)
+        if self.method == "Ridders":
+            return ridders_iter(f, p["a"], p["b"], p["tol"], p["max_iter"], **limits)
+        if self.method == "ITP":
+            return itp_iter(f, p["a"], p["b"], p["tol"], p["max_iter"], **limits)
+        if self.method == "Newton":
+            return newton_iter(f, df, p["x0"], p["tol"], p["max_iter"], **limits)
+        if self.method == "Modified Newton":
+            return modified_newton_iter(f, df, ddf, p["x0"], p["tol"], p["max_iter"], **limits)
+        if self.method == "Halley":
+            return halley_iter(f, df, ddf, p["x0"], p["tol"], p["max_iter"], **limits)
+        return secant_iter(f, p["x0"], p["x1"], p["tol"], p["max_iter"], **limits)
+
+    def run(self):
+        try:
+            # The expression and the derivatives the method needs are prepared in the sandbox
+            prepare_expression(self.python_expr, self.params["order"] if self.method == "Householder" else 2)
+
+            # The curve is evaluated here too, since f may be slow, and stops at the deadline or when cancelled
+            f = get_function(self.python_expr)
+            vectorized = is_vectorized(f)
+            f = limit_evaluations([f], deadline=self.limits["deadline"], cancel_token=self.limits["cancel_token"],
+                                  track_best=False)[0]
+            x_vals = np.linspace(-10, 10, 400)
+            points = [(point, f(point)) for point in self.params["plot_points"]]
+            self.curve_ready.emit(x_vals, evaluate_many(f, x_vals, vectorized), points)
+
+            # The solve is recorded in the metrics like the solves of the batches and of the comparison
+            with recorded_solve(self.method):
+                steps = self.start_solver()
+                pending = []
+                last_emit = time.monotonic()
+                while True:
+                    try:
+                        pending.append(next(steps))
+                    except StopIteration as stop:
+                        root, iterations = stop.value
+                        break
+                    # Throttle the updates, so that fast iterations do not flood the event loop
+                    if time.monotonic() - last_emit >= PROGRESS_INTERVAL:
+                        self.progress.emit(pending)
+                        pending = []
+                        last_emit = time.monotonic()
+        except Cancelled:
+            self.finished.emit(None, None, "Calculation cancelled.")
+        except Exception as e:
+            self.finished.emit(None, None, str(e))
+        else:
+            if pending:
+                self.progress.emit(pending)
+            self.finished.emit(root, iterations, "")
+
+
+class ComparisonWorker(QObject):
+    """Runs compare_methods in a background thread so that the window stays responsive."""
+
+    # Emitted with the results, or with an empty list and an error message
+    finished = pyqtSignal(list, str)
+
+    def __init__(self, python_expr, params):
+        super().__init__()
+        self.python_expr = python_expr
+        self.params = params
+
+    def run(self):
+        try:
+            # compare_methods uses up to three derivatives
+            prepare_expression(self.python_expr, order=3)
+            results = compare_methods(self.python_expr, **self.params)
+        except Cancelled:
+            self.finished.emit([], "Comparison cancelled.")
+        except Exception as e:
+            self.finished.emit([], str(e))
+        else:
+            self.finished.emit(results, "")
+
+
+class ComparisonWindow(QWidget):
+    """A table of the statistics of every method, with their convergence histories overlaid on a log scale."""
+
+    columns = ["Method", "Root", "Iterations", "Evaluations", "Time (ms)", "Residual"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent, Qt.Window)
+        self.setWindowTitle("Method Comparison")
+        self.setGeometry(150, 150, 900, 600)
+        self.cancel_token = None
+
+        self.table = QTableWidget(0, len(self.columns))
+        self.table.setHorizontalHeaderLabels(self.columns)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+
+        from src.gui.plotting import ConvergenceCanvas
+
+        self.canvas = ConvergenceCanvas(self)
+
+        layout = QVBoxLayout()
+        layout.addWidget(self.table)
+        layout.addWidget(self.canvas)
+        self.setLayout(layout)
+
+    def show_results(self, results):
+        """Fill the table and plot the convergence histories."""
+        self.table.setRowCount(len(results))
+        for row, result in enumerate(results):
+            if result["error"]:
+                cells = [result["method"], "Failed", "-", str(result["evaluations"]), f"{result['time'] * 1e3:.3f}",
+                         "-"]
+            else:
+                cells = [result["method"], f"{result['root']:.12g}", str(result["iterations"]),
+                         str(result["evaluations"]), f"{result['time'] * 1e3:.3f}", f"{result['residual']:.3g}"]
+            for col, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if result["error"]:
+                    item.setToolTip(result["error"])
+                self.table.setItem(row, col, item)
+
+        self.canvas.plot_histories(results)
+
+    def closeEvent(self, event):
+        # Stop a comparison that is still running
+        if self.cancel_token is not None:
+            self.cancel_token.cancel()
+        super().closeEvent(event)
+
+
+class BatchWorker(QObject):
+    """Solves the problems of a batch in a background thread, reporting every chunk as it completes."""
+
+    # Emitted with the index of the first problem of a chunk, its results and its error messages
+    chunk_done = pyqtSignal(int, object, list)
+    # Emitted once, with an error message if the batch could not be solved
+    finished = pyqtSignal(str)
+
+    def __init__(self, problems, cancel_token):
+        super().__init__()
+        self.problems = problems
+        self.cancel_token = cancel_token
+
+    def run(self):
+        try:
+            for start, results, errors in solve_problems(self.problems, cancel_token=self.cancel_token,
+                                                         time_limit=SOLVE_TIME_LIMIT):
+                self.chunk_done.emit(start, results, errors)
+        except Exception as e:
+            self.finished.emit(str(e))
+        else:
+            self.finished.emit("")
+
+
+class BatchResultsModel(QAbstractTableModel):
+    """The completed problems of a batch, which grow as chunks complete and sort with NumPy."""
+
+    columns = ["Row", "Expression", "Method", "Root", "Iterations", "Evaluations", "Status", "Error"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.set_problems([])
+
+    def set_problems(self, problems):
+        """Start over with a new batch of problems, none of which is completed."""
+        self.beginResetModel()
+        self.problems = problems
+        self.results = np.zeros(len(problems), dtype=RESULT_DTYPE)
+        self.errors = [""] * len(problems)
+        self.order = np.empty(0, dtype=np.int64)  # The problem shown in every row
+        self.sort_column, self.sort_order = None, Qt.AscendingOrder
+        self.endResetModel()
+
+    def add_chunk(self, start, results, errors):
+        """Show the results of a completed chunk."""
+        stop = start + len(results)
+        self.results[start:stop] = results
+        self.errors[start:stop] = errors
+
+        if self.sort_column is None:
+            self.beginInsertRows(QModelIndex(), len(self.order), len(self.order) + len(results) - 1)
+            self.order = np.concatenate([self.order, np.arange(start, stop)])
+            self.endInsertRows()
+        else:
+            self.layoutAboutToBeChanged.emit()
+            self.order = np.concatenate([self.order, np.arange(start, stop)])
+            self.order = self.order[self._argsort(self.sort_column, self.sort_order)]
+            self.layoutChanged.emit()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.order)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.columns[section]
         return None
 
-    def set_colors_based_on_theme(self):
-        """Adjust graph colors based on the application's theme."""
-        if app.palette().color(QPalette.Window) == QColor(53, 53, 53):  # Dark mode
-            self.figure.set_facecolor('black')
-            self.axes.set_facecolor('black')
-            self.axes.grid(color='gray')
-            self.axes.spines['bottom'].set_color('gray')
-            self.axes.spines['top'].set_color('gray')
-            self.axes.spines['left'].set_color('gray')
-            self.axes.spines['right'].set_color('gray')
-            self.axes.tick_params(axis='x', colors='gray')
-            self.axes.tick_params(axis='y', colors='gray')
-            self.axes.yaxis.label.set_color('gray')
-            self.axes.xaxis.label.set_color('gray')
-            self.axes.axhline(color='white', linewidth=1)  # Horizontal line (y-axis)
-            self.axes.axvline(color='white', linewidth=1)  # Vertical line (x-axis)
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        idx = int(self.order[index.row()])
+        root, iterations, nfev, status = self.results[idx].tolist()
+        problem = self.problems[idx]
+        values = [idx + 1, problem["expression"], problem["method"].title(), f"{root:.12g}",
+                  iterations if iterations >= 0 else "-", nfev, STATUS_NAMES[status], self.errors[idx]]
+        return str(values[index.column()])
+
+    def _keys(self, column):
+        """The sort keys of the shown problems for a column."""
+        if column == 0:
+            return self.order
+        if column in (1, 2):
+            key = "expression" if column == 1 else "method"
+            return np.array([self.problems[idx][key] for idx in self.order])
+        if column == 7:
+            return np.array([self.errors[idx] for idx in self.order])
+        field = ["root", "iterations", "nfev", "status"][column - 3]
+        return self.results[field][self.order]
+
+    def _argsort(self, column, order):
+        permutation = np.argsort(self._keys(column), kind="stable")
+        return permutation[::-1] if order == Qt.DescendingOrder else permutation
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        self.sort_column, self.sort_order = column, order
+        self.order = self.order[self._argsort(column, order)]
+        self.layoutChanged.emit()
+
+
+class BatchPanel(QWidget):
+    """Solves a CSV file of problems in the background, with progress, throughput, cancellation and export."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent, Qt.Window)
+        self.setWindowTitle("Batch Solve")
+        self.setGeometry(150, 150, 900, 600)
+        self.thread = None
+        self.cancel_token = None
+
+        self.load_button = QPushButton("Load CSV")
+        self.load_button.clicked.connect(self.on_load_clicked)
+        self.start_button = QPushButton("Start")
+        self.start_button.clicked.connect(self.start)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.cancel)
+        self.export_button = QPushButton("Export CSV")
+        self.export_button.clicked.connect(self.on_export_clicked)
+
+        buttons_layout = QHBoxLayout()
+        for button in (self.load_button, self.start_button, self.cancel_button, self.export_button):
+            buttons_layout.addWidget(button)
+
+        self.progress_bar = QProgressBar()
+        self.status_label = QLabel("Load a CSV file with the columns expression, method and the method's parameters.")
+
+        self.model = BatchResultsModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSortingEnabled(True)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        # The rows are sorted only once the user asks for it
+        self.table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+
+        layout = QVBoxLayout()
+        layout.addLayout(buttons_layout)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.status_label)
+        layout.addWidget(self.table)
+        self.setLayout(layout)
+
+        self.update_buttons()
+
+    def update_buttons(self):
+        running = self.thread is not None and self.thread.isRunning()
+        self.load_button.setEnabled(not running)
+        self.start_button.setEnabled(not running and bool(self.model.problems))
+        self.cancel_button.setEnabled(running)
+        self.export_button.setEnabled(not running and bool(self.model.problems))
+
+    def on_load_clicked(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Load Problems", "", "CSV Files (*.csv)")
+        if path:
+            self.load(path)
+
+    def load(self, path):
+        """Load the problems of a CSV file, with expressions written as in the main window."""
+        try:
+            problems = load_problems(path)
+        except (OSError, ValueError) as e:
+            self.status_label.setText(f"Error: {e}")
+            return
+        for problem in problems:
+            problem["expression"] = preprocess_input(problem["expression"])
+
+        self.model.set_problems(problems)
+        self.progress_bar.setRange(0, len(problems))
+        self.progress_bar.setValue(0)
+        self.status_label.setText(f"Loaded {len(problems)} problems.")
+        self.update_buttons()
+
+    def start(self):
+        """Solve the loaded problems in a background thread that drives the worker processes."""
+        self.model.set_problems(self.model.problems)
+        self.progress_bar.setValue(0)
+        self.solved = 0
+        self.started = time.monotonic()
+        self.cancel_token = CancellationToken()
+
+        self.thread = QThread(self)
+        self.worker = BatchWorker(self.model.problems, self.cancel_token)
+        self.worker.moveToThread(self.thread)
+        self.thread.started.connect(self.worker.run)
+        self.worker.chunk_done.connect(self.on_chunk_done)
+        self.worker.finished.connect(self.on_finished)
+        self.worker.finished.connect(self.thread.quit)
+        self.thread.finished.connect(self.update_buttons)
+
+        self.status_label.setText("Starting the workers...")
+        self.thread.start()
+        self.update_buttons()
+
+    def cancel(self):
+        if self.cancel_token is not None:
+            self.cancel_token.cancel()
+            self.status_label.setText("Cancelling...")
+
+    def on_chunk_done(self, start, results, errors):
+        self.model.add_chunk(start, results, errors)
+        self.solved += len(results)
+        self.progress_bar.setValue(self.solved)
+        rate = self.solved / max(time.monotonic() - self.started, 1e-9)
+        self.status_label.setText(
+            f"Solved {self.solved} of {len(self.model.problems)} problems ({rate:.0f} per second).")
+
+    def on_finished(self, error_msg):
+        if error_msg:
+            self.status_label.setText(f"Error: {error_msg}")
+        elif self.solved < len(self.model.problems):
+            self.status_label.setText(f"Cancelled after {self.solved} of {len(self.model.problems)} problems.")
+        else:
+            elapsed = time.monotonic() - self.started
+            self.status_label.setText(f"Solved {self.solved} problems in {elapsed:.1f} seconds.")
 
-        else:  # Light mode
-            self.figure.set_facecolor('white')
-            self.axes.set_facecolor('white')
-            self.axes.grid(color='lightgray')
-            self.axes.spines['bottom'].set_color('black')
-            self.axes.spines['top'].set_color('black')
-            self.axes.spines['left'].set_color('black')
-            self.axes.spines['right'].set_color('black')
-            self.axes.tick_params(axis='x', colors='black')
-            self.axes.tick_params(axis='y', colors='black')
-            self.axes.yaxis.label.set_color('black')
-            self.axes.xaxis.label.set_color('black')
-            self.setStyleSheet("")
-            self.axes.axhline(color='black', linewidth=1)  # Horizontal line (y-axis)
-            self.axes.axvline(color='black', linewidth=1)  # Vertical line (x-axis)
-
-    def refresh_style(self):
-        """Refresh the graph's appearance based on the application theme."""
-        self.set_colors_based_on_theme()
-        self.draw()
-
-    def clear_graph(self):
-        """Clear the graph and reset the appearance."""
-        self.axes.clear()
-        self.set_colors_based_on_theme()
-        self.draw()
+    def on_export_clicked(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Results", "results.csv", "CSV Files (*.csv)")
+        if path:
+            export_results(path, self.model.problems, self.model.results, self.model.errors)
+            self.status_label.setText(f"Exported the results to {path}.")
+
+    def closeEvent(self, event):
+        # Stop a batch that is still running
+        self.cancel()
+        super().closeEvent(event)
+
+
+class LibraryLoader(QObject):
+    """Imports the slow modules in a background thread, so that the window appears before they are loaded."""
+
+    finished = pyqtSignal()
+
+    def run(self):
+        for name in DEFERRED_MODULES:
+            importlib.import_module(name)
+        # A sandbox worker imports SymPy too, so it is started ahead of the first expression
+        get_sandbox().start()
+        self.finished.emit()
 
 
 class RootFinderApp(QMainWindow):
@@ -242,6 +617,9 @@ class RootFinderApp(QMainWindow):
         self.setWindowTitle("Root Finder")
         self.setGeometry(100, 100, 800, 600)
 
+        # SymPy and matplotlib are loaded in the background once the window is shown
+        self.libraries_loaded = False
+
         # Layouts
         main_layout = QVBoxLayout()
 
@@ -282,18 +660,39 @@ class RootFinderApp(QMainWindow):
         input_layout = QHBoxLayout()
         self.fx_input = QLineEdit()
         self.fx_input.setPlaceholderText("Enter f(x) here...")
-        self.fx_input.textChanged.connect(self.update_latex_display)
+        # The input is prepared in a background thread once the typing pauses
+        self.prepare_timer = QTimer(self)
+        self.prepare_timer.setSingleShot(True)
+        self.prepare_timer.setInterval(PREPARE_DELAY_MS)
+        self.prepare_timer.timeout.connect(self.update_latex_display)
+        self.expression_thread = None
+        self.expression_outdated = False
+        self.prepared_input = None
+        self.fx_input.textChanged.connect(lambda: self.prepare_timer.start())
         self.fx_input.textChanged.connect(self.validate_input)
         method_label = QLabel("Methods:")
         self.method_dropdown = QComboBox()
-        self.method_dropdown.addItems(["Bisection", "False Position", "Modified Newton", "Newton", "Secant"])
+        self.method_dropdown.addItems(["Bisection", "False Position", "Halley", "Householder", "ITP", "Modified Newton",
+                                       "Newton", "Ridders", "Secant"])
         self.calculate_button = QPushButton("Calculate")
         self.calculate_button.clicked.connect(self.on_calculate_clicked)
+        self.basins_button = QPushButton("Newton Basins")
+        self.basins_button.clicked.connect(self.on_basins_clicked)
+        self.critical_points_button = QPushButton("Critical Points")
+        self.critical_points_button.clicked.connect(self.on_critical_points_clicked)
+        self.compare_button = QPushButton("Compare Methods")
+        self.compare_button.clicked.connect(self.on_compare_clicked)
+        self.batch_button = QPushButton("Batch")
+        self.batch_button.clicked.connect(self.on_batch_clicked)
 
         input_layout.addWidget(self.fx_input)
         input_layout.addWidget(method_label)
         input_layout.addWidget(self.method_dropdown)
         input_layout.addWidget(self.calculate_button)
+        input_layout.addWidget(self.basins_button)
+        input_layout.addWidget(self.critical_points_button)
+        input_layout.addWidget(self.compare_button)
+        input_layout.addWidget(self.batch_button)
         main_layout.addLayout(input_layout)
 
         self.method_dropdown.setCurrentIndex(-1)  # Set no method selected
@@ -317,6 +716,13 @@ class RootFinderApp(QMainWindow):
         main_layout.addWidget(self.latex_display_image_label)
         main_layout.addWidget(self.error_display_label)
 
+        # A slider for every parameter of the expression, re-solving and re-plotting as it is dragged
+        self.slider_layout = QVBoxLayout()
+        self.parameter_sliders = {}
+        self.live_solver = None
+        self.live_root_marker = None
+        main_layout.addLayout(self.slider_layout)
+
         # Additional Parameters Area
         self.additional_params_layout = QVBoxLayout()
         self.param_widgets = {}  # Store the parameter widgets for easy access
@@ -330,10 +736,62 @@ class RootFinderApp(QMainWindow):
         # Connect method dropdown change to adjust additional parameters
         self.method_dropdown.currentTextChanged.connect(self.adjust_parameters)
 
+        # Using QSplitter to allow resizing sections
+        self.main_layout = main_layout
+        self.splitter = QSplitter(Qt.Horizontal)
+        left_widget = QWidget()
+        left_widget.setLayout(main_layout)
+        self.splitter.addWidget(left_widget)
+        self.setCentralWidget(self.splitter)
+
+        # The graphs need matplotlib, so they are created once the background loading is done
+        self.graph_display = None
+        self.curve_line = None
+        self.basin_display = None
+        self.comparison_window = None
+        self.comparison_thread = None
+
+        # The calculation runs in a background thread, with the iterates drawn on the graph as they arrive
+        self.calculation_thread = None
+        self.calculation_token = None
+        self.iterate_line = None
+        self.bracket_span = None
+
+        # Bulk solving of problems loaded from a CSV file
+        self.batch_panel = BatchPanel(self)
+
+        self.validate_input()
+
+        # Load SymPy and matplotlib in the background, with the buttons that need them disabled until then
+        for button in (self.calculate_button, self.basins_button, self.critical_points_button, self.compare_button):
+            button.setEnabled(False)
+        self.loading_bar = QProgressBar()
+        self.loading_bar.setRange(0, 0)  # Busy indicator
+        self.loading_bar.setMaximumWidth(150)
+        self.loading_label = QLabel("Loading plotting and symbolic libraries...")
+        self.statusBar().addWidget(self.loading_label)
+        self.statusBar().addWidget(self.loading_bar)
+
+        self.loader_thread = QThread(self)
+        self.loader = LibraryLoader()
+        self.loader.moveToThread(self.loader_thread)
+        self.loader_thread.started.connect(self.loader.run)
+        self.loader.finished.connect(self.on_libraries_loaded)
+        self.loader.finished.connect(self.loader_thread.quit)
+        self.loader_thread.start()
+
+    def on_libraries_loaded(self):
+        """
+        Create the graphs and enable the buttons once SymPy and matplotlib are loaded.
+        """
+        from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+
+        from src.gui.plotting import BasinCanvas, GraphCanvas
+
         # Graph Visualization
         self.graph_display = GraphCanvas(self)
         self.graph_toolbar = NavigationToolbar(self.graph_display, self)
-        main_layout.addWidget(self.graph_toolbar)  # Add the toolbar to the main layout
+        self.main_layout.addWidget(self.graph_toolbar)  # Add the toolbar to the main layout
         # Set the toolbar's background color of the icons to red
         self.graph_toolbar.setStyleSheet("""
                 QToolButton {
@@ -344,17 +802,25 @@ class RootFinderApp(QMainWindow):
                     background-color: white;
                 }
             """)
+        self.splitter.addWidget(self.graph_display)
 
-        # Using QSplitter to allow resizing sections
-        splitter = QSplitter(Qt.Horizontal)
-        left_widget = QWidget()
-        left_widget.setLayout(main_layout)
-        splitter.addWidget(left_widget)
-        splitter.addWidget(self.graph_display)
+        # Basins of attraction, shown next to the graph once computed
+        self.basin_display = BasinCanvas(self)
+        self.basin_display.hide()
+        self.splitter.addWidget(self.basin_display)
 
-        self.setCentralWidget(splitter)
+        # Method comparison, computed in a background thread and shown in its own window
+        self.comparison_window = ComparisonWindow(self)
 
-        self.validate_input()
+        self.statusBar().removeWidget(self.loading_label)
+        self.statusBar().removeWidget(self.loading_bar)
+        self.statusBar().hide()
+        for button in (self.calculate_button, self.basins_button, self.critical_points_button, self.compare_button):
+            button.setEnabled(True)
+        self.libraries_loaded = True
+
+        # Show what was typed while loading
+        self.update_latex_display()
 
     def clear_inputs(self):
         """Clear all inputs and reset styles."""
@@ -364,7 +830,10 @@ class RootFinderApp(QMainWindow):
                 widget.clear()
                 widget.setStyleSheet("")
         # Clear the graph
-        self.graph_display.clear_graph()
+        if self.graph_display is not None:
+            self.graph_display.clear_graph()
+        self.curve_line = None
+        self.live_solver = None
 
     def reset_results(self):
         """Clear the result display."""
@@ -393,8 +862,8 @@ class RootFinderApp(QMainWindow):
         # 3. Additional parameter validation
         method = self.method_dropdown.currentText()
 
-        # 'a' and 'b' validation for Bisection and False Position
-        if method in ["Bisection", "False Position"]:
+        # 'a' and 'b' validation for the bracketing methods
+        if method in BRACKETING_METHODS:
             a_val, b_val = self.param_widgets['a'].text(), self.param_widgets['b'].text()
 
             # Reset styles first
@@ -410,8 +879,8 @@ class RootFinderApp(QMainWindow):
                 self.param_widgets['b'].setStyleSheet("border: 2px solid red;")
                 valid = False
 
-        # x0 validation for Newton and Modified Newton
-        if method in ["Newton", "Modified Newton"]:
+        # x0 validation for Newton, Modified Newton, Halley and Householder
+        if method in ["Newton", "Modified Newton", "Halley", "Householder"]:
             x0_val = self.param_widgets['x0'].text()
 
             # Reset style first
@@ -421,6 +890,13 @@ class RootFinderApp(QMainWindow):
                 self.param_widgets['x0'].setStyleSheet("border: 2px solid red;")
                 valid = False
 
+        # order validation for Householder (if provided)
+        if method == "Householder":
+            order_text = self.param_widgets['order'].text().strip()
+            if order_text and (not is_int(order_text) or int(order_text) < 1):
+                self.param_widgets['order'].setStyleSheet("border: 2px solid red;")
+                valid = False
+
         # x0, x1 validation for Secant
         if method == "Secant":
             x0_val, x1_val = self.param_widgets['x0'].text(), self.param_widgets['x1'].text()
@@ -483,7 +959,7 @@ class RootFinderApp(QMainWindow):
             return
 
         # Depending on the method, create the required input fields
-        if method in ["Bisection", "False Position"]:
+        if method in BRACKETING_METHODS:
             self.param_widgets['a_label'] = QLabel("a:")
             self.param_widgets['a'] = QLineEdit(self)
             self.param_widgets['a'].setPlaceholderText("Enter a here...")
@@ -499,7 +975,16 @@ class RootFinderApp(QMainWindow):
             self.additional_params_layout.addWidget(self.param_widgets['b_label'])
             self.additional_params_layout.addWidget(self.param_widgets['b'])
 
-        elif method in ["Modified Newton", "Newton"]:
+            if method == "False Position":
+                self.param_widgets['variant_label'] = QLabel("Variant:")
+                self.param_widgets['variant'] = QComboBox(self)
+                self.param_widgets['variant'].addItems([variant.title() for variant in VARIANTS])
+                self.param_widgets['variant'].currentTextChanged.connect(self.reset_results)
+
+                self.additional_params_layout.addWidget(self.param_widgets['variant_label'])
+                self.additional_params_layout.addWidget(self.param_widgets['variant'])
+
+        elif method in ["Modified Newton", "Newton", "Halley", "Householder"]:
             self.param_widgets['x0_label'] = QLabel("x0 (Initial Guess):")
             self.param_widgets['x0'] = QLineEdit(self)
             self.param_widgets['x0'].setPlaceholderText("Enter x0 here...")
@@ -508,6 +993,15 @@ class RootFinderApp(QMainWindow):
             self.additional_params_layout.addWidget(self.param_widgets['x0_label'])
             self.additional_params_layout.addWidget(self.param_widgets['x0'])
 
+            if method == "Householder":
+                self.param_widgets['order_label'] = QLabel("Order (Number of Derivatives):")
+                self.param_widgets['order'] = QLineEdit(self)
+                self.param_widgets['order'].setPlaceholderText("Default: 3")
+                self.param_widgets['order'].setText(current_values.get('order', ''))  # Restore value if it exists
+
+                self.additional_params_layout.addWidget(self.param_widgets['order_label'])
+                self.additional_params_layout.addWidget(self.param_widgets['order'])
+
         elif method == "Secant":
             self.param_widgets['x0_label'] = QLabel("x0 (First Initial Guess):")
             self.param_widgets['x0'] = QLineEdit(self)
@@ -566,196 +1060,338 @@ class RootFinderApp(QMainWindow):
         try:
             x_center = 0
             x_vals = np.linspace(x_center - 10, x_center + 10, 400)
-            y_vals = []
-            for val in x_vals:
-                try:
-                    y = eval(python_expr, {
-                        "x": val,
-                        "sqrt": math.sqrt,
-                        "sin": math.sin,
-                        "cos": math.cos,
-                        "tan": math.tan,
-                        "log": math.log,
-                        "pi": math.pi,
-                        "e": math.e
-                    })
-                    y_vals.append(y)
-                except ValueError:
-                    y_vals.append(float('nan'))
-
-            # Clear previous plots
-            self.graph_display.axes.clear()
-
-            # Adjust graph background and grid based on dark mode
-            self.graph_display.set_colors_based_on_theme()
-
-            # Plot the function
-            self.graph_display.axes.plot(x_vals, y_vals, 'r-', label=f"${latex_expr}$", linewidth=2, zorder=1)
-
-            # Set labels and legend
-            self.graph_display.axes.set_xlabel('x')
-            self.graph_display.axes.set_ylabel('f(x)')
-            self.graph_display.axes.legend()
-
-            # Draw the updated graph
-            self.graph_display.draw()
+            if self.parameter_sliders:
+                # Compiled once with the parameters as arguments, from the derivatives ExpressionWorker prepared, so
+                # that the sliders only evaluate it
+                self.live_solver = ParametricSolver(python_expr, x0=self.live_initial_guess())
+                y_vals = self.live_solver.curve(x_vals, self.parameter_values())
+            else:
+                self.live_solver = None
+                # Evaluate the whole range at once when the expression allows it
+                y_vals = evaluate_many(get_function(python_expr), x_vals)
+            self.draw_function_graph(x_vals, y_vals, latex_expr)
+            if self.live_solver is not None:
+                self.update_live_root()
 
         except Exception as e:
             self.graph_display.setText(f"Error while plotting: {str(e)}")
 
+    def draw_function_graph(self, x_vals, y_vals, latex_expr):
+        """
+        Draws the graph of a function from its values.
+        """
+        # Clear previous plots
+        self.graph_display.axes.clear()
+
+        # Adjust graph background and grid based on dark mode
+        self.graph_display.set_colors_based_on_theme()
+
+        # Plot the function
+        self.curve_line, = self.graph_display.axes.plot(x_vals, y_vals, 'r-', label=f"${latex_expr}$", linewidth=2,
+                                                        zorder=1)
+        self.live_root_marker = None
+
+        # Set labels and legend
+        self.graph_display.axes.set_xlabel('x')
+        self.graph_display.axes.set_ylabel('f(x)')
+        self.graph_display.axes.legend()
+
+        # Draw the updated graph
+        self.graph_display.draw()
+
+    def update_parameter_sliders(self, parameters):
+        """
+        Show one slider per parameter of the expression, keeping the values of the parameters that remain.
+        """
+        if tuple(self.parameter_sliders) == parameters:
+            return
+
+        values = dict(zip(self.parameter_sliders, self.parameter_values()))
+        for row, _, _ in self.parameter_sliders.values():
+            self.slider_layout.removeWidget(row)
+            row.deleteLater()
+        self.parameter_sliders = {}
+
+        for name in parameters:
+            row = QWidget(self)
+            row_layout = QHBoxLayout(row)
+            row_layout.setContentsMargins(0, 0, 0, 0)
+            label = QLabel(row)
+            label.setMinimumWidth(90)
+            slider = QSlider(Qt.Horizontal, row)
+            slider.setRange(*(bound * PARAMETER_STEPS_PER_UNIT for bound in PARAMETER_RANGE))
+            slider.setValue(round(values.get(name, PARAMETER_DEFAULT) * PARAMETER_STEPS_PER_UNIT))
+            label.setText(f"{name} = {slider.value() / PARAMETER_STEPS_PER_UNIT:.2f}")
+            slider.valueChanged.connect(self.on_parameter_changed)
+            row_layout.addWidget(label)
+            row_layout.addWidget(slider)
+            self.slider_layout.addWidget(row)
+            self.parameter_sliders[name] = (row, label, slider)
+
+    def parameter_values(self):
+        """
+        The current values of the parameter sliders, in the order of the parameters.
+        """
+        return [slider.value() / PARAMETER_STEPS_PER_UNIT for _, _, slider in self.parameter_sliders.values()]
+
+    def with_parameter_values(self, python_expr):
+        """
+        The expression with the current slider values in place of its parameters, for the one-off solves.
+        """
+        if not self.parameter_sliders:
+            return python_expr
+        return get_parsed_expression(python_expr).substitute(dict(zip(self.parameter_sliders,
+                                                                       self.parameter_values())))
+
+    def live_initial_guess(self):
+        """
+        The starting point of the live solve: the initial guess of the selected method, or the middle of its bracket.
+        """
+        if 'x0' in self.param_widgets and is_float(self.param_widgets['x0'].text()):
+            return float(self.param_widgets['x0'].text())
+        if 'a' in self.param_widgets and is_float(self.param_widgets['a'].text()) and \
+                is_float(self.param_widgets['b'].text()):
+            return (float(self.param_widgets['a'].text()) + float(self.param_widgets['b'].text())) / 2
+        return 0.0
+
+    def update_live_root(self):
+        """
+        Re-solve for the current parameter values, warm-started from the previous root, and mark the root.
+        """
+        values = self.parameter_values()
+        root = self.live_solver.solve(values)
+        settings = ", ".join(f"{name} = {value:.2f}" for name, value in zip(self.parameter_sliders, values))
+        if root is None:
+            self.results_display.setText(f"No root found from the previous root or x0 ({settings})")
+        else:
+            self.results_display.setText(f"Root: {root:.10g} ({settings})")
+
+        if self.live_root_marker is None:
+            self.live_root_marker = self.graph_display.axes.scatter([], [], color='#1E90FF', s=50, marker='x',
+                                                                    zorder=3)
+        self.live_root_marker.set_offsets(np.empty((0, 2)) if root is None else [[root, 0]])
+
+    def on_parameter_changed(self):
+        """
+        Re-solve and re-plot as a slider moves, updating only the data of the curve and the root marker.
+        """
+        for name, (_, label, slider) in self.parameter_sliders.items():
+            label.setText(f"{name} = {slider.value() / PARAMETER_STEPS_PER_UNIT:.2f}")
+        if self.live_solver is None or self.curve_line is None:
+            return
+        if self.calculation_thread is not None and self.calculation_thread.isRunning():
+            return
+
+        # The iterates of an earlier calculation belong to other parameter values
+        if self.iterate_line is not None:
+            self.iterate_line.remove()
+            self.iterate_line = None
+        if self.bracket_span is not None:
+            self.bracket_span.remove()
+            self.bracket_span = None
+
+        self.curve_line.set_ydata(self.live_solver.curve(self.curve_line.get_xdata(), self.parameter_values()))
+        self.update_live_root()
+        self.graph_display.draw_idle()
+
     def update_latex_display(self):
         """
-        Update the LaTeX display label with the current input.
+        Prepare the current input in the sandbox in a background thread, and display it once it is ready.
         """
+        # The display is updated once SymPy and matplotlib are loaded
+        if not self.libraries_loaded:
+            return
+
         # Get the current input
         expression = self.fx_input.text()
 
-        # Clear previous display
-        self.latex_display_image_label.clear()
-
         # Check if the input area is empty
         if not expression.strip():
+            self.prepared_input = None
             self.latex_display_image_label.clear()
             self.error_display_label.clear()
+            self.update_parameter_sliders(())
             self.fx_input.setStyleSheet("")  # Reset input border
             return
 
-        # Convert to LaTeX
-        try:
-            latex_expr, python_expr = convert_to_latex(expression)
-        except Exception as e:
-            self.error_display_label.setText(f"Error in conversion:\n{str(e)}")
-            self.latex_display_image_label.clear()
+        # One input is prepared at a time, and the latest one is prepared again once the thread is done
+        if self.expression_thread is not None and self.expression_thread.isRunning():
+            self.expression_outdated = True
+            return
+
+        self.expression_thread = QThread(self)
+        self.expression_worker = ExpressionWorker(expression)
+        self.expression_worker.moveToThread(self.expression_thread)
+        self.expression_thread.started.connect(self.expression_worker.run)
+        self.expression_worker.finished.connect(self.on_expression_prepared)
+        self.expression_worker.finished.connect(self.expression_thread.quit)
+        self.expression_thread.finished.connect(self.on_expression_thread_finished)
+        self.expression_thread.start()
+
+    def on_expression_thread_finished(self):
+        """
+        Prepare the input again if it changed, or the display was asked for, while the thread was busy.
+        """
+        if self.expression_outdated:
+            self.expression_outdated = False
+            self.update_latex_display()
+
+    def on_expression_prepared(self, expression, python_expr, latex_expr, error_msg):
+        """
+        Display the LaTeX of a prepared input and plot it, with a slider for every parameter.
+        """
+        # An input that was changed while it was prepared is prepared again
+        if expression != self.fx_input.text():
+            return
+
+        # Clear previous display
+        self.prepared_input = None
+        self.latex_display_image_label.clear()
+
+        if error_msg:
+            self.error_display_label.setText(f"Error in conversion:\n{error_msg}")
             self.fx_input.setStyleSheet("border: 2px solid red;")  # Set input border to red
+            self.validate_input()
             return
 
         # Render LaTeX using matplotlib and set to QLabel
         try:
-            fig, ax = plt.subplots(figsize=(5, 1))
-            text_color = 'white' if app.palette().color(QPalette.Window) == QColor(53, 53, 53) else 'black'
-            ax.text(0.5, 0.5, f'${latex_expr}$', size=20, va='center', ha='center', color=text_color)
-            ax.axis('off')
-            fig.patch.set_facecolor(self.palette().window().color().name())  # Set background color
-            buf = io.BytesIO()
-            plt.savefig(buf, format='png', bbox_inches='tight', pad_inches=0.1, transparent=True)
-            plt.close(fig)
-            buf.seek(0)
+            from src.gui.plotting import render_latex
+
             pixmap = QPixmap()
-            pixmap.loadFromData(buf.read())
+            pixmap.loadFromData(render_latex(latex_expr, self.palette().window().color().name()))
             self.latex_display_image_label.setPixmap(pixmap)
             self.error_display_label.clear()
             self.fx_input.setStyleSheet("")  # Reset input border
+            self.prepared_input = (expression, python_expr, latex_expr)
 
-            # Plot the graph
+            # Plot the graph, with a slider for every parameter
+            self.update_parameter_sliders(get_parsed_expression(python_expr).parameters)
             self.plot_function_graph(python_expr, latex_expr)
 
         except Exception as e:
             # If there's any error in rendering, display an error message directly without any LaTeX wrapping
             self.error_display_label.setText(f"Your current input is invalid:\n{str(e)}")
             self.fx_input.setStyleSheet("border: 2px solid red;")  # Set input border to red
+        self.validate_input()
+
+    def prepared_expression(self):
+        """
+        The Python expression and the LaTeX of the current input, or None while it is being prepared or if it is
+        invalid.
+        """
+        if self.prepared_input is None or self.prepared_input[0] != self.fx_input.text():
+            return None
+        return self.prepared_input[1:]
 
     def on_calculate_clicked(self):
         """
-        Calculate the root using the selected method.
+        Start the selected method in a background thread, or cancel the calculation that is running.
         """
+        if not self.libraries_loaded:
+            return
+
+        # While a calculation runs, the button cancels it
+        if self.calculation_thread is not None and self.calculation_thread.isRunning():
+            self.calculation_token.cancel()
+            return
+
         # If the inputs aren't valid, just return without doing anything
         if not self.validate_input():
             return
+        prepared = self.prepared_expression()
+        if prepared is None:
+            self.results_display.setText("The function is still being checked.")
+            return
 
         # Clear previous results and graph
         self.graph_display.clear_graph()
         self.results_display.clear()
+        self.iterate_line = None
+        self.bracket_span = None
 
         # Capture the user's function
-        latex_expr, python_expr = convert_to_latex(self.fx_input.text())
-
-        # Placeholder for results
-        root = None
-        iterations = None
-        error_msg = None
-
-        # Parameters to plot
-        plot_points = []
+        python_expr, self.calculation_latex = prepared
+        python_expr = self.with_parameter_values(python_expr)
 
         # Check the method selected
         method = self.method_dropdown.currentText()
-
-        # Get the functions and derivatives
-        f, df, ddf = get_function_and_derivatives(python_expr)
-
-        if method == "Bisection" or method == "False Position":
-            a = float(self.param_widgets['a'].text())
-            b = float(self.param_widgets['b'].text())
-            tol = float(self.param_widgets['tol'].text() or "1e-5")
-            max_iter = int(self.param_widgets['max_iter'].text() or "100")
-
-            plot_points.extend([a, b])
-
-            if method == "Bisection":
-                try:
-                    # Execute the bisection method
-                    root, iterations = bisection(f, a, b, tol, max_iter)
-                except ValueError as e:
-                    error_msg = str(e)
-            else:
-                try:
-                    # Execute the false position method
-                    root, iterations = false_position(f, a, b, tol, max_iter)
-                except ValueError as e:
-                    error_msg = str(e)
-
-        elif method == "Newton" or method == "Modified Newton":
-            x0 = float(self.param_widgets['x0'].text())
-            plot_points.append(x0)
-            tol = float(self.param_widgets['tol'].text() or "1e-5")
-            max_iter = int(self.param_widgets['max_iter'].text() or "100")
-
-            if method == "Newton":
-                try:
-                    # Execute the Newton method
-                    root, iterations = newton(f, df, x0, tol, max_iter)
-                except ValueError as e:
-                    error_msg = str(e)
-            else:
-                try:
-                    # Execute the modified Newton method
-                    root, iterations = modified_newton(f, df, ddf, x0, tol, max_iter)
-                except ValueError as e:
-                    error_msg = str(e)
-
+        params = {
+            "tol": float(self.param_widgets['tol'].text() or "1e-5"),
+            "max_iter": int(self.param_widgets['max_iter'].text() or "100"),
+        }
+        if method in BRACKETING_METHODS:
+            params["a"] = float(self.param_widgets['a'].text())
+            params["b"] = float(self.param_widgets['b'].text())
+            params["plot_points"] = [params["a"], params["b"]]
+            if method == "False Position":
+                params["variant"] = self.param_widgets['variant'].currentText().lower()
         elif method == "Secant":
-            x0 = float(self.param_widgets['x0'].text())
-            x1 = float(self.param_widgets['x1'].text())
-            plot_points.extend([x0, x1])
-            tol = float(self.param_widgets['tol'].text() or "1e-5")
-            max_iter = int(self.param_widgets['max_iter'].text() or "100")
-
-            try:
-                # Execute the Secant method
-                root, iterations = secant(f, x0, x1, tol, max_iter)
-            except ValueError as e:
-                error_msg = str(e)
-
-        results_msg = f"Root: {root}\nIterations: {iterations}"
-
-        # Plot the graph
-        self.plot_function_graph(python_expr, latex_expr)
-
-        # Plotting parameters on the graph
-        for idx, point in enumerate(plot_points):
-            y_value = eval(python_expr, {
-                "x": point,
-                "sqrt": math.sqrt,
-                "sin": math.sin,
-                "cos": math.cos,
-                "tan": math.tan,
-                "log": math.log,
-                "pi": math.pi,
-                "e": math.e
-            })
+            params["x0"] = float(self.param_widgets['x0'].text())
+            params["x1"] = float(self.param_widgets['x1'].text())
+            params["plot_points"] = [params["x0"], params["x1"]]
+        else:
+            params["x0"] = float(self.param_widgets['x0'].text())
+            params["plot_points"] = [params["x0"]]
+            if method == "Householder":
+                params["order"] = int(self.param_widgets['order'].text() or "3")
+
+        # Stop the solve once the time limit is reached, or when the button is clicked again
+        self.calculation_token = CancellationToken()
+        limits = {"deadline": time.monotonic() + SOLVE_TIME_LIMIT, "cancel_token": self.calculation_token}
+
+        self.calculation_thread = QThread(self)
+        self.calculation_worker = CalculationWorker(python_expr, method, params, limits)
+        self.calculation_worker.moveToThread(self.calculation_thread)
+        self.calculation_thread.started.connect(self.calculation_worker.run)
+        self.calculation_worker.curve_ready.connect(self.on_curve_ready)
+        self.calculation_worker.progress.connect(self.on_calculation_progress)
+        self.calculation_worker.finished.connect(self.on_calculation_finished)
+        self.calculation_worker.finished.connect(self.calculation_thread.quit)
+
+        self.calculate_button.setText("Cancel")
+        self.results_display.setText("Calculating...")
+        self.calculation_thread.start()
+
+    def on_curve_ready(self, x_vals, y_vals, points):
+        """
+        Plot the function and the starting points of a calculation.
+        """
+        self.draw_function_graph(x_vals, y_vals, self.calculation_latex)
+        for idx, (point, y_value) in enumerate(points):
             # Limit to 2 decimal places
             self.graph_display.axes.scatter(point, y_value, color='#FFA500', s=50, zorder=2,
                                             label=f"Point {idx + 1}:({point:.2f}, {y_value:.2f})")
+        self.graph_display.draw_idle()
+
+    def on_calculation_progress(self, states):
+        """
+        Add the latest iterates of a running calculation to the graph, with the current bracket shaded.
+        """
+        xs = [state["x"] for state in states[-MAX_DRAWN_ITERATES:]]
+        ys = [state["fx"] for state in states[-MAX_DRAWN_ITERATES:]]
+        if self.iterate_line is None:
+            self.iterate_line, = self.graph_display.axes.plot(xs, ys, 'o-', color='#1E90FF', alpha=0.6, markersize=4,
+                                                              linewidth=1, zorder=2, label="Iterates")
+        else:
+            self.iterate_line.set_data(np.append(self.iterate_line.get_xdata(), xs)[-MAX_DRAWN_ITERATES:],
+                                       np.append(self.iterate_line.get_ydata(), ys)[-MAX_DRAWN_ITERATES:])
+
+        if "a" in states[-1]:
+            if self.bracket_span is not None:
+                self.bracket_span.remove()
+            self.bracket_span = self.graph_display.axes.axvspan(states[-1]["a"], states[-1]["b"], color='#FFA500',
+                                                                alpha=0.15, zorder=0)
+
+        self.results_display.setText(f"Iteration {states[-1]['n']}: x = {states[-1]['x']}")
+        self.graph_display.draw_idle()
+
+    def on_calculation_finished(self, root, iterations, error_msg):
+        """
+        Show the result of a calculation once the background thread is done.
+        """
+        self.calculate_button.setText("Calculate")
+        latex_expr = self.calculation_latex
 
         # If root is found, plot it
         if root is not None:
@@ -785,7 +1421,141 @@ class RootFinderApp(QMainWindow):
         if error_msg:
             self.results_display.setText(f"Error: {error_msg}")
         else:
-            self.results_display.setText(results_msg)
+            self.results_display.setText(f"Root: {root}\nIterations: {iterations}")
+
+    def closeEvent(self, event):
+        # Stop a calculation that is still running, and wait for its thread to end
+        if self.calculation_thread is not None and self.calculation_thread.isRunning():
+            self.calculation_token.cancel()
+            self.calculation_thread.wait()
+        super().closeEvent(event)
+
+    def on_basins_clicked(self):
+        """
+        Compute and display the basins of attraction of Newton's method in the complex plane.
+        """
+        prepared = self.prepared_expression()
+        if prepared is None:
+            return
+
+        # Cover the visible x-range of the graph, with a square region of the complex plane
+        re_range = self.graph_display.axes.get_xlim()
+        half_width = (re_range[1] - re_range[0]) / 2
+        im_range = (-half_width, half_width)
+        max_iter = 50
+
+        try:
+            # The function with the slider values, and its derivatives, are prepared in the sandbox
+            python_expr = self.with_parameter_values(prepared[0])
+            prepare_expression(python_expr, order=2)
+            f, df, _ = get_vectorized_function_and_derivatives(python_expr)
+            root_index, iterations, roots = newton_basins_grid(f, df, re_range, im_range, (400, 400),
+                                                               max_iter=max_iter,
+                                                               deadline=time.monotonic() + SOLVE_TIME_LIMIT)
+        except Exception as e:
+            self.results_display.setText(f"Error while computing basins: {str(e)}")
+            return
+
+        self.basin_display.plot_basins(root_index, iterations, roots, re_range, im_range, max_iter)
+        self.basin_display.show()
+
+        roots_msg = "\n".join(f"  {root:.6g}" for root in roots)
+        self.results_display.setText(f"Roots found in the complex plane:\n{roots_msg}")
+
+    def on_critical_points_clicked(self):
+        """
+        Find the extrema and inflection points of the function in the visible x-range and mark them on the graph.
+        """
+        prepared = self.prepared_expression()
+        if prepared is None:
+            return
+
+        a, b = self.graph_display.axes.get_xlim()
+        try:
+            # The function with the slider values, and its derivatives, are prepared in the sandbox
+            python_expr = self.with_parameter_values(prepared[0])
+            prepare_expression(python_expr, order=2)
+            f, df, ddf = get_vectorized_function_and_derivatives(python_expr)
+            minima, maxima, inflections = critical_points(f, df, ddf, a, b)
+        except Exception as e:
+            self.results_display.setText(f"Error while finding critical points: {str(e)}")
+            return
+
+        self.graph_display.annotate_critical_points(minima, maxima, inflections, f)
+
+        lines = []
+        for name, points in (("Minima", minima), ("Maxima", maxima), ("Inflection points", inflections)):
+            values = ", ".join(f"{point:.6g}" for point in points) or "none"
+            lines.append(f"{name}: {values}")
+        self.results_display.setText(f"Critical points on [{a:.6g}, {b:.6g}]:\n" + "\n".join(lines))
+
+    def on_compare_clicked(self):
+        """
+        Run all the applicable methods on the current function in a background thread and compare them.
+        """
+        if not self.validate_input():
+            self.results_display.setText("Enter a function, a method and its parameters to compare the methods.")
+            return
+        if self.comparison_thread is not None and self.comparison_thread.isRunning():
+            return
+        prepared = self.prepared_expression()
+        if prepared is None:
+            self.results_display.setText("The function is still being checked.")
+            return
+
+        python_expr = self.with_parameter_values(prepared[0])
+
+        # The bracket or starting points entered for the selected method are shared by all the methods
+        params = {
+            "tol": float(self.param_widgets['tol'].text() or "1e-5"),
+            "max_iter": int(self.param_widgets['max_iter'].text() or "100"),
+            "deadline": time.monotonic() + SOLVE_TIME_LIMIT,
+            "cancel_token": CancellationToken(),
+        }
+        if 'a' in self.param_widgets:
+            params["bracket"] = (float(self.param_widgets['a'].text()), float(self.param_widgets['b'].text()))
+        else:
+            params["x0"] = float(self.param_widgets['x0'].text())
+            if 'x1' in self.param_widgets:
+                params["x1"] = float(self.param_widgets['x1'].text())
+        self.comparison_window.cancel_token = params["cancel_token"]
+
+        self.comparison_thread = QThread(self)
+        self.comparison_worker = ComparisonWorker(python_expr, params)
+        self.comparison_worker.moveToThread(self.comparison_thread)
+        self.comparison_thread.started.connect(self.comparison_worker.run)
+        self.comparison_worker.finished.connect(self.on_comparison_finished)
+        self.comparison_worker.finished.connect(self.comparison_thread.quit)
+
+        self.compare_button.setEnabled(False)
+        self.results_display.setText("Comparing methods...")
+        self.comparison_thread.start()
+
+    def on_comparison_finished(self, results, error_msg):
+        """
+        Show the comparison once the background thread is done.
+        """
+        self.compare_button.setEnabled(True)
+        self.comparison_window.cancel_token = None
+        if error_msg:
+            self.results_display.setText(f"Error: {error_msg}")
+            return
+
+        self.comparison_window.show_results(results)
+        self.comparison_window.show()
+        best = min((result for result in results if not result["error"]), key=lambda result: result["evaluations"],
+                   default=None)
+        if best is None:
+            self.results_display.setText("No method converged.")
+        else:
+            self.results_display.setText(f"Fewest evaluations: {best['method']} ({best['evaluations']})")
+
+    def on_batch_clicked(self):
+        """
+        Open the batch panel.
+        """
+        self.batch_panel.show()
+        self.batch_panel.raise_()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,187 @@
+"""Matplotlib widgets of the GUI.
+
+Matplotlib is slow to import, so main_gui loads this module in a background thread once the window is shown.
+"""
+import io
+
+import matplotlib
+import numpy as np
+from PyQt5.QtGui import QColor, QPalette
+from PyQt5.QtWidgets import QApplication, QWidget
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+from matplotlib.figure import Figure
+
+
+def is_dark_mode():
+    """Check whether the application uses the dark palette."""
+    return QApplication.instance().palette().color(QPalette.Window) == QColor(53, 53, 53)
+
+
+def render_latex(latex_expr, background):
+    """Render a LaTeX expression to PNG data, in the text color of the current theme.
+
+    Parameters:
+    - latex_expr (str): The LaTeX to render.
+    - background (str): The background color of the image.
+
+    Returns:
+    - bytes: The PNG image.
+    """
+    fig = Figure(figsize=(5, 1))
+    ax = fig.add_subplot(111)
+    text_color = 'white' if is_dark_mode() else 'black'
+    ax.text(0.5, 0.5, f'${latex_expr}$', size=20, va='center', ha='center', color=text_color)
+    ax.axis('off')
+    fig.patch.set_facecolor(background)
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', bbox_inches='tight', pad_inches=0.1, transparent=True)
+    return buf.getvalue()
+
+
+class GraphCanvas(FigureCanvas):
+    def __init__(self, parent=None, width=5, height=4, dpi=100):
+        self.parent = parent
+        fig = Figure(figsize=(width, height), dpi=dpi)
+        self.axes = fig.add_subplot(111)
+
+        super(GraphCanvas, self).__init__(fig)
+
+        self.toolbar = self.get_toolbar()
+        if self.toolbar:
+            configure_subplots_action = next(
+                (action for action in self.toolbar.actions() if action.text() == "Customize"), None)
+            if configure_subplots_action:
+                self.toolbar.removeAction(configure_subplots_action)
+
+        # Set initial colors
+        self.set_colors_based_on_theme()
+
+    def get_toolbar(self):
+        """Get the navigation toolbar."""
+        for widget in self.parent.findChildren(QWidget):
+            if isinstance(widget, NavigationToolbar):
+                # Remove the "Configure subplots" button
+                for action in widget.actions():
+                    if action.iconText() == 'Subplots':
+                        widget.removeAction(action)
+                return widget
+        return None
+
+    def set_colors_based_on_theme(self):
+        """Adjust graph colors based on the application's theme."""
+        if is_dark_mode():  # Dark mode
+            self.figure.set_facecolor('black')
+            self.axes.set_facecolor('black')
+            self.axes.grid(color='gray')
+            self.axes.spines['bottom'].set_color('gray')
+            self.axes.spines['top'].set_color('gray')
+            self.axes.spines['left'].set_color('gray')
+            self.axes.spines['right'].set_color('gray')
+            self.axes.tick_params(axis='x', colors='gray')
+            self.axes.tick_params(axis='y', colors='gray')
+            self.axes.yaxis.label.set_color('gray')
+            self.axes.xaxis.label.set_color('gray')
+            self.axes.axhline(color='white', linewidth=1)  # Horizontal line (y-axis)
+            self.axes.axvline(color='white', linewidth=1)  # Vertical line (x-axis)
+
+        else:  # Light mode
+            self.figure.set_facecolor('white')
+            self.axes.set_facecolor('white')
+            self.axes.grid(color='lightgray')
+            self.axes.spines['bottom'].set_color('black')
+            self.axes.spines['top'].set_color('black')
+            self.axes.spines['left'].set_color('black')
+            self.axes.spines['right'].set_color('black')
+            self.axes.tick_params(axis='x', colors='black')
+            self.axes.tick_params(axis='y', colors='black')
+            self.axes.yaxis.label.set_color('black')
+            self.axes.xaxis.label.set_color('black')
+            self.setStyleSheet("")
+            self.axes.axhline(color='black', linewidth=1)  # Horizontal line (y-axis)
+            self.axes.axvline(color='black', linewidth=1)  # Vertical line (x-axis)
+
+    def refresh_style(self):
+        """Refresh the graph's appearance based on the application theme."""
+        self.set_colors_based_on_theme()
+        self.draw()
+
+    def clear_graph(self):
+        """Clear the graph and reset the appearance."""
+        self.axes.clear()
+        self.set_colors_based_on_theme()
+        self.draw()
+
+    def annotate_critical_points(self, minima, maxima, inflections, f):
+        """Mark the extrema and inflection points of the plotted function f on the graph."""
+        markers = ((minima, 'v', '#2E8B57', "Minimum"), (maxima, '^', '#8A2BE2', "Maximum"),
+                   (inflections, 'D', '#DAA520', "Inflection point"))
+        for points, marker, color, label in markers:
+            if len(points):
+                self.axes.scatter(points, f(points), marker=marker, color=color, s=50, zorder=3, label=label)
+        self.axes.legend(loc='upper left')
+        self.draw()
+
+
+class BasinCanvas(FigureCanvas):
+    def __init__(self, parent=None, width=5, height=4, dpi=100):
+        self.parent = parent
+        fig = Figure(figsize=(width, height), dpi=dpi)
+        self.axes = fig.add_subplot(111)
+
+        super(BasinCanvas, self).__init__(fig)
+
+    def plot_basins(self, root_index, iterations, roots, re_range, im_range, max_iter):
+        """Render the basins of attraction, one color per root, darker where more iterations were needed."""
+        colors = matplotlib.colormaps['tab10'](np.arange(max(len(roots), 1)) % 10)[:, :3]
+        converged = root_index >= 0
+        shade = 1 - 0.7 * iterations / max_iter
+
+        # Points that did not converge are left black
+        image = np.zeros(root_index.shape + (3,))
+        image[converged] = colors[root_index[converged]] * shade[converged, None]
+
+        self.axes.clear()
+        if is_dark_mode():  # Dark mode
+            self.figure.set_facecolor('black')
+            self.axes.tick_params(axis='x', colors='gray')
+            self.axes.tick_params(axis='y', colors='gray')
+            self.axes.title.set_color('white')
+        else:  # Light mode
+            self.figure.set_facecolor('white')
+            self.axes.tick_params(axis='x', colors='black')
+            self.axes.tick_params(axis='y', colors='black')
+            self.axes.title.set_color('black')
+
+        self.axes.imshow(image, origin='lower', extent=(*re_range, *im_range), aspect='auto')
+        self.axes.scatter(roots.real, roots.imag, color='white', marker='x', s=50, zorder=2)
+        self.axes.set_xlim(*re_range)
+        self.axes.set_ylim(*im_range)
+        self.axes.set_xlabel('Re(z)')
+        self.axes.set_ylabel('Im(z)')
+        self.axes.set_title("Newton basins of attraction")
+        self.draw()
+
+
+class ConvergenceCanvas(FigureCanvas):
+    def __init__(self, parent=None, width=5, height=4, dpi=100):
+        self.parent = parent
+        fig = Figure(figsize=(width, height), dpi=dpi)
+        self.axes = fig.add_subplot(111)
+
+        super(ConvergenceCanvas, self).__init__(fig)
+
+    def plot_histories(self, results):
+        """Overlay the |f(x)| histories of compared methods on a log scale."""
+        self.axes.clear()
+        for result in results:
+            # Exact zeros cannot be shown on a log scale
+            history = [value for value in result["history"] if value > 0]
+            if history:
+                self.axes.semilogy(range(1, len(history) + 1), history, marker='.', label=result["method"])
+        self.axes.set_xlabel('Iteration')
+        self.axes.set_ylabel('|f(x)|')
+        self.axes.set_title("Convergence history")
+        if self.axes.get_legend_handles_labels()[0]:
+            self.axes.legend(loc='upper right', fontsize='small')
+        self.draw()
@@ -0,0 +1,79 @@
+import os
+
+import numpy as np
+
+from src.utils.finite_difference import wrap_functions
+from src.utils.result_store import (RESULT_DTYPE, STATUS_BUDGET_EXHAUSTED, STATUS_CANCELLED, STATUS_CONVERGED,
+                                    STATUS_DEADLINE_EXCEEDED, STATUS_FAILED, open_result_file, write_chunked)
+from src.utils.solve_limits import BudgetExhausted, Cancelled, DeadlineExceeded, SolverStopped
+
+# Status of the problems stopped by each limit
+STOPPED_STATUS = {BudgetExhausted: STATUS_BUDGET_EXHAUSTED, DeadlineExceeded: STATUS_DEADLINE_EXCEEDED,
+                  Cancelled: STATUS_CANCELLED}
+
+
+def solve_batch(solver, f, params, derivatives=(), out=None, chunk_size=65536, flush_every=16, **kwargs):
+    """Solve the same function for many starting points or brackets.
+
+    Results are produced in chunks and written straight into a structured array, which can be a memory-mapped .npy
+    file. An existing file is resumed from its first incomplete chunk.
+
+    Parameters:
+    - solver (function): The solver to use, such as newton or bisection.
+    - f (function): Function to find the roots of.
+    - params (array_like): One row per problem with the solver's parameters that follow the functions, for example
+      (a, b) for bisection or x0 for newton.
+    - derivatives (tuple of function): The derivatives the solver takes after f, for example (df,) for newton.
+    - out (str or ndarray, optional): The path of a .npy result file, or a preallocated array with RESULT_DTYPE.
+    - chunk_size (int): The number of problems solved and written at once.
+    - flush_every (int): The number of chunks between flushes of a memory-mapped result file.
+    - **kwargs: Further arguments for the solver, such as tol, max_iter or the max_fev, deadline and cancel_token
+      limits. A problem stopped by a limit gets its own status and the best iterate as its root. The deadline and the
+      cancellation stop the whole batch: the remaining problems stay pending, and running the same call again
+      resumes with the stopped problem.
+
+    Returns:
+    - results (ndarray): Structured array with RESULT_DTYPE, holding the root, the number of iterations, the number of
+      evaluations of f and its derivatives, and the status of every problem.
+    """
+    params = np.asarray(params, dtype=float)
+    if params.ndim == 1:
+        params = params[:, None]
+
+    # Count the evaluations of the function and its derivatives
+    nfev = 0
+
+    def counted(func):
+        def wrapper(x):
+            nonlocal nfev
+            nfev += 1
+            return func(x)
+
+        return wrapper
+
+    # A finite-difference derivative counts every evaluation of f it makes
+    funcs = wrap_functions([f, *derivatives], counted)
+
+    def compute_chunk(start, stop):
+        nonlocal nfev
+        results = np.zeros(stop - start, dtype=RESULT_DTYPE)
+        for idx, row in enumerate(params[start:stop].tolist()):
+            nfev = 0
+            try:
+                root, n = solver(*funcs, *row, **kwargs)
+                results[idx] = (root, n, nfev, STATUS_CONVERGED)
+            except SolverStopped as e:
+                best = np.nan if e.x is None else e.x
+                results[idx] = (best, -1, nfev, STOPPED_STATUS[type(e)])
+                if isinstance(e, (Cancelled, DeadlineExceeded)):
+                    break
+            except (ValueError, ArithmeticError):
+                results[idx] = (np.nan, -1, nfev, STATUS_FAILED)
+        return results
+
+    if out is None:
+        out = np.zeros(len(params), dtype=RESULT_DTYPE)
+    elif isinstance(out, (str, os.PathLike)):
+        out = open_result_file(out, len(params))
+
+    return write_chunked(out, compute_chunk, chunk_size, flush_every)
@@ -0,0 +1,39 @@
+import numpy as np
+
+
+def cluster_roots(values, tol, centers=None):
+    """Group approximate roots that lie within a tolerance of each other.
+
+    Each value is assigned to the first known center within tol of it. Values that match no center start new
+    clusters, whose centers are the mean of their members. Values that are not finite belong to no cluster.
+
+    Parameters:
+    - values (array_like): Approximate roots, real or complex.
+    - tol (float): The distance within which two approximations are considered the same root.
+    - centers (array_like, optional): Previously found roots to match against first.
+
+    Returns:
+    - centers (ndarray): The distinct roots, starting with the given centers.
+    - labels (ndarray): For each value, the index of its root in centers, or -1 if the value is not finite.
+    """
+    values = np.asarray(values).ravel()
+    centers = [] if centers is None else list(centers)
+    labels = np.full(values.size, -1, dtype=np.int64)
+    remaining = np.flatnonzero(np.isfinite(values))
+
+    # Match the values against the known centers first
+    for idx, center in enumerate(centers):
+        close = np.abs(values[remaining] - center) <= tol
+        labels[remaining[close]] = idx
+        remaining = remaining[~close]
+
+    # Start a new cluster from each value that is still unmatched, which always takes at least that value
+    while remaining.size:
+        close = np.abs(values[remaining] - values[remaining[0]]) <= tol
+        close[0] = True
+        members = remaining[close]
+        labels[members] = len(centers)
+        centers.append(values[members].mean())
+        remaining = remaining[~close]
+
+    return np.array(centers, dtype=values.dtype), labels
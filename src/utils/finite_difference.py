@@ -0,0 +1,135 @@
+import math
+
+import numpy as np
+
+# Ridders' extrapolation: each step shrinks h by CON, and at most NTAB steps are taken
+CON = 1.4
+NTAB = 10
+
+
+def _central_difference(f, x, h, order):
+    """Central difference approximation of the derivative of the given order, with an error of order h**2.
+
+    The stencil has order + 1 points spaced h apart and centered on x.
+    """
+    total = 0
+    for j in range(order + 1):
+        total = total + (-1) ** j * math.comb(order, j) * f(x + (order / 2 - j) * h)
+    return total / h ** order
+
+
+def derivative(f, x, order=1, h=None):
+    """Approximate a derivative of f at x with central differences and Ridders' extrapolation.
+
+    The step is adapted automatically: central differences are taken with steps shrinking from h, and extrapolated
+    to a zero step with a Neville tableau. The estimate with the smallest error is kept, and the extrapolation stops
+    once the error starts to grow because of rounding. Arrays of points are handled elementwise when f is vectorized.
+
+    Parameters:
+    - f (function): The function to differentiate.
+    - x (float, complex or ndarray): The point(s) at which to differentiate.
+    - order (int): The order of the derivative.
+    - h (float, optional): The initial step. Defaults to a tenth of the scale of x.
+
+    Returns:
+    - d (float, complex or ndarray): The approximate derivative at x.
+
+    Raises:
+    - ValueError: If the order is not positive.
+    """
+    if order < 1:
+        raise ValueError("The order of the derivative must be at least 1.")
+    if h is None:
+        h = 0.1 * np.maximum(1.0, np.abs(x))
+
+    # The first column of the tableau holds differences with ever smaller steps, the others their extrapolations
+    previous = [_central_difference(f, x, h, order)]
+    best = previous[0]
+    error = np.inf
+    for i in range(1, NTAB):
+        h = h / CON
+        current = [_central_difference(f, x, h, order)]
+        factor = CON ** 2
+        for j in range(1, i + 1):
+            current.append((current[j - 1] * factor - previous[j - 1]) / (factor - 1))
+            factor *= CON ** 2
+
+            # Keep the extrapolation that agrees best with its neighbours
+            step_error = np.maximum(np.abs(current[j] - current[j - 1]), np.abs(current[j] - previous[j - 1]))
+            improved = step_error <= error
+            best = np.where(improved, current[j], best)
+            error = np.where(improved, step_error, error)
+
+        # Stop once the higher orders are dominated by rounding
+        if np.all(np.abs(current[i] - previous[i - 1]) >= 2 * error):
+            break
+        previous = current
+
+    best = np.asarray(best)
+    return best.item() if best.ndim == 0 else best
+
+
+def finite_difference(f, order=1):
+    """Returns a function that approximates a derivative of f, for functions without a symbolic form.
+
+    Parameters:
+    - f (function): The function to differentiate.
+    - order (int): The order of the derivative.
+
+    Returns:
+    - df (function): The approximate derivative, computed with derivative(). Its finite_difference_of attribute holds
+      f and the order, so that wrap_functions can count the evaluations of f it makes.
+    """
+    def df(x):
+        return derivative(f, x, order)
+
+    df.finite_difference_of = (f, order)
+    return df
+
+
+def wrap_functions(funcs, wrap):
+    """Apply a wrapper, such as one that counts evaluations, to a function and its derivatives.
+
+    A derivative made by finite_difference is rebuilt on the wrapped functions instead of being wrapped itself, so
+    that every evaluation of the function it makes goes through the wrapper.
+
+    Parameters:
+    - funcs (list of function): The function, followed by any derivatives.
+    - wrap (function): Maps a function to its wrapped version.
+
+    Returns:
+    - list of function: The wrapped functions, in the same order.
+    """
+    wrapped = [wrap(funcs[0])]
+    for func in funcs[1:]:
+        source = getattr(func, "finite_difference_of", None)
+        if source is None:
+            wrapped.append(wrap(func))
+        else:
+            g, order = source
+            wrapped.append(finite_difference(wrapped[0] if g is funcs[0] else wrap(g), order))
+    return wrapped
+
+
+def finite_difference_jacobian(F):
+    """Returns a function that approximates the Jacobian matrix of a vector function with central differences.
+
+    Each column costs two evaluations of F, with a step scaled to the magnitude of its variable.
+
+    Parameters:
+    - F (function): Maps an array of variable values to the array of component values.
+
+    Returns:
+    - J (function): Maps an array of variable values to the approximate Jacobian matrix.
+    """
+    def J(x):
+        x = np.array(x, dtype=float)
+        columns = []
+        for j in range(x.size):
+            h = np.finfo(float).eps ** (1 / 3) * max(1.0, abs(x[j]))
+            step = np.zeros_like(x)
+            step[j] = h
+            columns.append((np.asarray(F(x + step), dtype=float) - np.asarray(F(x - step), dtype=float)) / (2 * h))
+        return np.column_stack(columns)
+
+    return J
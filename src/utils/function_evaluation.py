@@ -1,58 +1,248 @@
+import functools
 import math
 
-from src.utils.symbolic_diff import compute_derivative
+import numpy as np
+
+from src.utils.finite_difference import finite_difference, finite_difference_jacobian
+from src.utils.parsed_expression import get_parsed_expression
+from src.utils.solve_limits import SolverStopped
+from src.utils.symbolic_diff import compute_jacobian
+
+# Points at which a callable is probed to find out whether it accepts arrays
+VECTORIZATION_PROBE = np.array([0.25, 0.75, 1.5])
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_vectorized(f):
+    """Probe a callable with an array and with its elements, as described in is_vectorized."""
+    try:
+        expected = [f(value) for value in VECTORIZATION_PROBE.tolist()]
+    except (TypeError, ValueError, ArithmeticError):
+        return False
+    try:
+        values = np.asarray(f(VECTORIZATION_PROBE))
+    except (TypeError, ValueError, ArithmeticError):
+        return False
+    return values.shape == VECTORIZATION_PROBE.shape and np.allclose(values, expected, equal_nan=True)
+
+
+def is_vectorized(f):
+    """Check whether a callable evaluates whole arrays elementwise.
+
+    The callable is called once with a small array and once per element of it, and is considered vectorized when
+    both give the same values. Callables that fail on the probe points are treated as scalar-only. The result is kept
+    for the most recently checked callables, so an expensive callable is only probed once.
+
+    Parameters:
+    - f (function): The callable to check.
+
+    Returns:
+    - bool: Whether f accepts arrays.
+    """
+    try:
+        return _probe_vectorized(f)
+    except TypeError:
+        # Unhashable callables cannot be kept, and are probed every time
+        return _probe_vectorized.__wrapped__(f)
+
+
+def as_vectorized(f, vectorized=None):
+    """Returns a version of a callable that evaluates arrays elementwise.
+
+    A callable that is already vectorized is returned unchanged. Otherwise, the returned function loops over the
+    elements in Python.
+
+    Parameters:
+    - f (function): The callable to vectorize.
+    - vectorized (bool, optional): Whether f accepts arrays. Checked with is_vectorized when not given.
+
+    Returns:
+    - f (function): The vectorized callable.
+    """
+    if is_vectorized(f) if vectorized is None else vectorized:
+        return f
+
+    def vectorized(x):
+        x = np.asarray(x)
+        if x.size == 0:
+            return np.empty(x.shape, dtype=np.result_type(x.dtype, float))
+        return np.array([f(value) for value in x.ravel().tolist()]).reshape(x.shape)
+
+    return vectorized
+
+
+def evaluate_many(f, xs, vectorized=None):
+    """Evaluate a function at many points, with one array evaluation when the function is vectorized.
+
+    Points where a scalar-only function raises a domain error get NaN, as do invalid results of array evaluation. A
+    function wrapped by limit_evaluations stops the evaluation when it reaches a limit.
+
+    Parameters:
+    - f (function): The function to evaluate.
+    - xs (ndarray): The points at which to evaluate it.
+    - vectorized (bool, optional): Whether f accepts arrays. Checked with is_vectorized when not given.
+
+    Returns:
+    - ndarray: The function values.
+
+    Raises:
+    - BudgetExhausted, DeadlineExceeded, Cancelled: If f is limited and reaches a limit.
+    """
+    xs = np.asarray(xs)
+    if is_vectorized(f) if vectorized is None else vectorized:
+        with np.errstate(all="ignore"):
+            return np.broadcast_to(np.asarray(f(xs), dtype=float), xs.shape)
+
+    values = []
+    for value in xs.ravel().tolist():
+        try:
+            values.append(f(value))
+        except SolverStopped:
+            raise
+        except (ValueError, ArithmeticError):
+            values.append(float('nan'))
+    return np.array(values, dtype=float).reshape(xs.shape)
 
 
 def get_function_and_derivatives(expr):
     """Returns the function, first derivative, and second derivative of the given expression.
 
     Parameters:
-    - expr (str): A string representing a mathematical expression.
+    - expr (str or function): A string representing a mathematical expression, or a callable whose derivatives are
+      approximated with finite differences.
 
     Returns:
     - f (function): The function represented by the expression.
     - df (function): The first derivative of the function.
     - ddf (function): The second derivative of the function.
     """
-    f_str = expr
-    df_str = compute_derivative(expr)
-    ddf_str = compute_derivative(df_str)
+    if callable(expr):
+        return expr, finite_difference(expr, 1), finite_difference(expr, 2)
 
-    eval_context = {"x": None}
-    eval_context.update(math.__dict__)
+    f, df, ddf = get_parsed_expression(expr).derivatives(2)
+    return f.function, df.function, ddf.function
 
-    def f(x):
-        eval_context["x"] = x
-        return eval(f_str, eval_context)
 
-    def df(x):
-        eval_context["x"] = x
-        return eval(df_str, eval_context)
+def get_function(expr):
+    """Returns the function represented by the given expression.
 
-    def ddf(x):
-        eval_context["x"] = x
-        return eval(ddf_str, eval_context)
+    Parameters:
+    - expr (str or function): A string representing a mathematical expression, or a callable that is returned as is.
 
-    return f, df, ddf
+    Returns:
+    - f (function): The function represented by the expression.
+    """
+    if callable(expr):
+        return expr
 
+    return get_parsed_expression(expr).function
 
-def get_function(expr):
-    """Returns the function represented by the given expression.
+
+def get_function_and_higher_derivatives(expr, order):
+    """Returns the function and its derivatives up to the given order.
+
+    Each derivative is differentiated from the previous one, and everything is compiled once and shared through
+    get_parsed_expression.
 
     Parameters:
-    - expr (str): A string representing a mathematical expression.
+    - expr (str or function): A string representing a mathematical expression, or a callable whose derivatives are
+      approximated with finite differences.
+    - order (int): The highest derivative to return.
+
+    Returns:
+    - funcs (list of function): The function followed by its first order derivatives.
+    """
+    if callable(expr):
+        return [expr] + [finite_difference(expr, k) for k in range(1, order + 1)]
+
+    return [parsed.function for parsed in get_parsed_expression(expr).derivatives(order)]
+
+
+def get_system_and_jacobian(exprs, variables=None):
+    """Returns the vector function and Jacobian of a system of expressions in several variables.
+
+    The Jacobian is differentiated symbolically once, and both the system and its Jacobian are compiled into
+    single functions, so each call evaluates every component in one pass.
+
+    A callable system is used as is, with its Jacobian approximated by central differences.
+
+    Parameters:
+    - exprs (list of str or function): The component expressions of the system, or a callable that maps an array of
+      variable values to the array of component values.
+    - variables (list of str): The variables of the system, in order. Required for expressions.
+
+    Returns:
+    - F (function): Maps an array of variable values to the array of component values.
+    - J (function): Maps an array of variable values to the Jacobian matrix.
+
+    Raises:
+    - ValueError: If the variables of a system of expressions are not given.
+    """
+    if callable(exprs):
+        def F(x):
+            return np.asarray(exprs(x), dtype=float)
+
+        return F, finite_difference_jacobian(F)
+    if variables is None:
+        raise ValueError("The variables of the system must be given.")
+
+    jacobian_strs = compute_jacobian(exprs, variables)
+
+    eval_context = dict(math.__dict__)
+    args = ", ".join(variables)
+    F_compiled = eval(f"lambda {args}: ({', '.join(exprs)},)", eval_context)
+    J_compiled = eval(f"lambda {args}: ({', '.join('(' + ', '.join(row) + ',)' for row in jacobian_strs)},)",
+                      eval_context)
+
+    def F(x):
+        return np.array(F_compiled(*x), dtype=float)
+
+    def J(x):
+        return np.array(J_compiled(*x), dtype=float)
+
+    return F, J
+
+
+def get_vectorized_function_and_derivatives(expr):
+    """Returns the function, first derivative, and second derivative of the given expression, evaluated elementwise.
+
+    The returned functions accept NumPy arrays (real or complex) as well as scalars, and each expression is compiled
+    once and shared through get_parsed_expression.
+
+    Parameters:
+    - expr (str or function): A string representing a mathematical expression, or a callable. A scalar-only callable
+      is evaluated element by element, and its derivatives are approximated with finite differences.
 
     Returns:
     - f (function): The function represented by the expression.
+    - df (function): The first derivative of the function.
+    - ddf (function): The second derivative of the function.
     """
+    if callable(expr):
+        f = as_vectorized(expr)
+        return f, finite_difference(f, 1), finite_difference(f, 2)
+
+    return tuple(parsed.vectorized_function for parsed in get_parsed_expression(expr).derivatives(2))
 
-    f_str = expr
 
-    eval_context = {"x": None}
-    eval_context.update(math.__dict__)
+def get_parametric_function_and_derivatives(expr, vectorized=False):
+    """Returns the parameters of an expression, and its function, first and second derivatives as functions of x
+    followed by the parameters.
 
-    def f(x):
-        eval_context["x"] = x
-        return eval(f_str, eval_context)
+    The expression and its derivatives are parsed, differentiated and compiled once, so they can be evaluated for
+    many parameter values, for example while a slider is dragged.
+
+    Parameters:
+    - expr (str): A string representing a mathematical expression in x and parameters, such as "a*sin(x) - x/2".
+    - vectorized (bool): Whether the functions evaluate NumPy arrays elementwise.
 
-    return f
+    Returns:
+    - parameters (tuple of str): The names of the parameters, sorted, in the order the functions take them.
+    - f (function): The function represented by the expression, called as f(x, *values).
+    - df (function): The first derivative of the function.
+    - ddf (function): The second derivative of the function.
+    """
+    parsed = get_parsed_expression(expr)
+    parameters = parsed.parameters
+    return (parameters, *(expression.parametric_function(parameters, vectorized)
+                          for expression in parsed.derivatives(2)))
@@ -0,0 +1,297 @@
+import math
+
+from src.utils.symbolic_diff import compute_derivative
+
+
+def outward(lo, hi, ulps=1):
+    """Widen the bounds [lo, hi] outward by the given number of units in the last place.
+
+    Every operation rounds its bounds outward like this, so the computed interval always contains the exact result
+    despite floating point rounding.
+    """
+    for _ in range(ulps):
+        lo = math.nextafter(lo, -math.inf)
+        hi = math.nextafter(hi, math.inf)
+    return Interval(lo, hi)
+
+
+class DomainError(ValueError):
+    """Raised when an interval lies entirely outside the domain of a function, which is then undefined on all of it."""
+
+
+class Interval:
+    """A closed interval [lo, hi] of real numbers with outward-rounded arithmetic.
+
+    The arithmetic operators accept intervals as well as plain numbers, so expression strings can be evaluated over
+    intervals with the same eval machinery that is used for floats. An undefined bound, such as from inf - inf, could be
+    any number, so it is widened to -inf or inf.
+    """
+
+    __slots__ = ("lo", "hi")
+
+    def __init__(self, lo, hi=None):
+        self.lo = float(lo)
+        self.hi = self.lo if hi is None else float(hi)
+        if math.isnan(self.lo):
+            self.lo = -math.inf
+        if math.isnan(self.hi):
+            self.hi = math.inf
+        if self.lo > self.hi:
+            raise ValueError(f"Invalid interval [{self.lo}, {self.hi}].")
+
+    def __repr__(self):
+        return f"Interval({self.lo!r}, {self.hi!r})"
+
+    def __eq__(self, other):
+        other = _as_interval(other)
+        return self.lo == other.lo and self.hi == other.hi
+
+    def __hash__(self):
+        return hash((self.lo, self.hi))
+
+    def __contains__(self, value):
+        return self.lo <= value <= self.hi
+
+    @property
+    def width(self):
+        return self.hi - self.lo
+
+    @property
+    def midpoint(self):
+        return self.lo + (self.hi - self.lo) / 2
+
+    def intersect(self, other):
+        """Returns the intersection with another interval, or None if they are disjoint."""
+        lo, hi = max(self.lo, other.lo), min(self.hi, other.hi)
+        return Interval(lo, hi) if lo <= hi else None
+
+    def __neg__(self):
+        return Interval(-self.hi, -self.lo)
+
+    def __pos__(self):
+        return self
+
+    def __add__(self, other):
+        other = _as_interval(other)
+        return outward(self.lo + other.lo, self.hi + other.hi)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        other = _as_interval(other)
+        return outward(self.lo - other.hi, self.hi - other.lo)
+
+    def __rsub__(self, other):
+        return _as_interval(other) - self
+
+    def __mul__(self, other):
+        other = _as_interval(other)
+        products = [_mul(a, b) for a in (self.lo, self.hi) for b in (other.lo, other.hi)]
+        return outward(min(products), max(products))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        other = _as_interval(other)
+
+        # Dividing by an interval that contains zero can give any value
+        if 0 in other:
+            return Interval(-math.inf, math.inf)
+        return self * outward(1 / other.hi, 1 / other.lo)
+
+    def __rtruediv__(self, other):
+        return _as_interval(other) / self
+
+    def __pow__(self, other):
+        if isinstance(other, Interval) or other != int(other):
+            # Real exponents are only defined for positive bases
+            return exp(other * log(self))
+
+        n = int(other)
+        if n == 0:
+            return Interval(1)
+        if n < 0:
+            return 1 / self ** -n
+
+        lo, hi = _pow_bound(self.lo, n), _pow_bound(self.hi, n)
+        if n % 2 == 1:
+            return outward(lo, hi)
+
+        # Even powers have their minimum at zero when the interval contains it
+        if 0 in self:
+            return outward(0, max(lo, hi)).intersect(Interval(0, math.inf))
+        return outward(min(lo, hi), max(lo, hi))
+
+    def __rpow__(self, other):
+        return exp(self * log(_as_interval(other)))
+
+    def __abs__(self):
+        if self.lo >= 0:
+            return self
+        if self.hi <= 0:
+            return -self
+        return Interval(0, max(-self.lo, self.hi))
+
+
+def _as_interval(value):
+    """Convert a number to a degenerate interval, leaving intervals unchanged."""
+    return value if isinstance(value, Interval) else Interval(value)
+
+
+def _mul(a, b):
+    """Multiply two bounds, with 0 * inf taken as 0 as is usual in interval arithmetic."""
+    if a == 0 or b == 0:
+        return 0.0
+    return a * b
+
+
+def _pow_bound(a, n):
+    """Raise a bound to a positive integer power, overflowing to infinity instead of raising."""
+    try:
+        return a ** n
+    except OverflowError:
+        return math.copysign(math.inf, a) if n % 2 == 1 else math.inf
+
+
+def _monotone(func, x, increasing=True, ulps=2):
+    """Apply a monotone function to an interval."""
+    lo, hi = (func(x.lo), func(x.hi)) if increasing else (func(x.hi), func(x.lo))
+    return outward(lo, hi, ulps)
+
+
+def _restrict(x, lo, hi):
+    """Restrict an interval to the domain [lo, hi] of a function.
+
+    Raises:
+    - DomainError: If the interval lies entirely outside the domain.
+    """
+    restricted = x.intersect(Interval(lo, hi))
+    if restricted is None:
+        raise DomainError("Interval lies outside the domain of the function.")
+    return restricted
+
+
+def _contains_periodic(x, offset, period):
+    """Check whether the interval contains a point offset + k * period for some integer k."""
+    return math.ceil((x.lo - offset) / period - 1e-12) <= math.floor((x.hi - offset) / period + 1e-12)
+
+
+def sqrt(x):
+    x = _restrict(_as_interval(x), 0, math.inf)
+    return _monotone(math.sqrt, x).intersect(Interval(0, math.inf))
+
+
+def exp(x):
+    x = _as_interval(x)
+    return _monotone(lambda v: math.exp(v) if v < 709.78 else math.inf, x).intersect(Interval(0, math.inf))
+
+
+def log(x):
+    x = _restrict(_as_interval(x), 0, math.inf)
+    return _monotone(lambda v: math.log(v) if v > 0 else -math.inf, x)
+
+
+def log10(x):
+    return log(x) / math.log(10)
+
+
+def log2(x):
+    return log(x) / math.log(2)
+
+
+def sin(x):
+    x = _as_interval(x)
+    if x.width >= 2 * math.pi:
+        return Interval(-1, 1)
+    lo, hi = sorted((math.sin(x.lo), math.sin(x.hi)))
+    if _contains_periodic(x, math.pi / 2, 2 * math.pi):
+        hi = 1
+    if _contains_periodic(x, -math.pi / 2, 2 * math.pi):
+        lo = -1
+    return outward(lo, hi).intersect(Interval(-1, 1))
+
+
+def cos(x):
+    return sin(_as_interval(x) + math.pi / 2)
+
+
+def tan(x):
+    x = _as_interval(x)
+    # Any pole of tan inside the interval makes it unbounded
+    if x.width >= math.pi or _contains_periodic(x, math.pi / 2, math.pi):
+        return Interval(-math.inf, math.inf)
+    return _monotone(math.tan, x)
+
+
+def asin(x):
+    return _monotone(math.asin, _restrict(_as_interval(x), -1, 1))
+
+
+def acos(x):
+    return _monotone(math.acos, _restrict(_as_interval(x), -1, 1), increasing=False)
+
+
+def atan(x):
+    return _monotone(math.atan, _as_interval(x))
+
+
+def sinh(x):
+    return _monotone(lambda v: math.copysign(math.inf, v) if abs(v) > 710 else math.sinh(v), _as_interval(x))
+
+
+def cosh(x):
+    x = abs(_as_interval(x))
+    return _monotone(lambda v: math.inf if v > 710 else math.cosh(v), x).intersect(Interval(1, math.inf))
+
+
+def tanh(x):
+    return _monotone(math.tanh, _as_interval(x)).intersect(Interval(-1, 1))
+
+
+def fabs(x):
+    return abs(_as_interval(x))
+
+
+# Interval counterparts of the math functions, with the constants enclosed so that they are not rounded
+INTERVAL_EVAL_CONTEXT = {
+    "sqrt": sqrt, "exp": exp, "log": log, "log10": log10, "log2": log2,
+    "sin": sin, "cos": cos, "tan": tan, "asin": asin, "acos": acos, "atan": atan,
+    "sinh": sinh, "cosh": cosh, "tanh": tanh,
+    "abs": fabs, "fabs": fabs, "Abs": fabs,
+    "pi": outward(math.pi, math.pi), "e": outward(math.e, math.e), "E": outward(math.e, math.e),
+}
+
+
+def get_interval_function(expr):
+    """Returns the interval extension of the function represented by the given expression.
+
+    The returned function maps an interval X to an interval that is guaranteed to contain f(x) for every x in X
+    where f is defined.
+
+    Parameters:
+    - expr (str): A string representing a mathematical expression.
+
+    Returns:
+    - F (function): The interval extension of the function.
+    """
+    code = compile(expr, "<expr>", "eval")
+
+    def F(x):
+        eval_context = {"x": _as_interval(x)}
+        eval_context.update(INTERVAL_EVAL_CONTEXT)
+        return _as_interval(eval(code, eval_context))
+
+    return F
+
+
+def get_interval_function_and_derivative(expr):
+    """Returns the interval extensions of the function and its first derivative.
+
+    Parameters:
+    - expr (str): A string representing a mathematical expression.
+
+    Returns:
+    - F (function): The interval extension of the function.
+    - dF (function): The interval extension of the first derivative.
+    """
+    return get_interval_function(expr), get_interval_function(compute_derivative(expr))
@@ -0,0 +1,125 @@
+import time
+
+from src.algorithms.bisection import bisection_iter
+from src.algorithms.false_position import false_position_iter
+from src.algorithms.halley import halley_iter
+from src.algorithms.householder import householder_iter
+from src.algorithms.itp import itp_iter
+from src.algorithms.modified_newton import modified_newton_iter
+from src.algorithms.newton import newton_iter
+from src.algorithms.ridders import ridders_iter
+from src.algorithms.secant import secant_iter
+from src.utils.finite_difference import wrap_functions
+from src.utils.function_evaluation import get_function_and_higher_derivatives
+from src.utils.metrics import recorded_solve
+from src.utils.solve_limits import Cancelled
+
+# The methods compared, the false position variants included
+BRACKETING_METHODS = ["Bisection", "False Position", "Illinois", "Pegasus", "Anderson-Bjorck", "Ridders", "ITP"]
+OPEN_METHODS = ["Newton", "Modified Newton", "Halley", "Householder", "Secant"]
+
+
+def _start_solver(method, funcs, bracket, x0, x1, tol, max_iter, limits):
+    """Create the generator of a method from the shared functions and starting values."""
+    f, df, ddf, dddf = funcs
+    if method == "Bisection":
+        return bisection_iter(f, *bracket, tol, max_iter, **limits)
+    if method == "Ridders":
+        return ridders_iter(f, *bracket, tol, max_iter, **limits)
+    if method == "ITP":
+        return itp_iter(f, *bracket, tol, max_iter, **limits)
+    if method in BRACKETING_METHODS:
+        variant = "standard" if method == "False Position" else method.lower()
+        return false_position_iter(f, *bracket, tol, max_iter, variant, **limits)
+    if method == "Newton":
+        return newton_iter(f, df, x0, tol, max_iter, **limits)
+    if method == "Modified Newton":
+        return modified_newton_iter(f, df, ddf, x0, tol, max_iter, **limits)
+    if method == "Halley":
+        return halley_iter(f, df, ddf, x0, tol, max_iter, **limits)
+    if method == "Householder":
+        return householder_iter(f, [df, ddf, dddf], x0, tol, max_iter, **limits)
+    return secant_iter(f, x0, x1, tol, max_iter, **limits)
+
+
+def compare_methods(expr, bracket=None, x0=None, x1=None, tol=1e-5, max_iter=100, deadline=None, cancel_token=None):
+    """Run every applicable method on the same function and collect their statistics and convergence histories.
+
+    Bracketing methods run when a bracket is given. The open methods start from x0, or from the midpoint of the
+    bracket, and the secant method uses the bracket endpoints or x1 as its two starting points.
+
+    Parameters:
+    - expr (str or function): The function to find the root of, as for get_function_and_higher_derivatives.
+    - bracket (tuple of float, optional): The interval [a, b] for the bracketing methods.
+    - x0 (float, optional): The initial guess for the open methods.
+    - x1 (float, optional): The second initial guess of the secant method. Defaults to a small step from x0.
+    - tol (float): The tolerance level for stopping the algorithms.
+    - max_iter (int): Maximum number of iterations of each method.
+    - deadline (float, optional): The time.monotonic() value after which no method starts another evaluation.
+    - cancel_token (CancellationToken, optional): A token that cancels the remaining methods when set.
+
+    Returns:
+    - results (list of dict): One entry per method, with the "method" name, the "root" or None, the number of
+      "iterations" and function "evaluations", the "time" in seconds, the final "residual" |f(root)|, the "history"
+      of |f(x)| after every iteration and the "error" message if the method failed.
+
+    Raises:
+    - ValueError: If neither a bracket nor an initial guess is given.
+    - Cancelled: If the token is set. The deadline is shared by all the methods: once it passes, the running method
+      and every later one fail with DeadlineExceeded as their error.
+    """
+    if bracket is None and x0 is None:
+        raise ValueError("A bracket or an initial guess is required.")
+
+    methods = []
+    if bracket is not None:
+        methods += BRACKETING_METHODS
+        if x0 is None:
+            x0 = (bracket[0] + bracket[1]) / 2
+    methods += OPEN_METHODS
+    if x1 is None:
+        x1 = bracket[1] if bracket is not None else x0 + 0.01 * max(1.0, abs(x0))
+
+    # The derivatives are differentiated once and shared by all the methods
+    funcs = get_function_and_higher_derivatives(expr, 3)
+    limits = {"deadline": deadline, "cancel_token": cancel_token}
+
+    results = []
+    for method in methods:
+        # Count the evaluations of the function and its derivatives
+        evaluations = 0
+
+        def counted(func):
+            def wrapper(x):
+                nonlocal evaluations
+                evaluations += 1
+                return func(x)
+
+            return wrapper
+
+        history = []
+        result = {"method": method, "root": None, "iterations": None, "residual": None, "history": history,
+                  "error": None}
+        start = time.perf_counter()
+        try:
+            with recorded_solve(method):
+                steps = _start_solver(method, wrap_functions(funcs, counted), bracket, x0, x1, tol, max_iter, limits)
+                while True:
+                    try:
+                        state = next(steps)
+                    except StopIteration as stop:
+                        result["root"], result["iterations"] = stop.value
+                        break
+                    history.append(abs(state["fx"]))
+        except Cancelled:
+            raise
+        except (ValueError, ArithmeticError) as e:
+            result["error"] = str(e)
+        result["time"] = time.perf_counter() - start
+        result["evaluations"] = evaluations
+
+        if result["root"] is not None:
+            result["residual"] = abs(funcs[0](result["root"]))
+        results.append(result)
+
+    return results
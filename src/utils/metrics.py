@@ -0,0 +1,233 @@
+import bisect
+import contextlib
+import os
+import threading
+import time
+
+from src.utils.solve_limits import BudgetExhausted, Cancelled, DeadlineExceeded, SolverStopped, count_evaluations
+
+# Upper bounds, in seconds, of the latency histogram buckets
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+# The metrics that are exported, with their Prometheus type and help text
+METRICS = {
+    "rootfinder_solves_total": ("counter", "Solves by method and outcome."),
+    "rootfinder_failures_total": ("counter", "Solves that did not converge, by method and reason."),
+    "rootfinder_evaluations_total": ("counter", "Evaluations of functions and derivatives, by method."),
+    "rootfinder_solve_seconds": ("histogram", "Time taken by a solve, by method."),
+    "rootfinder_expression_seconds": ("histogram",
+                                      "Time taken to parse, differentiate, simplify or compile an expression."),
+    "rootfinder_simplifications_total": ("counter", "Simplified derivatives, by the strategy that was kept."),
+}
+
+
+# The failure reasons of errors, by the start of their messages. Messages can hold user input, such as the expression,
+# so they are matched against this fixed set and never used as labels themselves.
+FAILURE_REASONS = (
+    ("Exceeded maximum iterations", "max_iterations"),
+    ("Derivative is zero", "zero_derivative"),
+    ("Denominator", "zero_denominator"),
+    ("Function values of the two guesses are the same", "zero_denominator"),
+    ("Jacobian", "singular_jacobian"),
+    ("The function does not change sign", "no_sign_change"),
+    ("Root not in interval", "no_sign_change"),
+    ("Interval lies outside the domain", "domain"),
+    ("math domain error", "domain"),
+    ("Invalid expression", "invalid_expression"),
+    ("Preparing the expression", "expression_limit"),
+)
+
+# The failure reasons of solves stopped by a limit
+STOPPED_REASONS = {BudgetExhausted: "budget_exhausted", DeadlineExceeded: "deadline_exceeded", Cancelled: "cancelled"}
+
+
+def failure_reason(error):
+    """A label out of a fixed set for why a solve failed, so that the number of label values stays bounded.
+
+    Returns:
+    - str: The reason in FAILURE_REASONS or STOPPED_REASONS that matches the error, "invalid_expression" for errors
+      parsing an expression, or else the name of the exception type.
+    """
+    if type(error) in STOPPED_REASONS:
+        return STOPPED_REASONS[type(error)]
+    if type(error).__name__ in ("SympifyError", "TokenError"):
+        return "invalid_expression"
+    message = str(error)
+    for start, reason in FAILURE_REASONS:
+        if message.startswith(start):
+            return reason
+    return type(error).__name__
+
+
+def _format_labels(labels, extra=()):
+    """Format label pairs as a Prometheus label set, empty when there are none."""
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    # Backslashes, quotes and newlines are escaped in label values
+    escaped = [(key, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+               for key, value in pairs]
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+class MetricsRegistry:
+    """Thread-safe counters and fixed-bucket histograms, exported in the Prometheus text format.
+
+    Labels are given as keyword arguments. A snapshot of a registry is a plain picklable dict, so the metrics of
+    worker processes can be sent back and merged into the registry of the parent.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+        self._export_stop = None
+
+    def inc(self, name, amount=1, **labels):
+        """Add an amount to a counter."""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name, value, **labels):
+        """Record a value, such as a duration in seconds, in a histogram."""
+        key = (name, tuple(sorted(labels.items())))
+        bucket = bisect.bisect_left(LATENCY_BUCKETS, value)
+        with self._lock:
+            counts, total = self._histograms.get(key, ([0] * (len(LATENCY_BUCKETS) + 1), 0.0))
+            counts[bucket] += 1
+            self._histograms[key] = (counts, total + value)
+
+    def snapshot(self):
+        """Returns a copy of all the metrics as a plain dict."""
+        with self._lock:
+            return {"counters": dict(self._counters),
+                    "histograms": {key: (list(counts), total) for key, (counts, total) in self._histograms.items()}}
+
+    def collect(self):
+        """Returns a snapshot and resets the registry, so that the same values are never merged twice."""
+        with self._lock:
+            snapshot = {"counters": self._counters, "histograms": self._histograms}
+            self._counters, self._histograms = {}, {}
+        return snapshot
+
+    def merge(self, snapshot):
+        """Add the metrics of a snapshot, for example from a worker process."""
+        with self._lock:
+            for key, value in snapshot["counters"].items():
+                self._counters[key] = self._counters.get(key, 0) + value
+            for key, (counts, total) in snapshot["histograms"].items():
+                own_counts, own_total = self._histograms.get(key, ([0] * len(counts), 0.0))
+                self._histograms[key] = ([a + b for a, b in zip(own_counts, counts)], own_total + total)
+
+    def reset(self):
+        """Remove all the metrics."""
+        with self._lock:
+            self._counters, self._histograms = {}, {}
+
+    def to_prometheus(self):
+        """Returns all the metrics in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = []
+        for name in sorted({key[0] for key in snapshot["counters"]} | {key[0] for key in snapshot["histograms"]}):
+            kind, description = METRICS.get(name, ("untyped", ""))
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+            for (metric, labels), value in sorted(snapshot["counters"].items()):
+                if metric == name:
+                    lines.append(f"{name}{_format_labels(labels)} {value}")
+            for (metric, labels), (counts, total) in sorted(snapshot["histograms"].items()):
+                if metric != name:
+                    continue
+                # Prometheus buckets are cumulative
+                cumulative = 0
+                for bound, count in zip(list(LATENCY_BUCKETS) + ["+Inf"], counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_format_labels(labels, [('le', bound)])} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {total}")
+                lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        """Write the metrics to a file, replacing it at once so that a scraper never reads a partial file."""
+        temporary = f"{path}.tmp"
+        with open(temporary, "w") as file:
+            file.write(self.to_prometheus())
+        os.replace(temporary, path)
+
+    def start_export(self, path, interval=15.0):
+        """Write the metrics to a file every interval seconds from a background thread, until stop_export is called.
+
+        Parameters:
+        - path (str): The path of the file, for example one read by the node exporter's textfile collector.
+        - interval (float): The number of seconds between writes.
+        """
+        self.stop_export()
+        stop = threading.Event()
+
+        def export():
+            while not stop.wait(interval):
+                self.write_prometheus(path)
+
+        self._export_stop = stop
+        threading.Thread(target=export, daemon=True).start()
+
+    def stop_export(self):
+        """Stop the periodic export, if one is running."""
+        if self._export_stop is not None:
+            self._export_stop.set()
+            self._export_stop = None
+
+
+# The registry that the solver and expression layers record into
+REGISTRY = MetricsRegistry()
+
+
+def record_solve(method, seconds, nfev, error=None, registry=REGISTRY):
+    """Record the outcome, duration and number of evaluations of one solve.
+
+    Parameters:
+    - method (str): The name of the method, normalized to lower case with underscores so that "False Position" and
+      false_position are the same label.
+    - seconds (float): The time taken by the solve.
+    - nfev (int): The number of evaluations of the function and its derivatives.
+    - error (Exception, optional): The error that ended the solve, or None if it converged. Solves ended by a limit
+      are counted as stopped rather than failed.
+    - registry (MetricsRegistry): The registry to record into.
+    """
+    method = method.lower().replace(" ", "_")
+    if error is None:
+        status = "converged"
+    else:
+        status = "stopped" if isinstance(error, SolverStopped) else "failed"
+    registry.inc("rootfinder_solves_total", method=method, status=status)
+    if error is not None:
+        registry.inc("rootfinder_failures_total", method=method, reason=failure_reason(error))
+    registry.inc("rootfinder_evaluations_total", nfev, method=method)
+    registry.observe("rootfinder_solve_seconds", seconds, method=method)
+
+
+@contextlib.contextmanager
+def recorded_solve(method, registry=REGISTRY):
+    """Record one solve that runs in a with block with record_solve, with the evaluations limit_evaluations counts.
+
+    Errors are recorded as failures, or as stops for SolverStopped, and raised again.
+    """
+    start = time.perf_counter()
+    with count_evaluations() as counter:
+        try:
+            yield
+        except Exception as e:
+            record_solve(method, time.perf_counter() - start, counter["nfev"], e, registry)
+            raise
+    record_solve(method, time.perf_counter() - start, counter["nfev"], registry=registry)
+
+
+@contextlib.contextmanager
+def timed_stage(stage, registry=REGISTRY):
+    """Record the duration of one stage of the expression layer, such as parsing, in a with block."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        registry.observe("rootfinder_expression_seconds", time.perf_counter() - start, stage=stage)
@@ -0,0 +1,48 @@
+import numpy as np
+
+
+def newton_lanes(f, df, z, tol, max_iter):
+    """Run Newton's method on every starting point of an array at once.
+
+    Lanes that converge, hit a zero derivative or leave the finite numbers are removed from the working set, so each
+    iteration only evaluates the lanes that are still active. A removed lane keeps its last finite iterate.
+
+    Parameters:
+    - f (function): Vectorized function to find the roots of.
+    - df (function): Vectorized derivative of the function.
+    - z (ndarray): One-dimensional array of real or complex starting points.
+    - tol (float): The tolerance level for stopping the algorithm.
+    - max_iter (int): Maximum number of iterations.
+
+    Returns:
+    - z (ndarray): The final approximation of every lane.
+    - iterations (ndarray): The number of iterations each lane took.
+    - converged (ndarray): Boolean mask of the lanes that reached a root.
+    """
+    z = z.astype(np.result_type(z.dtype, float))
+    iterations = np.full(z.size, max_iter, dtype=np.int32)
+    converged = np.zeros(z.size, dtype=bool)
+    active = np.arange(z.size)
+
+    for n in range(max_iter + 1):
+        z_active = z[active]
+        fz = f(z_active)
+
+        # Retire the lanes whose function value is sufficiently close to zero
+        done = np.abs(fz) <= tol
+        converged[active[done]] = True
+        iterations[active[done]] = n
+        if n == max_iter:
+            break
+
+        # Retire the lanes with a zero derivative or a non-finite update, keeping their last finite iterate
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            z_next = z_active - fz / df(z_active)
+        keep = ~done & np.isfinite(z_next)
+
+        z[active[keep]] = z_next[keep]
+        active = active[keep]
+        if active.size == 0:
+            break
+
+    return z, iterations, converged
@@ -0,0 +1,63 @@
+from src.algorithms.newton import newton
+from src.utils.function_evaluation import get_parametric_function_and_derivatives
+
+
+class ParametricSolver:
+    """Re-solve f(x; p) = 0 with Newton's method as the parameter values p change, for live parameter sliders.
+
+    The expression and its derivative are compiled once with the parameters as arguments, so a re-solve only
+    evaluates compiled functions. Every solve is warm-started from the last root found, which is a few iterations away
+    when the parameters change a little, and falls back to the initial guess if that fails.
+
+    Attributes:
+    - parameters (tuple of str): The names of the parameters, in the order solve and curve take their values.
+    - x0 (float): The initial guess of the first solve, and the fallback when a warm start fails.
+    - root (float, optional): The root for the latest parameter values, or None if the latest solve failed.
+    """
+
+    def __init__(self, expr, x0=0.0, tol=1e-10, max_iter=50):
+        """Compile the expression and its derivative.
+
+        Parameters:
+        - expr (str): A string representing a mathematical expression in x and parameters.
+        - x0 (float): The initial guess.
+        - tol (float): The tolerance level of Newton's method.
+        - max_iter (int): Maximum number of Newton iterations per solve.
+        """
+        self.parameters, self.f, self.df, _ = get_parametric_function_and_derivatives(expr)
+        self.vectorized_f = get_parametric_function_and_derivatives(expr, vectorized=True)[1]
+        self.x0 = x0
+        self.tol = tol
+        self.max_iter = max_iter
+        self.root = None
+        self._warm_start = None
+
+    def solve(self, values):
+        """Find the root for new parameter values.
+
+        Parameters:
+        - values (sequence of float): The parameter values, in the order of parameters.
+
+        Returns:
+        - root (float, optional): The root, or None if Newton's method failed from both starting points.
+        """
+        def f(x):
+            return self.f(x, *values)
+
+        def df(x):
+            return self.df(x, *values)
+
+        starts = [self.x0] if self._warm_start is None else [self._warm_start, self.x0]
+        self.root = None
+        for start in starts:
+            try:
+                self.root, _ = newton(f, df, start, self.tol, self.max_iter)
+            except (ValueError, ArithmeticError):
+                continue
+            self._warm_start = self.root
+            break
+        return self.root
+
+    def curve(self, x_vals, values):
+        """Evaluate the function on an array of points for the given parameter values, for plotting."""
+        return self.vectorized_f(x_vals, *values)
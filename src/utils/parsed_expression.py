@@ -0,0 +1,206 @@
+import functools
+import math
+import re
+
+import numpy as np
+
+from src.utils.metrics import timed_stage
+from src.utils.simplification import simplify_bounded
+
+# Elementwise NumPy counterparts of the math functions, so expressions can be evaluated on whole (complex) arrays
+NUMPY_EVAL_CONTEXT = {
+    "sin": np.sin, "cos": np.cos, "tan": np.tan,
+    "asin": np.arcsin, "acos": np.arccos, "atan": np.arctan,
+    "sinh": np.sinh, "cosh": np.cosh, "tanh": np.tanh,
+    "asinh": np.arcsinh, "acosh": np.arccosh, "atanh": np.arctanh,
+    "exp": np.exp, "log": np.log, "log10": np.log10, "log2": np.log2, "sqrt": np.sqrt,
+    "abs": np.abs, "fabs": np.abs, "Abs": np.abs, "sign": np.sign,
+    "pi": np.pi, "e": np.e, "E": np.e,
+}
+
+
+class ParsedExpression:
+    """An expression in x, parsed once and shared by the GUI, evaluation and differentiation.
+
+    Everything beyond the Python source is computed on first use and kept: the SymPy tree, the LaTeX, the compiled
+    evaluators and the derivatives. Use get_parsed_expression to share one object per distinct source. SymPy itself
+    is only imported once a symbolic attribute is needed, which keeps it out of the GUI startup.
+
+    Attributes:
+    - source (str): The expression as Python source.
+    - cse_form (tuple, optional): Common subexpressions to evaluate first, as returned by simplify_bounded.
+    - simplify_strategy (str, optional): For derivatives, how the derivative was simplified.
+    - simplify_seconds (float, optional): For derivatives, the time the simplification took.
+
+    Names other than x that are not functions or constants, such as a in a*sin(x) - x/2, are parameters. Expressions
+    with parameters are evaluated with parametric_function, which takes their values as extra arguments.
+    """
+
+    def __init__(self, source, sympy_expr=None, cse_form=None):
+        self.source = source
+        self.cse_form = cse_form
+        if sympy_expr is not None:
+            self.__dict__["sympy_expr"] = sympy_expr
+        self._derivatives = {}
+        self._parametric_functions = {}
+        self.simplify_strategy = None
+        self.simplify_seconds = None
+
+    def __repr__(self):
+        return f"ParsedExpression({self.source!r})"
+
+    @functools.cached_property
+    def sympy_expr(self):
+        """The SymPy tree of the expression."""
+        import sympy as sp
+
+        with timed_stage("parse"):
+            return sp.sympify(self.source)
+
+    @functools.cached_property
+    def latex(self):
+        """The LaTeX of the expression, with implicit multiplications left without a symbol."""
+        import sympy as sp
+
+        return sp.latex(self.sympy_expr, mul_symbol='dot').replace('\\cdot', '')
+
+    @functools.cached_property
+    def parameters(self):
+        """The names of the parameters of the expression, sorted."""
+        names = {str(symbol) for symbol in self.sympy_expr.free_symbols}
+        return tuple(sorted(name for name in names if name != "x" and name not in NUMPY_EVAL_CONTEXT))
+
+    def _compile(self, namespace, arguments="x"):
+        """Compile the expression into a function of the arguments, assigning its common subexpressions first if it
+        has any."""
+        with timed_stage("compile"):
+            if self.cse_form is None:
+                return eval(f"lambda {arguments}: ({self.source})", namespace)
+            assignments, result = self.cse_form
+            lines = "".join(f"    {name} = {value}\n" for name, value in assignments)
+            exec(f"def function({arguments}):\n{lines}    return {result}\n", namespace)
+            return namespace["function"]
+
+    @functools.cached_property
+    def function(self):
+        """The expression compiled into a function of x, evaluated with the math module."""
+        return self._compile(dict(math.__dict__))
+
+    @functools.cached_property
+    def vectorized_function(self):
+        """The expression compiled into a function of x that evaluates NumPy arrays (real or complex) elementwise."""
+        compiled = self._compile(dict(NUMPY_EVAL_CONTEXT))
+
+        def func(x):
+            # Broadcast so that constant expressions still return one value per input
+            return np.broadcast_to(compiled(x), np.shape(x))
+
+        return func
+
+    def parametric_function(self, parameters, vectorized=False):
+        """Returns the expression compiled into a function of x followed by the parameters, compiled once and kept.
+
+        Parameters:
+        - parameters (tuple of str): The names of the parameters, in the order of the arguments. Derivatives take
+          the parameters of the expression they come from, even those they no longer depend on.
+        - vectorized (bool): Whether the function evaluates NumPy arrays elementwise, like vectorized_function.
+
+        Returns:
+        - function: The compiled function, called as f(x, *values).
+        """
+        key = (tuple(parameters), vectorized)
+        if key not in self._parametric_functions:
+            arguments = ", ".join(("x",) + key[0])
+            if not vectorized:
+                self._parametric_functions[key] = self._compile(dict(math.__dict__), arguments)
+            else:
+                compiled = self._compile(dict(NUMPY_EVAL_CONTEXT), arguments)
+
+                def func(x, *values):
+                    return np.broadcast_to(compiled(x, *values), np.shape(x))
+
+                self._parametric_functions[key] = func
+        return self._parametric_functions[key]
+
+    def substitute(self, values):
+        """Returns the source of the expression with the parameters replaced by values.
+
+        The names are replaced in the Python source, so an expression prepared in the sandbox is not parsed here.
+
+        Parameters:
+        - values (dict): The value of every parameter, by name.
+
+        Returns:
+        - str: The source of the expression without parameters.
+        """
+        def replace(match):
+            name = match.group()
+            return f"({values[name]!r})" if name in values else name
+
+        return re.sub(r"(?<![\w.])[A-Za-z_]\w*", replace, self.source)
+
+    def seed(self, latex, parameters, derivatives):
+        """Store results prepared elsewhere, such as in a sandbox worker, so they are not computed again here.
+
+        Results that this object already has are kept.
+
+        Parameters:
+        - latex (str): The LaTeX of the expression.
+        - parameters (tuple of str): The names of the parameters of the expression.
+        - derivatives (list of tuple): For the first derivatives with respect to x in order, their source, common
+          subexpressions, simplification strategy and simplification time.
+        """
+        self.__dict__.setdefault("latex", latex)
+        self.__dict__.setdefault("parameters", tuple(parameters))
+
+        expression = self
+        for source, cse_form, strategy, seconds in derivatives:
+            if "x" not in expression._derivatives:
+                derivative = ParsedExpression(source, cse_form=cse_form)
+                derivative.simplify_strategy, derivative.simplify_seconds = strategy, seconds
+                expression._derivatives["x"] = derivative
+            expression = expression._derivatives["x"]
+
+    def derivative(self, variable="x"):
+        """Returns the simplified derivative with respect to a variable, differentiated once and then kept.
+
+        The simplification is bounded in time by simplify_bounded, so the setup of the Newton methods stays fast even
+        for nested transcendental expressions.
+
+        Parameters:
+        - variable (str): The variable to differentiate with respect to.
+
+        Returns:
+        - ParsedExpression: The derivative.
+        """
+        if variable not in self._derivatives:
+            import sympy as sp
+
+            expr = self.sympy_expr
+            with timed_stage("differentiate"):
+                derivative = sp.diff(expr, sp.symbols(variable))
+            simplified, cse_form, strategy, seconds = simplify_bounded(derivative)
+            parsed = ParsedExpression(str(simplified), simplified, cse_form)
+            parsed.simplify_strategy, parsed.simplify_seconds = strategy, seconds
+            self._derivatives[variable] = parsed
+        return self._derivatives[variable]
+
+    def derivatives(self, order):
+        """Returns the expression followed by its first order derivatives with respect to x."""
+        expressions = [self]
+        for _ in range(order):
+            expressions.append(expressions[-1].derivative())
+        return expressions
+
+
+@functools.lru_cache(maxsize=1024)
+def get_parsed_expression(source):
+    """Returns the shared ParsedExpression of a Python source string, creating it on first use.
+
+    Parameters:
+    - source (str): A string representing a mathematical expression in x.
+
+    Returns:
+    - ParsedExpression: The parsed expression.
+    """
+    return ParsedExpression(source)
@@ -0,0 +1,277 @@
+import concurrent.futures
+import csv
+import multiprocessing
+import time
+
+import numpy as np
+
+from src.algorithms.bisection import bisection
+from src.algorithms.false_position import false_position
+from src.algorithms.halley import halley
+from src.algorithms.householder import householder
+from src.algorithms.itp import itp
+from src.algorithms.modified_newton import modified_newton
+from src.algorithms.newton import newton
+from src.algorithms.ridders import ridders
+from src.algorithms.secant import secant
+from src.utils.batch import STOPPED_STATUS
+from src.utils.finite_difference import wrap_functions
+from src.utils.function_evaluation import get_function_and_higher_derivatives
+from src.utils.metrics import REGISTRY, record_solve
+from src.utils.result_store import RESULT_DTYPE, STATUS_CONVERGED, STATUS_FAILED, STATUS_NAMES
+from src.utils.sandbox import prepare_expression
+from src.utils.solve_limits import CancellationToken, SolverStopped
+
+# The columns of a problem file. Only expression and method are required, the others fall back to their defaults.
+PROBLEM_COLUMNS = ["expression", "method", "a", "b", "x0", "x1", "tol", "max_iter", "variant", "order"]
+PROBLEM_DEFAULTS = {"tol": 1e-5, "max_iter": 100, "variant": "standard", "order": 3}
+
+# Seconds between checks of the cancellation token while chunks run in worker processes
+CANCEL_POLL_INTERVAL = 0.1
+
+# The parameters each method needs, and the number of derivatives it takes
+METHOD_PARAMS = {
+    "bisection": (["a", "b"], 0),
+    "false position": (["a", "b"], 0),
+    "ridders": (["a", "b"], 0),
+    "itp": (["a", "b"], 0),
+    "newton": (["x0"], 1),
+    "modified newton": (["x0"], 2),
+    "halley": (["x0"], 2),
+    "householder": (["x0"], None),
+    "secant": (["x0", "x1"], 0),
+}
+
+
+def load_problems(path):
+    """Read a CSV file of problems, one per row.
+
+    The header names the columns, in any order, out of PROBLEM_COLUMNS. Empty cells take the default values.
+
+    Parameters:
+    - path (str): The path of the CSV file.
+
+    Returns:
+    - problems (list of dict): The problems, with the method names in lower case and the numbers converted.
+
+    Raises:
+    - ValueError: If a column is missing or unknown, or a row names an unknown method, lacks one of its parameters or
+      has a value that is not a number.
+    """
+    with open(path, newline="") as file:
+        reader = csv.DictReader(file)
+        columns = [column.strip() for column in reader.fieldnames or []]
+        unknown = set(columns) - set(PROBLEM_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(sorted(unknown))}.")
+        if "expression" not in columns or "method" not in columns:
+            raise ValueError("The problem file needs an expression and a method column.")
+
+        problems = []
+        for line, row in enumerate(reader, start=2):
+            row = {key.strip(): (value or "").strip() for key, value in row.items() if key is not None}
+            try:
+                problems.append(_parse_problem(row))
+            except ValueError as e:
+                raise ValueError(f"Line {line}: {e}")
+    return problems
+
+
+def _parse_problem(row):
+    """Convert a row of a problem file into a problem."""
+    method = row["method"].lower()
+    if method not in METHOD_PARAMS:
+        raise ValueError(f"Unknown method '{row['method']}'.")
+
+    problem = dict(PROBLEM_DEFAULTS, expression=row["expression"], method=method)
+    for key in ["a", "b", "x0", "x1", "tol"]:
+        if row.get(key):
+            problem[key] = float(row[key])
+    for key in ["max_iter", "order"]:
+        if row.get(key):
+            problem[key] = int(row[key])
+    if row.get("variant"):
+        problem["variant"] = row["variant"].lower()
+
+    missing = [key for key in METHOD_PARAMS[method][0] if key not in problem]
+    if missing:
+        raise ValueError(f"The {method} method needs {', '.join(missing)}.")
+    return problem
+
+
+def solve_problem(problem, **limits):
+    """Solve one problem of a problem file.
+
+    Parameters:
+    - problem (dict): A problem as returned by load_problems.
+    - **limits: The max_fev, deadline or cancel_token limits for the solver.
+
+    Returns:
+    - result (tuple): The root, the number of iterations, the number of evaluations and the status, as a record of
+      RESULT_DTYPE, followed by the error message or an empty string.
+    """
+    method = problem["method"]
+    order = METHOD_PARAMS[method][1]
+    if order is None:
+        order = problem["order"]
+
+    # Count the evaluations of the function and its derivatives
+    nfev = 0
+
+    def counted(func):
+        def wrapper(x):
+            nonlocal nfev
+            nfev += 1
+            return func(x)
+
+        return wrapper
+
+    tol, max_iter = problem["tol"], problem["max_iter"]
+    start = time.perf_counter()
+    try:
+        # One pathological expression must not stall the batch, so it is parsed and differentiated in the sandbox
+        prepare_expression(problem["expression"], order)
+        f, *derivatives = wrap_functions(get_function_and_higher_derivatives(problem["expression"], order), counted)
+    except Exception as e:
+        # The solver records its own solve, so only the problems that fail before it starts are recorded here
+        record_solve(method, time.perf_counter() - start, nfev, e)
+        return (np.nan, -1, nfev, STATUS_FAILED), str(e)
+
+    try:
+        if method == "bisection":
+            root, n = bisection(f, problem["a"], problem["b"], tol, max_iter, **limits)
+        elif method == "false position":
+            root, n = false_position(f, problem["a"], problem["b"], tol, max_iter, problem["variant"], **limits)
+        elif method == "ridders":
+            root, n = ridders(f, problem["a"], problem["b"], tol, max_iter, **limits)
+        elif method == "itp":
+            root, n = itp(f, problem["a"], problem["b"], tol, max_iter, **limits)
+        elif method == "newton":
+            root, n = newton(f, *derivatives, problem["x0"], tol, max_iter, **limits)
+        elif method == "modified newton":
+            root, n = modified_newton(f, *derivatives, problem["x0"], tol, max_iter, **limits)
+        elif method == "halley":
+            root, n = halley(f, *derivatives, problem["x0"], tol, max_iter, **limits)
+        elif method == "householder":
+            root, n = householder(f, derivatives, problem["x0"], tol, max_iter, **limits)
+        else:
+            root, n = secant(f, problem["x0"], problem["x1"], tol, max_iter, **limits)
+    except SolverStopped as e:
+        best = np.nan if e.x is None else e.x
+        return (best, -1, nfev, STOPPED_STATUS[type(e)]), str(e)
+    except Exception as e:
+        # Anything can go wrong with an expression from a file, and one bad row must not stop the batch
+        return (np.nan, -1, nfev, STATUS_FAILED), str(e)
+    return (root, n, nfev, STATUS_CONVERGED), ""
+
+
+def _solve_chunk(problems, max_fev, time_limit, cancel_token=None):
+    """Solve a chunk of problems, each with its own deadline, until the token is cancelled.
+
+    The results cover the problems up to the one the cancellation stopped, which gets the cancelled status.
+    """
+    results = []
+    for problem in problems:
+        if cancel_token is not None and cancel_token.cancelled:
+            break
+        deadline = None if time_limit is None else time.monotonic() + time_limit
+        results.append(solve_problem(problem, max_fev=max_fev, deadline=deadline, cancel_token=cancel_token))
+    return results
+
+
+# The cancellation token of the batch in a worker process, shared with the parent through a multiprocessing Event
+_worker_cancel_token = None
+
+
+def _init_worker(cancel_event):
+    """Set up a worker process with the cancellation event of the batch."""
+    global _worker_cancel_token
+    _worker_cancel_token = CancellationToken(cancel_event)
+
+
+def _solve_chunk_in_worker(problems, max_fev, time_limit):
+    """Solve a chunk in a worker process, and hand the metrics it recorded back to the parent."""
+    return _solve_chunk(problems, max_fev, time_limit, _worker_cancel_token), REGISTRY.collect()
+
+
+def solve_problems(problems, chunk_size=256, max_workers=None, cancel_token=None, max_fev=None, time_limit=None):
+    """Solve many problems in a pool of worker processes, yielding the results chunk by chunk as they complete.
+
+    Chunks finish in any order. Once the cancellation token is set, no further chunk is started and the running chunks
+    stop at the next function evaluation, yielding the problems they solved so far. The metrics recorded by the
+    workers are merged into the metrics registry of this process.
+
+    Parameters:
+    - problems (list of dict): The problems, as returned by load_problems.
+    - chunk_size (int): The number of problems sent to a worker at once.
+    - max_workers (int, optional): The number of worker processes. With 1 the problems are solved in this process.
+    - cancel_token (CancellationToken, optional): A token that stops the batch when set.
+    - max_fev (int, optional): Maximum number of function evaluations of each problem.
+    - time_limit (float, optional): The number of seconds each problem may take.
+
+    Yields:
+    - start (int): The index of the first problem of the chunk.
+    - results (ndarray): The results of the chunk, with RESULT_DTYPE.
+    - errors (list of str): The error message of every problem of the chunk, empty for the converged ones.
+    """
+    def to_records(chunk_results):
+        records = np.array([record for record, _ in chunk_results], dtype=RESULT_DTYPE)
+        return records, [error for _, error in chunk_results]
+
+    starts = range(0, len(problems), chunk_size)
+    if max_workers == 1:
+        for start in starts:
+            chunk_results = _solve_chunk(problems[start:start + chunk_size], max_fev, time_limit, cancel_token)
+            if chunk_results:
+                yield (start, *to_records(chunk_results))
+            if cancel_token is not None and cancel_token.cancelled:
+                return
+        return
+
+    # Spawned workers do not inherit the state of the parent, which may be running a GUI. They share an event that
+    # tells them to stop, since the token of the caller cannot be sent to another process.
+    context = multiprocessing.get_context("spawn")
+    cancel_event = context.Event()
+    with concurrent.futures.ProcessPoolExecutor(max_workers, mp_context=context, initializer=_init_worker,
+                                                initargs=(cancel_event,)) as executor:
+        futures = {executor.submit(_solve_chunk_in_worker, problems[start:start + chunk_size], max_fev,
+                                   time_limit): start for start in starts}
+        pending = set(futures)
+        try:
+            while pending:
+                done, pending = concurrent.futures.wait(pending, CANCEL_POLL_INTERVAL,
+                                                        concurrent.futures.FIRST_COMPLETED)
+                if cancel_token is not None and cancel_token.cancelled and not cancel_event.is_set():
+                    # The running chunks stop at their next evaluation, and the others are not started
+                    cancel_event.set()
+                    for future in pending:
+                        future.cancel()
+                for future in done:
+                    if future.cancelled():
+                        continue
+                    chunk_results, metrics = future.result()
+                    REGISTRY.merge(metrics)
+                    if chunk_results:
+                        yield (futures[future], *to_records(chunk_results))
+        finally:
+            # Also stops the workers when the caller closes the generator early
+            cancel_event.set()
+            for future in futures:
+                future.cancel()
+
+
+def export_results(path, problems, results, errors):
+    """Write the problems and their results to a CSV file.
+
+    Parameters:
+    - path (str): The path of the CSV file.
+    - problems (list of dict): The problems, as returned by load_problems.
+    - results (ndarray): The results, with RESULT_DTYPE.
+    - errors (list of str): The error message of every problem.
+    """
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(PROBLEM_COLUMNS + list(RESULT_DTYPE.names) + ["error"])
+        for problem, (root, iterations, nfev, status), error in zip(problems, results.tolist(), errors):
+            writer.writerow([problem.get(column, "") for column in PROBLEM_COLUMNS]
+                            + [root, iterations, nfev, STATUS_NAMES[status], error])
@@ -0,0 +1,103 @@
+import os
+
+import numpy as np
+
+# One record per solved problem, laid out so result files can be opened zero-copy with np.load(..., mmap_mode="r")
+RESULT_DTYPE = np.dtype([("root", np.float64), ("iterations", np.int32), ("nfev", np.int32), ("status", np.int8)])
+
+# Status codes. Rows that are still pending have not been computed yet, which is what makes runs resumable.
+STATUS_PENDING = 0
+STATUS_CONVERGED = 1
+STATUS_FAILED = 2
+STATUS_BUDGET_EXHAUSTED = 3
+STATUS_DEADLINE_EXCEEDED = 4
+STATUS_CANCELLED = 5
+
+# Rows that a resumed run computes again: the pending ones, and those stopped by a deadline or a cancellation, which
+# stop a whole run and say nothing about the problem itself
+UNFINISHED_STATUSES = (STATUS_PENDING, STATUS_DEADLINE_EXCEEDED, STATUS_CANCELLED)
+
+# Readable names of the status codes, for display and export
+STATUS_NAMES = {
+    STATUS_PENDING: "Pending", STATUS_CONVERGED: "Converged", STATUS_FAILED: "Failed",
+    STATUS_BUDGET_EXHAUSTED: "Budget exhausted", STATUS_DEADLINE_EXCEEDED: "Deadline exceeded",
+    STATUS_CANCELLED: "Cancelled",
+}
+
+
+def open_result_file(path, size, dtype=RESULT_DTYPE):
+    """Open a .npy result file as a writable memory map.
+
+    A new file is preallocated with every row pending. An existing file is reopened as is, so that an interrupted
+    run can resume where it stopped.
+
+    Parameters:
+    - path (str): The path of the .npy file.
+    - size (int): The number of results.
+    - dtype (np.dtype): The structured type of a result record.
+
+    Returns:
+    - out (np.memmap): The memory-mapped result array.
+
+    Raises:
+    - ValueError: If an existing file does not match the size or record type.
+    """
+    if os.path.exists(path):
+        out = np.lib.format.open_memmap(path, mode="r+")
+        if out.shape != (size,) or out.dtype != dtype:
+            raise ValueError("The existing result file does not match the size or type of the results.")
+        return out
+
+    # A freshly created file is zero-filled, so every status starts as pending
+    return np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(size,))
+
+
+def load_results(path):
+    """Open a result file read-only, without copying it into memory.
+
+    Parameters:
+    - path (str): The path of the .npy file.
+
+    Returns:
+    - results (np.memmap): The memory-mapped result array.
+    """
+    return np.load(path, mmap_mode="r")
+
+
+def write_chunked(out, compute_chunk, chunk_size=65536, flush_every=16):
+    """Fill a result array chunk by chunk, skipping the chunks that are already complete.
+
+    A chunk that comes back with pending rows was stopped, and the run stops there, so that a later run resumes it.
+
+    Parameters:
+    - out (ndarray): The result array to fill, possibly memory-mapped. Its "status" field marks pending rows.
+    - compute_chunk (function): Maps a (start, stop) range of rows to the array of their results.
+    - chunk_size (int): The number of rows computed and written at once.
+    - flush_every (int): The number of chunks between flushes of a memory-mapped array to disk.
+
+    Returns:
+    - out (ndarray): The filled result array.
+    """
+    size = len(out)
+    written = 0
+
+    for start in range(0, size, chunk_size):
+        stop = min(start + chunk_size, size)
+
+        # Resume from the first chunk that still has unfinished rows
+        if not np.any(np.isin(out["status"][start:stop], UNFINISHED_STATUSES)):
+            continue
+
+        out[start:stop] = compute_chunk(start, stop)
+        written += 1
+        if np.any(out["status"][start:stop] == STATUS_PENDING):
+            break
+
+        # Periodically push the completed chunks to disk
+        if isinstance(out, np.memmap) and written % flush_every == 0:
+            out.flush()
+
+    if isinstance(out, np.memmap):
+        out.flush()
+
+    return out
@@ -0,0 +1,181 @@
+import itertools
+import os
+
+import numpy as np
+
+# The interpolants of TabulatedFunction
+INTERPOLATION_KINDS = ["linear", "pchip"]
+
+
+def _split_columns(samples):
+    """The x and y columns of a structured array with x and y fields, or of an array with two columns."""
+    if samples.dtype.names is not None:
+        return samples["x"], samples["y"]
+    if samples.ndim != 2 or samples.shape[1] != 2:
+        raise ValueError("Sample data needs exactly two columns, x and y.")
+    return samples[:, 0], samples[:, 1]
+
+
+def load_samples(path):
+    """Open a file of (x, y) samples, memory-mapped when the format allows it.
+
+    A .npy file holds either an array with two columns or a structured array with x and y fields. Any other file
+    that is not a CSV file is read as raw float64 (x, y) pairs. Both are memory-mapped, so only the parts that are
+    used are read. A .csv file, with an optional header line, is read into memory.
+
+    Parameters:
+    - path (str): The path of the sample file.
+
+    Returns:
+    - x, y (ndarray): The columns of the samples, as views of the memory map when the file is binary.
+
+    Raises:
+    - ValueError: If the file does not have two columns.
+    """
+    if str(path).endswith(".csv"):
+        chunks = list(sample_chunks(path))
+        if not chunks:
+            return np.empty(0), np.empty(0)
+        return tuple(np.concatenate(column) for column in zip(*chunks))
+    if str(path).endswith(".npy"):
+        return _split_columns(np.load(path, mmap_mode="r"))
+    if os.path.getsize(path) % 16:
+        raise ValueError("A raw sample file must hold float64 (x, y) pairs.")
+    return _split_columns(np.memmap(path, dtype=np.float64, mode="r").reshape(-1, 2))
+
+
+def sample_chunks(source, chunk_size=1_000_000):
+    """Read (x, y) samples chunk by chunk, without loading the whole source.
+
+    Parameters:
+    - source (str or tuple of array_like): The path of a sample file, in any format read by load_samples, or the x
+      and y columns themselves.
+    - chunk_size (int): The number of samples per chunk.
+
+    Yields:
+    - x, y (ndarray): The columns of the next chunk of consecutive samples.
+    """
+    if isinstance(source, tuple):
+        x, y = source
+    elif str(source).endswith(".csv"):
+        yield from _csv_chunks(source, chunk_size)
+        return
+    else:
+        x, y = load_samples(source)
+
+    for start in range(0, len(x), chunk_size):
+        yield np.asarray(x[start:start + chunk_size], dtype=float), np.asarray(y[start:start + chunk_size], dtype=float)
+
+
+def _csv_chunks(path, chunk_size):
+    """Parse a CSV file of samples a chunk of lines at a time, skipping a header line."""
+    with open(path) as file:
+        first = True
+        while True:
+            lines = list(itertools.islice(file, chunk_size))
+            if not lines:
+                return
+            if first:
+                first = False
+                try:
+                    [float(value) for value in lines[0].split(",")]
+                except ValueError:
+                    lines = lines[1:]
+                    if not lines:
+                        continue
+            samples = np.loadtxt(lines, delimiter=",", ndmin=2)
+            yield _split_columns(samples)
+
+
+def pchip_slopes(x, y, k):
+    """The slopes of the monotone cubic (PCHIP) interpolant of the samples at the indices k.
+
+    Each slope only depends on the neighbouring samples, so the interpolant can be evaluated on memory-mapped data
+    without computing all the slopes. Interior slopes are weighted harmonic means of the neighbouring secants, and
+    zero where the data has an extremum (Fritsch and Butland). The end slopes use a shape-preserving three-point
+    formula.
+
+    Parameters:
+    - x, y (array_like): The samples, with x strictly increasing.
+    - k (ndarray): The sample indices.
+
+    Returns:
+    - d (ndarray): The slopes at the indices.
+    """
+    n = len(x)
+    if n == 2:
+        return np.full(k.shape, (y[1] - y[0]) / (x[1] - x[0]))
+
+    # The secants on both sides, taking the two first or last secants at the ends
+    left = np.clip(k - 1, 0, n - 3)
+    x0, x1, x2 = (np.asarray(x[left + j], dtype=float) for j in range(3))
+    y0, y1, y2 = (np.asarray(y[left + j], dtype=float) for j in range(3))
+    h0, h1 = x1 - x0, x2 - x1
+    delta0, delta1 = (y1 - y0) / h0, (y2 - y1) / h1
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        w0, w1 = 2 * h1 + h0, h1 + 2 * h0
+        interior = (w0 + w1) / (w0 / delta0 + w1 / delta1)
+    interior = np.where(np.sign(delta0) * np.sign(delta1) > 0, interior, 0.0)
+
+    def end_slope(h_near, h_far, delta_near, delta_far):
+        d = ((2 * h_near + h_far) * delta_near - h_near * delta_far) / (h_near + h_far)
+        d = np.where(np.sign(d) != np.sign(delta_near), 0.0, d)
+        overshoot = (np.sign(delta_near) != np.sign(delta_far)) & (np.abs(d) > 3 * np.abs(delta_near))
+        return np.where(overshoot, 3 * delta_near, d)
+
+    slopes = np.where(k == 0, end_slope(h0, h1, delta0, delta1), interior)
+    return np.where(k == n - 1, end_slope(h1, h0, delta1, delta0), slopes)
+
+
+def hermite_segment(x0, x1, y0, y1, d0, d1, t):
+    """Evaluate at t the cubic Hermite polynomial on [x0, x1] with end values y0, y1 and end slopes d0, d1."""
+    h = x1 - x0
+    s = (t - x0) / h
+    s2, s3 = s * s, s * s * s
+    return (2 * s3 - 3 * s2 + 1) * y0 + (s3 - 2 * s2 + s) * h * d0 + (-2 * s3 + 3 * s2) * y1 + (s3 - s2) * h * d1
+
+
+class TabulatedFunction:
+    """A function known only through samples, interpolated linearly or with a monotone cubic (PCHIP).
+
+    It can be used as f by every solver, like a function compiled from an expression. The samples may be memory
+    mapped, since only the samples around the evaluated points are read. The monotone cubic does not overshoot the
+    data, so it has a root between two samples exactly when the samples change sign.
+
+    Attributes:
+    - x, y (array_like): The samples, with x strictly increasing.
+    - kind (str): "linear" or "pchip".
+    """
+
+    def __init__(self, x, y, kind="pchip"):
+        if kind not in INTERPOLATION_KINDS:
+            raise ValueError(f"Unknown interpolation '{kind}'. Choose one of: {', '.join(INTERPOLATION_KINDS)}.")
+        if len(x) < 2 or len(x) != len(y):
+            raise ValueError("At least two samples with as many x as y values are required.")
+        self.x = x
+        self.y = y
+        self.kind = kind
+
+    @classmethod
+    def from_file(cls, path, kind="pchip"):
+        """Create the function from a sample file, memory-mapped when the format allows it."""
+        return cls(*load_samples(path), kind=kind)
+
+    def __call__(self, t):
+        """Evaluate the interpolant. Points outside the sampled range give NaN."""
+        t_array = np.asarray(t, dtype=float)
+        n = len(self.x)
+        # The segment of every point, the last one including the right end
+        i = np.clip(np.searchsorted(self.x, t_array, side="right") - 1, 0, n - 2)
+        x0, x1 = np.asarray(self.x[i], dtype=float), np.asarray(self.x[i + 1], dtype=float)
+        y0, y1 = np.asarray(self.y[i], dtype=float), np.asarray(self.y[i + 1], dtype=float)
+
+        if self.kind == "linear":
+            values = y0 + (y1 - y0) * (t_array - x0) / (x1 - x0)
+        else:
+            d0, d1 = pchip_slopes(self.x, self.y, i), pchip_slopes(self.x, self.y, i + 1)
+            values = hermite_segment(x0, x1, y0, y1, d0, d1, t_array)
+
+        values = np.where((t_array < self.x[0]) | (t_array > self.x[n - 1]), np.nan, values)
+        return values.item() if values.ndim == 0 else values
@@ -0,0 +1,330 @@
+"""Parsing and symbolic preparation of untrusted expressions in worker processes with resource limits.
+
+sympify, differentiation and eval run arbitrary amounts of work: 9**9**9 never finishes and deeply nested expressions
+can exhaust the memory. Expressions from the GUI or from problem files are therefore prepared in a pool of worker
+processes, each limited in CPU time and memory, and killed and replaced when it runs over. The results are then
+seeded into the ParsedExpression cache of this process, so the expression is not prepared again here.
+"""
+import collections
+import multiprocessing
+import os
+import queue
+import threading
+
+from src.utils.metrics import REGISTRY
+from src.utils.parsed_expression import get_parsed_expression
+from src.utils.simplification import fork_transforms, warm_up
+
+try:
+    import resource
+except ImportError:  # Windows: only the wall-clock limit applies
+    resource = None
+
+# CPU seconds that preparing one expression may take
+SANDBOX_TIME_LIMIT = 2.0
+
+# Bytes of memory a worker may allocate beyond what it uses once its imports are done
+SANDBOX_MEMORY_LIMIT = 1024 ** 3
+
+# Wall-clock seconds, beyond the CPU time limit, after which a worker that does not answer is killed
+SANDBOX_WALL_MARGIN = 2.0
+
+# Wall-clock seconds a new worker may take to import and set up SymPy before it is considered broken
+SANDBOX_START_TIMEOUT = 60.0
+
+# Number of prepared or invalid expressions whose outcome is kept
+SANDBOX_CACHE_SIZE = 1024
+
+# The point at which every prepared expression is evaluated once, and the value given to its parameters
+PROBE_POINT = 0.5
+PROBE_PARAMETER = 1.0
+
+
+class ExpressionRejected(ValueError):
+    """Raised when an expression cannot be prepared: it is invalid, or it ran over the time or memory limit."""
+
+
+def _address_space():
+    """The bytes of virtual memory this process uses, or 0 where that cannot be read."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def _prepare(source, order):
+    """Parse an expression, differentiate it order times and evaluate everything once.
+
+    Returns:
+    - dict: The LaTeX, the parameters and, for every derivative, its source, common subexpressions, simplification
+      strategy and time.
+    """
+    parsed = get_parsed_expression(source)
+    expressions = parsed.derivatives(order)
+
+    # A first evaluation catches names that cannot be evaluated, and constants too large to compute
+    values = [PROBE_PARAMETER] * len(parsed.parameters)
+    for expression in expressions:
+        try:
+            expression.parametric_function(parsed.parameters)(PROBE_POINT, *values)
+        except (ArithmeticError, ValueError):
+            pass  # Domain errors and poles at the probe point
+
+    return {
+        "latex": parsed.latex,
+        "parameters": parsed.parameters,
+        "derivatives": [(expression.source, expression.cse_form, expression.simplify_strategy,
+                         expression.simplify_seconds) for expression in expressions[1:]],
+    }
+
+
+def _set_cpu_limit(soft=None):
+    """Set the soft limit on the CPU seconds of this process, or lift it up to the hard limit."""
+    hard = resource.getrlimit(resource.RLIMIT_CPU)[1]
+    if soft is None or (hard != resource.RLIM_INFINITY and soft > hard):
+        soft = hard
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _worker_main(connection, memory_limit):
+    """Prepare the expressions received on a connection until None is received, under resource limits.
+
+    "ready" is sent once the worker is set up. Every reply to an expression is (status, value, retire, metrics):
+    status is "ok", "invalid" for expressions that cannot be parsed or evaluated, or "error" when a limit was reached,
+    retire tells the parent that the worker is exiting, and metrics is the snapshot of the stages the worker timed.
+    """
+    # SymPy is imported and set up before the limits are set, so that this counts neither against the time limit of
+    # the first expression nor against the memory limit. A worker runs no other thread, so it can fork the transforms
+    # of the simplification safely, and cannot start helpers for them as it is daemonic.
+    fork_transforms()
+    warm_up()
+
+    if resource is not None:
+        limit = _address_space() + memory_limit
+        resource.setrlimit(resource.RLIMIT_AS, (limit, resource.getrlimit(resource.RLIMIT_AS)[1]))
+    connection.send("ready")
+
+    while True:
+        # The parent closes its end when it exits without stopping the worker
+        try:
+            task = connection.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        source, order, time_limit = task
+
+        # The CPU limit counts from the start of the process, so it is moved forward for every task and lifted while
+        # the worker waits for the next one. A worker that reaches it is killed by SIGXCPU.
+        if resource is not None:
+            usage = resource.getrusage(resource.RUSAGE_SELF)
+            _set_cpu_limit(int(usage.ru_utime + usage.ru_stime + time_limit) + 1)
+
+        try:
+            status, value = "ok", _prepare(source, order)
+        except MemoryError:
+            status, value = "error", "Preparing the expression ran out of memory."
+        except Exception as e:
+            status, value = "invalid", f"Invalid expression: {e}"
+
+        if resource is not None:
+            _set_cpu_limit()
+
+        # The heap may be left fragmented by a MemoryError, and no work may go on in the background between tasks,
+        # so in either case the worker retires and is replaced
+        retire = status == "error" or threading.active_count() > 1
+        connection.send((status, value, retire, REGISTRY.collect()))
+        if retire:
+            return
+
+
+class _Worker:
+    """A worker process and the parent's end of its connection."""
+
+    def __init__(self, context, memory_limit):
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_connection, memory_limit), daemon=True)
+        self.process.start()
+        child_connection.close()
+        self.ready = False
+
+    def wait_ready(self):
+        """Wait until the worker has set up SymPy, which takes a while after it is started.
+
+        Returns:
+        - bool: Whether the worker became ready within SANDBOX_START_TIMEOUT seconds.
+        """
+        if not self.ready and self.connection.poll(SANDBOX_START_TIMEOUT):
+            self.ready = self.connection.recv() == "ready"
+        return self.ready
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+class ExpressionSandbox:
+    """A reusable pool of worker processes that prepare expressions under CPU time and memory limits.
+
+    A worker that runs over its limits, crashes or does not answer in time is killed and a new one is started in its
+    place right away, so a bad expression costs at most the time limit. The outcome of every expression, prepared or
+    rejected, is kept, so an expression that appears on many rows of a batch is only prepared once. Workers are
+    started on first use.
+
+    Attributes:
+    - workers (int): The maximum number of worker processes.
+    - time_limit (float): The CPU seconds preparing one expression may take.
+    - memory_limit (int): The bytes a worker may allocate beyond its imports. Not enforced on Windows.
+    """
+
+    def __init__(self, workers=1, time_limit=SANDBOX_TIME_LIMIT, memory_limit=SANDBOX_MEMORY_LIMIT):
+        self.workers = workers
+        self.time_limit = time_limit
+        self.memory_limit = memory_limit
+        # Spawned workers do not inherit the state of the parent, which may be running a GUI
+        self._context = multiprocessing.get_context("spawn")
+        self._idle = queue.Queue()
+        self._started = 0
+        self._lock = threading.Lock()
+        self._outcomes = collections.OrderedDict()
+        self._outcomes_lock = threading.Lock()
+
+    def _acquire(self):
+        """Take an idle worker, starting one if fewer than workers are running."""
+        with self._lock:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                if self._started < self.workers:
+                    self._started += 1
+                    return _Worker(self._context, self.memory_limit)
+        return self._idle.get()
+
+    def _replace(self, worker):
+        """Kill a worker and return a new one in its place, which imports SymPy before it takes a task."""
+        worker.kill()
+        return _Worker(self._context, self.memory_limit)
+
+    def start(self):
+        """Start a worker ahead of the first expression, since a new worker takes a while to import SymPy."""
+        self._idle.put(self._acquire())
+
+    def prepare(self, source, order=1):
+        """Prepare an expression and its first order derivatives in a worker.
+
+        Parameters:
+        - source (str): The expression as Python source.
+        - order (int): The number of derivatives to prepare.
+
+        Returns:
+        - dict: The LaTeX, the parameters and the derivatives of the expression, as returned by the worker.
+
+        Raises:
+        - ExpressionRejected: If the expression is invalid, or preparing it ran over a limit or killed the worker.
+        """
+        key = (source, order)
+        with self._outcomes_lock:
+            outcome = self._outcomes.get(key)
+            if outcome is not None:
+                self._outcomes.move_to_end(key)
+        if outcome is None:
+            outcome = self._run(source, order)
+
+            # Only deterministic outcomes are kept. Running over a limit may be down to the load of the machine.
+            if outcome[0] != "error":
+                with self._outcomes_lock:
+                    self._outcomes[key] = outcome
+                    if len(self._outcomes) > SANDBOX_CACHE_SIZE:
+                        self._outcomes.popitem(last=False)
+
+        status, value = outcome
+        if status != "ok":
+            raise ExpressionRejected(value)
+        return value
+
+    def _run(self, source, order):
+        """Send an expression to a worker and wait for the outcome, replacing the worker if it fails."""
+        worker = self._acquire()
+        try:
+            # A worker that died while it was idle did not fail on this expression, so a fresh one is tried instead
+            if not worker.process.is_alive():
+                worker = self._replace(worker)
+            try:
+                worker.connection.send((source, order, self.time_limit))
+            except OSError:
+                worker = self._replace(worker)
+                worker.connection.send((source, order, self.time_limit))
+
+            # The time limit starts once a new worker has set up SymPy, so a slow start does not reject the expression
+            if not worker.wait_ready():
+                worker = self._replace(worker)
+                return "error", f"The sandbox worker did not start within {SANDBOX_START_TIMEOUT} s."
+            if not worker.connection.poll(self.time_limit + SANDBOX_WALL_MARGIN):
+                worker = self._replace(worker)
+                return "error", f"Preparing the expression took longer than {self.time_limit} s."
+            status, value, retire, metrics = worker.connection.recv()
+            REGISTRY.merge(metrics)
+            if retire:
+                worker = self._replace(worker)
+        except (EOFError, OSError):
+            # The worker was killed by a limit, usually the CPU time
+            worker = self._replace(worker)
+            return "error", f"Preparing the expression exceeded the limit of {self.time_limit} s of CPU time or " \
+                            f"{self.memory_limit // 1024 ** 2} MB of memory."
+        finally:
+            self._idle.put(worker)
+        return status, value
+
+    def close(self):
+        """Stop the idle workers."""
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                worker.connection.send(None)
+            except OSError:
+                pass
+            worker.kill()
+            with self._lock:
+                self._started -= 1
+
+
+_SANDBOX = None
+_SANDBOX_LOCK = threading.Lock()
+
+
+def get_sandbox():
+    """Returns the sandbox shared by this process, creating it on first use."""
+    global _SANDBOX
+    with _SANDBOX_LOCK:
+        if _SANDBOX is None:
+            _SANDBOX = ExpressionSandbox()
+        return _SANDBOX
+
+
+def prepare_expression(source, order=1, sandbox=None):
+    """Prepare an expression in the sandbox, and seed its shared ParsedExpression with the results.
+
+    The LaTeX, the parameters and the derivatives are stored on the ParsedExpression returned by
+    get_parsed_expression, so the GUI and the solvers find them there and this process does no symbolic work for
+    them.
+
+    Parameters:
+    - source (str): The expression as Python source.
+    - order (int): The number of derivatives to prepare.
+    - sandbox (ExpressionSandbox, optional): The sandbox to use. Defaults to the one shared by this process.
+
+    Returns:
+    - ParsedExpression: The shared parsed expression.
+
+    Raises:
+    - ExpressionRejected: If the expression is invalid, or preparing it ran over a limit.
+    """
+    prepared = (sandbox or get_sandbox()).prepare(source, order)
+    parsed = get_parsed_expression(source)
+    parsed.seed(prepared["latex"], prepared["parameters"], prepared["derivatives"])
+    return parsed
@@ -0,0 +1,276 @@
+import functools
+import multiprocessing
+import os
+import pickle
+import queue
+import select
+import signal
+import time
+
+from src.utils.metrics import REGISTRY
+
+# Seconds that simplifying one expression may take in total
+SIMPLIFY_TIME_LIMIT = 0.5
+
+# Expressions with more operations than these skip the cheap transforms, and the full simplify
+CHEAP_MAX_OPS = 2000
+SIMPLIFY_MAX_OPS = 50
+
+# Expressions with at most this many operations are small enough for cancel, together and the extraction of common
+# subexpressions to take milliseconds, so these run in the calling thread instead of another process
+INLINE_MAX_OPS = 50
+
+# Share of the time limit kept for extracting common subexpressions, after the transforms
+CSE_TIME_SHARE = 0.2
+
+# Wall-clock seconds a new helper process may take to set up SymPy before it is considered broken
+HELPER_START_TIMEOUT = 60.0
+
+# Whether the transforms run in children forked from this process instead of in spawned helper processes. See
+# fork_transforms.
+_fork_transforms = False
+
+# Idle helper processes, shared by the threads of this process
+_idle_helpers = queue.Queue()
+
+
+@functools.lru_cache(maxsize=None)
+def warm_up():
+    """Apply every transform once to a small expression in this process.
+
+    Their first call imports and sets up much of SymPy, which takes longer than most transforms themselves. Done once
+    in a helper process, or before the first child process is forked, it is not repeated for every transform.
+    """
+    import sympy as sp
+
+    x = sp.Symbol("x")
+    for transform in (sp.cancel, sp.together, sp.simplify, _extract_subexpressions):
+        transform(sp.sin(x) ** 2 + 1 / (x + 1))
+
+
+def _extract_subexpressions(expr):
+    """Common subexpressions of an expression, named _cse0, _cse1 and so on, as returned by sp.cse."""
+    import sympy as sp
+
+    return sp.cse(expr, symbols=sp.numbered_symbols("_cse"))
+
+
+def _transforms():
+    """The transforms by name. Only names are sent to helper processes."""
+    import sympy as sp
+
+    return {"cancel": sp.cancel, "together": sp.together, "simplify": sp.simplify, "cse": _extract_subexpressions}
+
+
+def fork_transforms():
+    """Run the transforms in children forked from this process from now on, instead of in spawned helpers.
+
+    A child forked while another thread holds a lock, such as the import lock, can deadlock, so this is only for
+    processes that run no other thread, such as the sandbox workers. These cannot start helpers, since daemonic
+    processes cannot have children.
+    """
+    global _fork_transforms
+    _fork_transforms = hasattr(os, "fork")
+
+
+def _can_isolate():
+    """Whether transforms can run in another process that is killed at the time limit."""
+    return _fork_transforms or not multiprocessing.current_process().daemon
+
+
+def _helper_main(connection):
+    """Apply the transforms received on a connection until it is closed.
+
+    "ready" is sent once SymPy is set up. Every reply is the transformed expression, or None if the transform raised.
+    """
+    warm_up()
+    transforms = _transforms()
+    connection.send("ready")
+    while True:
+        try:
+            name, expr = connection.recv()
+        except EOFError:
+            return
+        try:
+            result = transforms[name](expr)
+        except Exception:
+            result = None
+        connection.send(result)
+
+
+class _Helper:
+    """A spawned helper process and the parent's end of its connection.
+
+    Spawned processes start from a fresh interpreter, so unlike forked ones they are safe to start while other threads,
+    such as those of a GUI, hold locks.
+    """
+
+    def __init__(self):
+        context = multiprocessing.get_context("spawn")
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(target=_helper_main, args=(child_connection,), daemon=True)
+        self.process.start()
+        child_connection.close()
+        self.ready = False
+
+    def wait_ready(self):
+        """Wait until the helper has set up SymPy, and return whether it did within HELPER_START_TIMEOUT seconds."""
+        if not self.ready and self.connection.poll(HELPER_START_TIMEOUT):
+            self.ready = self.connection.recv() == "ready"
+        return self.ready
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+def _run_in_helper(name, expr, timeout):
+    """Apply a transform in a helper process, killing it after timeout seconds.
+
+    SymPy cannot be interrupted, so a transform that runs over is stopped by killing its process, and none of its work
+    goes on in the background. A new helper is started in its place right away, so it sets up SymPy in the meantime.
+    """
+    try:
+        helper = _idle_helpers.get_nowait()
+    except queue.Empty:
+        helper = _Helper()
+
+    start = time.perf_counter()
+    try:
+        ready = helper.wait_ready()
+        startup = time.perf_counter() - start
+        if ready:
+            helper.connection.send((name, expr))
+            if helper.connection.poll(timeout):
+                result = helper.connection.recv()
+                _idle_helpers.put(helper)
+                return result, startup
+    except (EOFError, OSError):
+        startup = 0.0
+    helper.kill()
+    _idle_helpers.put(_Helper())
+    return None, startup
+
+
+def _run_in_fork(name, expr, timeout):
+    """Apply a transform in a forked child process, killing it after timeout seconds.
+
+    The result is sent back pickled. A transform that raises counts as one that did not finish.
+    """
+    deadline = time.monotonic() + timeout
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(read_fd)
+            with os.fdopen(write_fd, "wb") as pipe:
+                pickle.dump(_transforms()[name](expr), pipe)
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    chunks = []
+    try:
+        with os.fdopen(read_fd, "rb", buffering=0) as pipe:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not select.select([pipe], [], [], remaining)[0]:
+                    return None
+                chunk = pipe.read(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        return pickle.loads(b"".join(chunks)) if chunks else None
+    except Exception:
+        return None
+    finally:
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+
+
+def _run_with_timeout(name, expr, timeout):
+    """Apply the named transform in another process within timeout seconds.
+
+    Returns:
+    - result: The transformed expression, or None if the transform did not finish.
+    - startup (float): The seconds spent waiting for a helper process to set up SymPy, which do not count towards the
+      timeout.
+    """
+    if _fork_transforms:
+        return _run_in_fork(name, expr, timeout), 0.0
+    return _run_in_helper(name, expr, timeout)
+
+
+def simplify_bounded(expr, time_limit=SIMPLIFY_TIME_LIMIT):
+    """Simplify an expression within a bounded time, keeping whichever form is cheapest to evaluate.
+
+    sp.simplify can take minutes on nested transcendental expressions, so the cheap transforms cancel and together are
+    tried first, and simplify only on small expressions. The cost of a form is its number of operations, and the
+    unsimplified expression is kept unless a transform reduces it. Common subexpressions of the result are then
+    extracted when that saves operations. Every transform, the extraction included, runs in a spawned helper process
+    that is killed once the time limit is reached, so nothing goes on in the background afterwards, except on small
+    expressions, where the cheap transforms take milliseconds and run in this thread. In a daemonic process, which
+    cannot start helpers, only these run, unless fork_transforms was called.
+
+    Parameters:
+    - expr (sp.Expr): The expression to simplify, typically a raw derivative.
+    - time_limit (float): The number of seconds all the transforms together may take.
+
+    Returns:
+    - simplified (sp.Expr): The cheapest form found.
+    - cse_form (tuple, optional): The form to evaluate when subexpressions were extracted, or None. It holds the
+      (name, source) pairs of the subexpressions, in the order they must be assigned, and the source of the result
+      in terms of them.
+    - strategy (str): The transform that was kept, "diff" for none, with "+cse" when subexpressions were extracted.
+    - seconds (float): The time taken, without starting helper processes.
+    """
+    import sympy as sp
+
+    if _fork_transforms:
+        warm_up()
+    isolated = _can_isolate()
+    start = time.perf_counter()
+    best, strategy = expr, "diff"
+    best_cost = size = sp.count_ops(expr)
+
+    def run(name, expr, reserve=0.0, inline=False):
+        """Apply a transform within the time left beyond reserve seconds, or None if it does not finish."""
+        nonlocal start
+        remaining = time_limit - reserve - (time.perf_counter() - start)
+        if remaining <= 0:
+            return None
+        if inline:
+            return _transforms()[name](expr)
+        result, startup = _run_with_timeout(name, expr, remaining)
+        # Setting up a helper process is not part of simplifying the expression
+        start += startup
+        return result
+
+    cheap_max_ops = CHEAP_MAX_OPS if isolated else INLINE_MAX_OPS
+    transforms = []
+    if size <= cheap_max_ops:
+        transforms += ["cancel", "together"]
+    if size <= SIMPLIFY_MAX_OPS and isolated:
+        transforms.append("simplify")
+
+    for name in transforms:
+        candidate = run(name, expr, CSE_TIME_SHARE * time_limit, name != "simplify" and size <= INLINE_MAX_OPS)
+        if candidate is not None and sp.count_ops(candidate) < best_cost:
+            best, best_cost, strategy = candidate, sp.count_ops(candidate), name
+
+    # Evaluate repeated subexpressions once, when that saves operations
+    cse_form = None
+    extracted = None
+    if best_cost <= cheap_max_ops:
+        extracted = run("cse", best, inline=best_cost <= INLINE_MAX_OPS)
+    if extracted is not None:
+        replacements, (reduced,) = extracted
+        if replacements and sp.count_ops(reduced) + sum(sp.count_ops(value) for _, value in replacements) < best_cost:
+            cse_form = ([(str(symbol), str(value)) for symbol, value in replacements], str(reduced))
+            strategy += "+cse"
+
+    seconds = time.perf_counter() - start
+    REGISTRY.inc("rootfinder_simplifications_total", strategy=strategy)
+    REGISTRY.observe("rootfinder_expression_seconds", seconds, stage="simplify")
+    return best, cse_form, strategy, seconds
@@ -0,0 +1,148 @@
+import contextlib
+import contextvars
+import threading
+import time
+
+import numpy as np
+
+from src.utils.finite_difference import wrap_functions
+
+
+class SolverStopped(ValueError):
+    """Raised when a solve is stopped by a limit before it converges.
+
+    It is a ValueError like every other solver failure, and carries the best iterate seen so far, that is the
+    evaluated point with the smallest residual.
+
+    Attributes:
+    - x: The best iterate, or None if nothing was evaluated or the solver does not track one.
+    - fx: The function value at the best iterate.
+    - nfev (int): The number of function evaluations made.
+    """
+
+    reason = "Solve stopped"
+
+    def __init__(self, x=None, fx=None, nfev=0):
+        self.x = x
+        self.fx = fx
+        self.nfev = nfev
+        message = f"{self.reason} after {nfev} function evaluations."
+        if x is not None:
+            message += f" Best iterate: x = {x}, f(x) = {fx}."
+        super().__init__(message)
+
+
+class BudgetExhausted(SolverStopped):
+    reason = "Evaluation budget exhausted"
+
+
+class DeadlineExceeded(SolverStopped):
+    reason = "Deadline exceeded"
+
+
+class Cancelled(SolverStopped):
+    reason = "Solve cancelled"
+
+
+class CancellationToken:
+    """A thread-safe flag that asks running solves to stop at their next function evaluation.
+
+    By default the flag is a threading.Event. A multiprocessing Event shares it with worker processes.
+    """
+
+    def __init__(self, event=None):
+        self._event = threading.Event() if event is None else event
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+
+# The evaluation counter of the solve that is running in this context, if it is recorded
+_evaluation_counter = contextvars.ContextVar("evaluation_counter", default=None)
+
+
+@contextlib.contextmanager
+def count_evaluations():
+    """Count the evaluations of the functions that limit_evaluations wraps in a with block, for the solve metrics.
+
+    Yields:
+    - dict: The counter, whose "nfev" entry holds the number of evaluations so far.
+    """
+    counter = {"nfev": 0}
+    token = _evaluation_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _evaluation_counter.reset(token)
+
+
+def _residual(value):
+    """The size of a function value, the largest component for vector functions."""
+    if isinstance(value, (int, float, complex)):
+        return abs(value)
+    return float(np.max(np.abs(value)))
+
+
+def limit_evaluations(funcs, max_fev=None, deadline=None, cancel_token=None, track_best=True, count_elements=False):
+    """Wrap a function and its derivatives so that the limits are checked before every evaluation.
+
+    The evaluations of all the functions count towards max_fev, and towards the counter of count_evaluations when
+    one is active. A derivative made by finite_difference counts each evaluation of the function it makes instead of
+    one per call. When no limit is set and nothing is counted the functions are returned unchanged, so such solves pay
+    nothing.
+
+    Parameters:
+    - funcs (list of function): The function to find the root of, followed by any derivatives.
+    - max_fev (int, optional): The maximum number of function evaluations.
+    - deadline (float, optional): The time.monotonic() value after which no further evaluation is started.
+    - cancel_token (CancellationToken, optional): A token that cancels the solve when set.
+    - track_best (bool): Whether to remember the evaluated point of the first function with the smallest residual.
+    - count_elements (bool): Whether an evaluation on an array counts once per element, for vectorized solvers.
+
+    Returns:
+    - list of function: The wrapped functions, in the same order.
+
+    Raises (from the wrapped functions):
+    - BudgetExhausted, DeadlineExceeded, Cancelled: When a limit is reached.
+    """
+    # The counter is taken now, since the functions may be evaluated in other threads
+    counter = _evaluation_counter.get()
+    if max_fev is None and deadline is None and cancel_token is None and counter is None:
+        return list(funcs)
+
+    state = {"nfev": 0, "x": None, "fx": None, "residual": float("inf")}
+
+    def check():
+        if cancel_token is not None and cancel_token.cancelled:
+            raise Cancelled(state["x"], state["fx"], state["nfev"])
+        if deadline is not None and time.monotonic() >= deadline:
+            raise DeadlineExceeded(state["x"], state["fx"], state["nfev"])
+        if max_fev is not None and state["nfev"] >= max_fev:
+            raise BudgetExhausted(state["x"], state["fx"], state["nfev"])
+
+    def wrap(func):
+        is_primary = func is funcs[0]
+
+        def limited(x):
+            check()
+            nfev = getattr(x, "size", 1) if count_elements else 1
+            state["nfev"] += nfev
+            if counter is not None:
+                counter["nfev"] += nfev
+            value = func(x)
+
+            # Remember the point with the smallest residual
+            if is_primary and track_best:
+                residual = _residual(value)
+                if residual < state["residual"]:
+                    state["x"], state["fx"], state["residual"] = x, value, residual
+            return value
+
+        return limited
+
+    # A finite-difference derivative is rebuilt on the wrapped function, so that every evaluation it makes counts
+    return wrap_functions(funcs, wrap)
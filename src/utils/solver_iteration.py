@@ -0,0 +1,25 @@
+from src.utils.metrics import recorded_solve
+
+
+def run_to_completion(steps):
+    """Drive a solver generator until it finishes and return its result.
+
+    Every solver in src/algorithms has a generator form that yields its state after each iteration and returns the
+    final result once the root is found. This consumes all the states and returns that result. The solve is recorded
+    in the metrics under the name of the generator without its _iter suffix.
+
+    Parameters:
+    - steps (generator): A solver generator, such as the one returned by bisection_iter.
+
+    Returns:
+    - The value returned by the generator, typically the tuple (x, n).
+
+    Raises:
+    - ValueError: Whatever error the solver raises, such as exceeding the maximum number of iterations.
+    """
+    with recorded_solve(steps.__name__.removesuffix("_iter")):
+        while True:
+            try:
+                next(steps)
+            except StopIteration as stop:
+                return stop.value
@@ -1,4 +1,5 @@
-import sympy as sp
+from src.utils.parsed_expression import get_parsed_expression
+from src.utils.simplification import simplify_bounded
 
 
 def parse_expression(expr_str, variable):
@@ -12,6 +13,9 @@ def parse_expression(expr_str, variable):
     Returns:
     - sp.Expr: The parsed SymPy expression.
     """
+    # SymPy is the slowest import of the package, so it is imported on first use to keep the GUI startup fast
+    import sympy as sp
+
     var = sp.symbols(variable)
     return sp.sympify(expr_str), var
 
@@ -27,8 +31,25 @@ def compute_derivative(expr_str, variable='x'):
     Returns:
     - str: The derivative of the expression.
     """
-    expr, var = parse_expression(expr_str, variable)
-    derivative = sp.diff(expr, var)
-    # Simplify the expression
-    simplified_derivative = sp.simplify(derivative)
-    return str(simplified_derivative)
+    # The parsed expression keeps the simplified derivative, so repeated requests do no symbolic work. The
+    # simplification is bounded in time, see simplify_bounded.
+    return get_parsed_expression(expr_str).derivative(variable).source
+
+
+def compute_jacobian(expr_strs, variables):
+    """
+    Compute the Jacobian matrix of a system of expressions with respect to the given variables.
+
+    Args:
+    - expr_strs (list of str): The component expressions of the system as strings.
+    - variables (list of str): The variables of the system, in order.
+
+    Returns:
+    - list of list of str: The entry J[i][j] is the derivative of expression i with respect to variable j.
+    """
+    import sympy as sp
+
+    exprs = [sp.sympify(expr_str) for expr_str in expr_strs]
+    var_symbols = [sp.symbols(variable) for variable in variables]
+    jacobian = sp.Matrix(exprs).jacobian(var_symbols)
+    return [[str(simplify_bounded(jacobian[i, j])[0]) for j in range(len(var_symbols))] for i in range(len(exprs))]
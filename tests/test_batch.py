@@ -0,0 +1,113 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.algorithms.bisection import bisection
+from src.algorithms.newton import newton
+from src.utils.batch import solve_batch
+from src.utils.finite_difference import finite_difference
+from src.utils.function_evaluation import get_function, get_function_and_derivatives
+from src.utils.result_store import (RESULT_DTYPE, STATUS_BUDGET_EXHAUSTED, STATUS_CANCELLED, STATUS_CONVERGED,
+                                    STATUS_FAILED, STATUS_PENDING, load_results, open_result_file)
+from src.utils.solve_limits import CancellationToken
+
+
+def test_solve_batch_in_memory():
+    f, df, _ = get_function_and_derivatives("x**2 - 2")
+    results = solve_batch(newton, f, [1, 2, -3], derivatives=(df,), tol=1e-10)
+    assert results.dtype == RESULT_DTYPE
+    assert np.allclose(results["root"], [math.sqrt(2), math.sqrt(2), -math.sqrt(2)])
+    assert np.all(results["status"] == STATUS_CONVERGED)
+    assert np.all(results["nfev"] > results["iterations"])
+
+
+def test_solve_batch_records_failures():
+    f = get_function("x**2 - 2")
+    results = solve_batch(bisection, f, [[0, 2], [2, 3]])
+    assert list(results["status"]) == [STATUS_CONVERGED, STATUS_FAILED]
+    assert math.isnan(results["root"][1])
+
+
+def test_solve_batch_counts_finite_difference_evaluations():
+    calls = []
+
+    def f(x):
+        calls.append(x)
+        return math.exp(x) - 2
+
+    results = solve_batch(newton, f, [1.0], derivatives=(finite_difference(f),), tol=1e-10)
+    assert results["status"][0] == STATUS_CONVERGED
+    assert results["nfev"][0] == len(calls)
+
+    # Every evaluation the derivative makes counts towards max_fev
+    calls.clear()
+    results = solve_batch(newton, f, [1.0], derivatives=(finite_difference(f),), tol=1e-10, max_fev=10)
+    assert results["status"][0] == STATUS_BUDGET_EXHAUSTED
+    assert results["nfev"][0] == len(calls) == 10
+
+
+def test_solve_batch_to_file(tmp_path):
+    path = tmp_path / "results.npy"
+    f = get_function("x**3 - x")
+    brackets = [[-1.5, -0.5], [-0.5, 0.25], [0.5, 1.5]] * 10
+    solve_batch(bisection, f, brackets, out=path, chunk_size=4, flush_every=2, tol=1e-8)
+
+    results = load_results(path)
+    assert isinstance(results, np.memmap)
+    assert np.allclose(results["root"][:3], [-1, 0, 1], atol=1e-7)
+    assert np.all(results["status"] == STATUS_CONVERGED)
+
+
+def test_solve_batch_resumes_interrupted_run(tmp_path):
+    path = tmp_path / "results.npy"
+    f, df, _ = get_function_and_derivatives("x**2 - 2")
+
+    # Simulate a run that was interrupted after the first two chunks
+    out = open_result_file(path, 10)
+    out[:6] = solve_batch(newton, f, np.arange(1, 7), derivatives=(df,))
+    out.flush()
+    del out
+
+    calls = []
+
+    def counting_newton(*args, **kwargs):
+        calls.append(args[2])
+        return newton(*args, **kwargs)
+
+    results = solve_batch(counting_newton, f, np.arange(1, 11), derivatives=(df,), out=path, chunk_size=3)
+    assert calls == [7, 8, 9, 10]
+    assert not np.any(results["status"] == STATUS_PENDING)
+
+
+def test_cancelled_batch_is_resumed(tmp_path):
+    path = tmp_path / "results.npy"
+    f, df, _ = get_function_and_derivatives("x**2 - 2")
+    token = CancellationToken()
+
+    def cancelling_df(x):
+        # Cancel the batch during the fifth problem
+        if x == 5:
+            token.cancel()
+        return df(x)
+
+    results = solve_batch(newton, f, np.arange(1, 11), derivatives=(cancelling_df,), out=path, chunk_size=3,
+                          cancel_token=token)
+    assert list(results["status"]) == [STATUS_CONVERGED] * 4 + [STATUS_CANCELLED] + [STATUS_PENDING] * 5
+    del results
+
+    results = solve_batch(newton, f, np.arange(1, 11), derivatives=(df,), out=path, chunk_size=3,
+                          cancel_token=CancellationToken())
+    assert np.all(results["status"] == STATUS_CONVERGED)
+
+
+def test_open_result_file_rejects_mismatched_size(tmp_path):
+    path = tmp_path / "results.npy"
+    open_result_file(path, 5)
+    with pytest.raises(ValueError) as exif:
+        open_result_file(path, 6)
+    assert "does not match" in str(exif.value)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -2,7 +2,7 @@ import math
 
 import pytest
 
-from src.algorithms.bisection import bisection
+from src.algorithms.bisection import bisection, bisection_iter
 from src.utils.function_evaluation import get_function
 
 
@@ -61,5 +61,22 @@ def test_bisection_small_intervals():
     assert math.isclose(root, math.sqrt(2), rel_tol=1e-10)
 
 
+def test_bisection_iter_yields_brackets():
+    f = get_function("x**2 - 3")
+    states = list(bisection_iter(f, 1, 2, tol=1e-3))
+    assert [state["n"] for state in states] == list(range(1, len(states) + 1))
+    for state in states:
+        assert state["a"] <= 3 ** 0.5 <= state["b"]
+        assert state["fx"] == f(state["x"])
+
+
+def test_bisection_iter_early_stop():
+    f = get_function("x**2 - 3")
+    for state in bisection_iter(f, 1, 2, tol=1e-12):
+        if state["b"] - state["a"] < 1e-3:
+            break
+    assert math.isclose(state["x"], 3 ** 0.5, abs_tol=1e-3)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,63 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.algorithms.chebyshev import chebyshev_roots
+from src.utils.function_evaluation import get_vectorized_function_and_derivatives
+from src.utils.solve_limits import BudgetExhausted
+
+
+def test_chebyshev_roots_typical_case():
+    f, _, _ = get_vectorized_function_and_derivatives("x**3 - x")
+    roots, n = chebyshev_roots(f, -2, 2)
+    np.testing.assert_allclose(roots, [-1, 0, 1], atol=1e-14)
+    assert n < 100
+
+
+def test_chebyshev_roots_many_roots():
+    roots, n = chebyshev_roots(math.sin, -10, 10)
+    np.testing.assert_allclose(roots, [k * math.pi for k in range(-3, 4)], atol=1e-13)
+    assert n < 200
+
+
+def test_chebyshev_roots_high_degree_subdivision():
+    f, _, _ = get_vectorized_function_and_derivatives("cos(20*x)")
+    roots, _ = chebyshev_roots(f, -10, 10)
+    expected = (2 * np.arange(-127, 127) + 1) * math.pi / 40
+    np.testing.assert_allclose(roots, expected[np.abs(expected) <= 10], atol=1e-12)
+
+
+def test_chebyshev_roots_close_pair_and_no_roots():
+    f, _, _ = get_vectorized_function_and_derivatives("(x - 1)*(x - 1.000001)")
+    roots, _ = chebyshev_roots(f, 0, 2)
+    np.testing.assert_allclose(roots, [1, 1.000001], atol=1e-12)
+
+    f, _, _ = get_vectorized_function_and_derivatives("x**2 + 1")
+    roots, _ = chebyshev_roots(f, -2, 2)
+    assert roots.size == 0
+
+
+def test_chebyshev_roots_with_derivative():
+    f, df, _ = get_vectorized_function_and_derivatives("exp(x) - 2")
+    roots, _ = chebyshev_roots(f, 0, 3, df=df)
+    np.testing.assert_allclose(roots, [math.log(2)], atol=1e-15)
+
+
+def test_chebyshev_roots_not_smooth():
+    f, _, _ = get_vectorized_function_and_derivatives("abs(x) - 0.5")
+    with pytest.raises(ValueError, match="not be smooth"):
+        chebyshev_roots(f, -1, 1)
+
+
+def test_chebyshev_roots_invalid_input():
+    with pytest.raises(ValueError, match="a < b"):
+        chebyshev_roots(math.sin, 1, 0)
+    f, _, _ = get_vectorized_function_and_derivatives("1/x")
+    with pytest.raises(ValueError, match="not finite"):
+        chebyshev_roots(f, 0, 1)
+
+
+def test_chebyshev_roots_budget():
+    with pytest.raises(BudgetExhausted):
+        chebyshev_roots(math.sin, -10, 10, max_fev=20)
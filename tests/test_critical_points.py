@@ -0,0 +1,55 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.algorithms.critical_points import critical_points
+from src.utils.function_evaluation import get_vectorized_function_and_derivatives
+
+
+def find(expr, a, b, **kwargs):
+    return critical_points(*get_vectorized_function_and_derivatives(expr), a, b, **kwargs)
+
+
+def test_cubic():
+    minima, maxima, inflections = find("x**3 - 3*x", -3, 3)
+    np.testing.assert_allclose(minima, [1], atol=1e-12)
+    np.testing.assert_allclose(maxima, [-1], atol=1e-12)
+    np.testing.assert_allclose(inflections, [0], atol=1e-12)
+
+
+def test_periodic_function():
+    minima, maxima, inflections = find("sin(x)", -7, 7)
+    np.testing.assert_allclose(minima, [-math.pi / 2, 3 * math.pi / 2], atol=1e-11)
+    np.testing.assert_allclose(maxima, [-3 * math.pi / 2, math.pi / 2], atol=1e-11)
+    np.testing.assert_allclose(inflections, np.arange(-2, 3) * math.pi, atol=1e-11)
+
+
+def test_flat_minimum_is_classified_by_sign_change():
+    # f'' vanishes at the minimum of x**4, and x**3 has a stationary point that is not an extremum
+    minima, maxima, inflections = find("x**4", -1, 1.3)
+    np.testing.assert_allclose(minima, [0], atol=1e-6)
+    assert maxima.size == 0 and inflections.size == 0
+    minima, maxima, inflections = find("x**3", -1, 1.3)
+    assert minima.size == 0 and maxima.size == 0
+    np.testing.assert_allclose(inflections, [0], atol=1e-12)
+
+
+def test_poles_are_not_critical_points():
+    for expr in ["1/x", "tan(x)"]:
+        minima, maxima, inflections = find(expr, -1.9, 1.7)
+        assert minima.size == 0 and maxima.size == 0
+        assert np.all(np.abs(inflections) < 1e-12)
+
+
+def test_scalar_callable():
+    minima, maxima, inflections = find(lambda x: math.sin(x) * math.exp(-x / 5), 0, 10, tol=1e-9)
+    # The extrema of exp(-x/5) sin(x) are where tan(x) = 5
+    np.testing.assert_allclose(maxima, [math.atan(5), math.atan(5) + 2 * math.pi], atol=1e-5)
+    np.testing.assert_allclose(minima, [math.atan(5) + math.pi], atol=1e-5)
+    assert inflections.size == 3
+
+
+def test_invalid_interval():
+    with pytest.raises(ValueError):
+        find("x**2", 1, 1)
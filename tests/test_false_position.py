@@ -2,7 +2,7 @@ import math
 
 import pytest
 
-from src.algorithms.false_position import false_position
+from src.algorithms.false_position import false_position, false_position_iter
 from src.utils.function_evaluation import get_function
 
 
@@ -60,5 +60,42 @@ def test_false_position_small_intervals():
     assert math.isclose(root, math.sqrt(2), rel_tol=1e-10)
 
 
+def test_false_position_iter_matches_driver():
+    f = get_function("x**3 - 2*x - 5")
+    steps = false_position_iter(f, 2, 3, tol=1e-10)
+    states = []
+    with pytest.raises(StopIteration) as exif:
+        while True:
+            states.append(next(steps))
+    assert exif.value.value == false_position(f, 2, 3, tol=1e-10)
+    assert states[-1]["n"] == exif.value.value[1]
+
+
+@pytest.mark.parametrize("variant", ["illinois", "pegasus", "anderson-bjorck"])
+def test_false_position_variants_avoid_stagnation(variant):
+    # One endpoint never moves for the standard method on this convex function
+    f = get_function("exp(x) - 10")
+    with pytest.raises(ValueError):
+        false_position(f, 0, 10)
+    root, iterations = false_position(f, 0, 10, tol=1e-10, variant=variant)
+    assert math.isclose(root, math.log(10), rel_tol=1e-9)
+    assert iterations < 20
+
+
+@pytest.mark.parametrize("variant", ["illinois", "pegasus", "anderson-bjorck"])
+def test_false_position_variants_fewer_iterations(variant):
+    f = get_function("x**3 - 2*x - 5")
+    _, standard_iterations = false_position(f, 2, 3, tol=1e-10)
+    _, variant_iterations = false_position(f, 2, 3, tol=1e-10, variant=variant)
+    assert variant_iterations < standard_iterations
+
+
+def test_false_position_unknown_variant():
+    f = get_function("x - 1")
+    with pytest.raises(ValueError) as exif:
+        false_position(f, 0, 2, variant="secant")
+    assert "Unknown variant" in str(exif.value)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
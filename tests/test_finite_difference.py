@@ -0,0 +1,43 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.algorithms.newton import newton
+from src.utils.finite_difference import derivative, finite_difference, finite_difference_jacobian
+
+
+def test_derivative_first_order():
+    assert derivative(math.exp, 1.0) == pytest.approx(math.e, rel=1e-10)
+    assert derivative(math.log, 0.5) == pytest.approx(2, rel=1e-10)
+
+
+def test_derivative_higher_orders():
+    assert derivative(math.sin, 0.3, order=2) == pytest.approx(-math.sin(0.3), rel=1e-9)
+    assert derivative(lambda x: x ** 5, 2.0, order=3) == pytest.approx(240, rel=1e-8)
+
+
+def test_derivative_large_argument():
+    assert derivative(lambda x: x ** 2, 1e6) == pytest.approx(2e6, rel=1e-10)
+
+
+def test_derivative_arrays_and_complex():
+    x = np.array([0.0, 1.0, 2.0])
+    assert np.allclose(derivative(np.exp, x), np.exp(x), rtol=1e-10)
+    assert derivative(lambda z: z ** 3, 1 + 1j) == pytest.approx(6j, abs=1e-9)
+
+
+def test_derivative_invalid_order():
+    with pytest.raises(ValueError):
+        derivative(math.exp, 1.0, order=0)
+
+
+def test_newton_with_finite_difference():
+    f = lambda x: math.cos(x) - x
+    root, _ = newton(f, finite_difference(f), 1.0, tol=1e-12)
+    assert root == pytest.approx(0.7390851332151607, abs=1e-10)
+
+
+def test_finite_difference_jacobian():
+    J = finite_difference_jacobian(lambda v: np.array([v[0] ** 2 + v[1], math.sin(v[1])]))
+    assert np.allclose(J([1.0, 2.0]), [[2, 1], [0, math.cos(2)]], atol=1e-8)
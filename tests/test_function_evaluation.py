@@ -0,0 +1,84 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.algorithms.nonlinear_system import newton_system
+from src.utils.function_evaluation import (as_vectorized, evaluate_many, get_function, get_function_and_derivatives,
+                                           get_system_and_jacobian, get_vectorized_function_and_derivatives,
+                                           is_vectorized)
+from src.utils.solve_limits import CancellationToken, Cancelled, limit_evaluations
+
+
+def test_is_vectorized():
+    assert is_vectorized(np.sin)
+    assert is_vectorized(lambda x: x ** 2 - 2)
+    assert not is_vectorized(math.sin)
+    assert not is_vectorized(lambda x: 5)
+
+
+def test_is_vectorized_probes_once():
+    calls = []
+
+    def f(x):
+        calls.append(x)
+        return math.cos(x)
+
+    assert not is_vectorized(f)
+    probes = len(calls)
+    evaluate_many(f, np.linspace(0, 1, 5))
+    assert len(calls) == probes + 5
+    evaluate_many(f, np.linspace(0, 1, 5), vectorized=False)
+    assert len(calls) == probes + 10
+
+
+def test_as_vectorized_scalar_callable():
+    f = as_vectorized(math.cos)
+    assert np.allclose(f(np.array([[0.0, 1.0]])), [[1, math.cos(1)]])
+    assert f(np.empty(0)).shape == (0,)
+    assert as_vectorized(np.cos) is np.cos
+
+
+def test_evaluate_many():
+    xs = np.array([-1.0, 4.0])
+    assert np.allclose(evaluate_many(get_function("sqrt(x)"), xs), [np.nan, 2], equal_nan=True)
+    assert np.allclose(evaluate_many(get_function("x**2"), xs), [1, 16])
+
+
+def test_evaluate_many_stops_when_cancelled():
+    token = CancellationToken()
+    calls = []
+
+    def f(x):
+        calls.append(x)
+        if len(calls) == 3:
+            token.cancel()
+        return math.cos(x)
+
+    limited = limit_evaluations([f], cancel_token=token, track_best=False)[0]
+    with pytest.raises(Cancelled):
+        evaluate_many(limited, np.linspace(0, 1, 100), vectorized=False)
+    assert len(calls) == 3
+
+
+def test_callable_derivatives():
+    f, df, ddf = get_function_and_derivatives(math.exp)
+    assert f is math.exp
+    assert df(1.0) == pytest.approx(math.e, rel=1e-10)
+    assert ddf(1.0) == pytest.approx(math.e, rel=1e-8)
+
+
+def test_vectorized_callable_derivatives():
+    f, df, _ = get_vectorized_function_and_derivatives(math.cos)
+    x = np.array([0.5, 1.0])
+    assert np.allclose(f(x), np.cos(x))
+    assert np.allclose(df(x), -np.sin(x))
+
+
+def test_callable_system():
+    F, J = get_system_and_jacobian(lambda v: [v[0] ** 2 + v[1] ** 2 - 4, v[0] - v[1]])
+    root, _ = newton_system(F, J, [1, 2], tol=1e-10)
+    assert np.allclose(root, [math.sqrt(2), math.sqrt(2)])
+
+    with pytest.raises(ValueError):
+        get_system_and_jacobian(["x - 1"])
@@ -0,0 +1,24 @@
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+
+def run_python(script):
+    """Run a script in a fresh interpreter, since other tests may already have imported SymPy or matplotlib."""
+    return subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True, cwd=ROOT).stdout
+
+
+def test_gui_import_defers_heavy_libraries():
+    pytest.importorskip("PyQt5.QtWidgets")
+    script = "import sys, src.gui.main_gui; print('sympy' in sys.modules, 'matplotlib' in sys.modules)"
+    assert run_python(script).split() == ["False", "False"]
+
+
+def test_solver_modules_do_not_import_sympy():
+    script = ("import sys, src.utils.function_evaluation, src.utils.problem_batch, src.utils.method_comparison; "
+              "print('sympy' in sys.modules)")
+    assert run_python(script).strip() == "False"
@@ -0,0 +1,52 @@
+import math
+
+import pytest
+
+from src.algorithms.halley import halley, halley_iter
+from src.algorithms.newton import newton
+from src.utils.function_evaluation import get_function_and_derivatives
+
+
+def test_halley_typical_case():
+    f, df, ddf = get_function_and_derivatives("x**2 - 1")
+    root, _ = halley(f, df, ddf, 0.5)
+    assert math.isclose(root, 1, rel_tol=1e-5)
+
+
+def test_halley_transcendental():
+    f, df, ddf = get_function_and_derivatives("exp(x) - 10")
+    root, _ = halley(f, df, ddf, 1, tol=1e-12)
+    assert math.isclose(root, math.log(10), rel_tol=1e-12)
+
+
+def test_halley_fewer_iterations_than_newton():
+    f, df, ddf = get_function_and_derivatives("x**3 - 2*x - 5")
+    _, halley_iterations = halley(f, df, ddf, 3, tol=1e-12)
+    _, newton_iterations = newton(f, df, 3, tol=1e-12)
+    assert halley_iterations < newton_iterations
+
+
+def test_halley_denominator_zero():
+    # For 1/x the denominator 2*df**2 - f*ddf vanishes everywhere
+    f, df, ddf = get_function_and_derivatives("1/x")
+    with pytest.raises(ValueError) as exif:
+        halley(f, df, ddf, 1)
+    assert "Denominator became zero" in str(exif.value)
+
+
+def test_halley_non_convergence():
+    f, df, ddf = get_function_and_derivatives("sin(1/x)")
+    with pytest.raises(ValueError) as exif:
+        halley(f, df, ddf, 0.5, max_iter=1)
+    assert "Exceeded maximum iterations" in str(exif.value)
+
+
+def test_halley_iter_yields_steps():
+    f, df, ddf = get_function_and_derivatives("x**2 - 2")
+    states = list(halley_iter(f, df, ddf, 1.5, tol=1e-12))
+    assert math.isclose(states[-1]["x"], math.sqrt(2), rel_tol=1e-12)
+    assert math.isclose(states[0]["x"], 1.5 - states[0]["step"])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
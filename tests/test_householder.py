@@ -0,0 +1,52 @@
+import math
+
+import pytest
+
+from src.algorithms.halley import halley
+from src.algorithms.householder import householder
+from src.algorithms.newton import newton
+from src.utils.function_evaluation import get_function_and_higher_derivatives
+
+
+def test_householder_typical_case():
+    f, *derivatives = get_function_and_higher_derivatives("x**2 - 1", 3)
+    root, _ = householder(f, derivatives, 0.5)
+    assert math.isclose(root, 1, rel_tol=1e-5)
+
+
+def test_householder_first_order_is_newton():
+    f, df = get_function_and_higher_derivatives("x**3 - 2*x - 5", 1)
+    assert householder(f, [df], 3, tol=1e-12) == newton(f, df, 3, tol=1e-12)
+
+
+def test_householder_second_order_is_halley():
+    f, df, ddf = get_function_and_higher_derivatives("x**3 - 2*x - 5", 2)
+    root, iterations = householder(f, [df, ddf], 3, tol=1e-12)
+    halley_root, halley_iterations = halley(f, df, ddf, 3, tol=1e-12)
+    assert math.isclose(root, halley_root, rel_tol=1e-14)
+    assert iterations == halley_iterations
+
+
+def test_householder_higher_order():
+    f, *derivatives = get_function_and_higher_derivatives("cos(x) - x", 4)
+    root, iterations = householder(f, derivatives, 0, tol=1e-14)
+    assert math.isclose(root, 0.7390851332151607, rel_tol=1e-14)
+    assert iterations <= 3
+
+
+def test_householder_no_derivatives():
+    f, = get_function_and_higher_derivatives("x - 1", 0)
+    with pytest.raises(ValueError) as exif:
+        householder(f, [], 0)
+    assert "At least one derivative is required." in str(exif.value)
+
+
+def test_householder_non_convergence():
+    f, *derivatives = get_function_and_higher_derivatives("sin(1/x)", 3)
+    with pytest.raises(ValueError) as exif:
+        householder(f, derivatives, 0.5, max_iter=1)
+    assert "Exceeded maximum iterations" in str(exif.value)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,58 @@
+import math
+
+import pytest
+
+from src.utils.interval_arithmetic import Interval, cos, exp, get_interval_function, log, sin, sqrt
+
+
+def test_interval_arithmetic_encloses_exact_result():
+    x = Interval(0.1, 0.2)
+    result = x + 0.1
+    assert result.lo <= 0.2 <= result.hi
+    assert result.hi <= 0.3 + 1e-15
+
+
+def test_interval_multiplication_signs():
+    product = Interval(-2, 3) * Interval(-1, 4)
+    assert product.lo <= -8 and product.hi >= 12
+    assert product.lo > -8.001 and product.hi < 12.001
+
+
+def test_interval_undefined_bounds_are_unbounded():
+    # The midpoint of the real line is inf - inf
+    point = Interval(Interval(-math.inf, math.inf).midpoint)
+    assert point.lo == -math.inf and point.hi == math.inf
+    assert 0 in point
+
+
+def test_interval_even_power_contains_zero():
+    square = Interval(-2, 1) ** 2
+    assert square.lo == 0
+    assert 4 <= square.hi < 4.001
+
+
+def test_interval_division_by_zero_interval():
+    quotient = 1 / Interval(-1, 1)
+    assert quotient.lo == -math.inf and quotient.hi == math.inf
+
+
+def test_interval_elementary_functions():
+    assert sin(Interval(0, math.pi)).hi == 1
+    assert cos(Interval(-0.5, 0.5)).hi == 1
+    assert exp(Interval(0, 1)).hi >= math.e
+    assert log(Interval(-1, 1)).lo == -math.inf
+    with pytest.raises(ValueError):
+        sqrt(Interval(-2, -1))
+
+
+def test_get_interval_function_encloses_samples():
+    F = get_interval_function("x**3 - 2*sin(x) + exp(-x)/pi")
+    f = lambda v: v ** 3 - 2 * math.sin(v) + math.exp(-v) / math.pi
+    x = Interval(-1.5, 2.5)
+    enclosure = F(x)
+    for i in range(101):
+        assert f(-1.5 + 4 * i / 100) in enclosure
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
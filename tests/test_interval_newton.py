@@ -0,0 +1,88 @@
+import math
+
+import pytest
+
+from src.algorithms.interval_newton import interval_newton
+from src.utils.interval_arithmetic import get_interval_function_and_derivative
+from src.utils.solve_limits import BudgetExhausted
+
+
+def test_interval_newton_typical_case():
+    F, dF = get_interval_function_and_derivative("x**2 - 2")
+    enclosures, _ = interval_newton(F, dF, -3, 3, tol=1e-10)
+    assert len(enclosures) == 2
+    for (lo, hi, unique), root in zip(enclosures, [-math.sqrt(2), math.sqrt(2)]):
+        assert lo <= root <= hi
+        assert hi - lo <= 1e-10
+        assert unique
+
+
+def test_interval_newton_even_number_of_roots():
+    # f(a) and f(b) have the same sign, which the bracketed methods reject
+    F, dF = get_interval_function_and_derivative("x**3 - x")
+    enclosures, _ = interval_newton(F, dF, -2, 2)
+    assert len(enclosures) == 3
+    for (lo, hi, _), root in zip(enclosures, [-1, 0, 1]):
+        assert lo <= root <= hi
+
+
+def test_interval_newton_close_pair_of_roots():
+    F, dF = get_interval_function_and_derivative("(x - 1)*(x - 1.000001)")
+    enclosures, _ = interval_newton(F, dF, 0, 2, tol=1e-9)
+    assert len(enclosures) == 2
+    assert enclosures[0][0] <= 1 <= enclosures[0][1]
+    assert enclosures[1][0] <= 1.000001 <= enclosures[1][1]
+
+
+def test_interval_newton_many_roots():
+    F, dF = get_interval_function_and_derivative("sin(x)")
+    enclosures, _ = interval_newton(F, dF, -10, 10)
+    roots = [k * math.pi for k in range(-3, 4)]
+    assert len(enclosures) == len(roots)
+    for (lo, hi, _), root in zip(enclosures, roots):
+        assert lo <= root <= hi
+
+
+def test_interval_newton_double_root_not_unique():
+    F, dF = get_interval_function_and_derivative("(x - 1)**2")
+    enclosures, _ = interval_newton(F, dF, 0, 3)
+    assert any(lo <= 1 <= hi for lo, hi, _ in enclosures)
+    assert all(abs(lo - 1) < 1e-4 and not unique for lo, _, unique in enclosures)
+
+
+def test_interval_newton_no_roots():
+    F, dF = get_interval_function_and_derivative("x**2 + 1")
+    enclosures, n = interval_newton(F, dF, -5, 5)
+    assert enclosures == []
+    assert n == 1
+
+
+def test_interval_newton_outside_domain():
+    F, dF = get_interval_function_and_derivative("log(x) - 1")
+    enclosures, _ = interval_newton(F, dF, -1, 5)
+    assert len(enclosures) == 1
+    assert enclosures[0][0] <= math.e <= enclosures[0][1]
+
+
+def test_interval_newton_keeps_undecided_intervals():
+    # The midpoint of an unbounded interval is infinite, where sin cannot be evaluated, which proves nothing
+    F, dF = get_interval_function_and_derivative("sin(x)")
+    enclosures, _ = interval_newton(F, dF, 0, math.inf)
+    assert enclosures == [(0, math.inf, False)]
+
+
+def test_interval_newton_evaluation_budget():
+    F, dF = get_interval_function_and_derivative("sin(x)")
+    with pytest.raises(BudgetExhausted):
+        interval_newton(F, dF, -10, 10, max_fev=5)
+
+
+def test_interval_newton_maximum_iterations():
+    F, dF = get_interval_function_and_derivative("sin(1/x)")
+    with pytest.raises(ValueError) as exif:
+        interval_newton(F, dF, 0.01, 1, max_iter=10)
+    assert "Exceeded maximum iterations" in str(exif.value)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
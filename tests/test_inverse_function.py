@@ -0,0 +1,56 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.algorithms.inverse_function import InverseTable, get_inverse_table, inverse
+from src.utils.solve_limits import BudgetExhausted
+
+
+def logistic(x):
+    return 1 / (1 + np.exp(-x))
+
+
+def test_inverse_of_expression():
+    assert inverse("x**3 + x", 10.0, -5, 5) == pytest.approx(2.0, abs=1e-12)
+    np.testing.assert_allclose(inverse("exp(x)", [0.5, 1.0, 2.0], -3, 3), np.log([0.5, 1.0, 2.0]), atol=1e-12)
+
+
+def test_many_targets_of_callable():
+    targets = np.linspace(0.001, 0.999, 10001).reshape(73, 137)
+    solutions = inverse(logistic, targets, -10, 10)
+    assert solutions.shape == targets.shape
+    np.testing.assert_allclose(solutions, np.log(targets / (1 - targets)), atol=1e-10)
+
+
+def test_decreasing_function_with_derivative():
+    table = InverseTable(lambda x: np.exp(-x), -3, 3, df=lambda x: -np.exp(-x), size=17)
+    np.testing.assert_allclose(table([0.5, 2.0]), [math.log(2), -math.log(2)], atol=1e-12)
+
+
+def test_targets_out_of_range_are_nan():
+    solutions = inverse(logistic, [-0.5, 0.5, 2.0], -10, 10)
+    assert np.isnan(solutions[0]) and np.isnan(solutions[2])
+    assert solutions[1] == pytest.approx(0.0, abs=1e-12)
+
+
+def test_saturating_function():
+    # The CDF of a normal distribution rounds to 0 and 1 in the tails
+    table = InverseTable(np.vectorize(lambda x: (1 + math.erf(x / math.sqrt(2))) / 2), -40, 40)
+    assert table(0.975) == pytest.approx(1.959963984540054, abs=1e-9)
+
+
+def test_table_is_shared():
+    assert get_inverse_table("x**3 + x", -5, 5) is get_inverse_table("x**3 + x", -5, 5)
+    assert get_inverse_table(logistic, -10, 10) is not get_inverse_table(logistic, -5, 5)
+
+
+def test_invalid_tables_and_limits():
+    with pytest.raises(ValueError):
+        InverseTable(np.sin, 0, 6)
+    with pytest.raises(ValueError):
+        InverseTable(np.log, -1, 1)
+    with pytest.raises(ValueError):
+        InverseTable(np.exp, 1, 1)
+    with pytest.raises(BudgetExhausted):
+        inverse(logistic, np.linspace(0.1, 0.9, 100), -10, 10, max_fev=150)
@@ -0,0 +1,76 @@
+import math
+
+import pytest
+
+from src.algorithms.bisection import bisection
+from src.algorithms.itp import itp, itp_iter
+from src.utils.function_evaluation import get_function
+
+
+def test_itp_typical_case():
+    f = get_function("x**2 - 3")
+    root, _ = itp(f, 1, 2, tol=1e-10)
+    assert math.isclose(root, 3 ** 0.5, rel_tol=1e-10)
+
+
+def test_itp_root_at_boundary():
+    f = get_function("x - 2")
+    root, iterations = itp(f, 1, 2)
+    assert root == 2
+    assert iterations == 0
+
+
+def test_itp_no_roots():
+    f = get_function("x + 2")
+    with pytest.raises(ValueError) as exif:
+        itp(f, 1, 2)
+    assert "The function does not change sign" in str(exif.value)
+
+
+def test_itp_maximum_iterations():
+    f = get_function("exp(-x) - x")
+    with pytest.raises(ValueError) as exif:
+        itp(f, 0, 1, tol=1e-15, max_iter=1)
+    assert "Exceeded maximum iterations" in str(exif.value)
+
+
+def test_itp_superlinear_on_smooth_functions():
+    f = get_function("x**3 - 2*x - 5")
+    root, iterations = itp(f, 1, 3, tol=1e-10)
+    _, bisection_iterations = bisection(f, 1, 3, tol=1e-10)
+    assert math.isclose(root, 2.0945514815423265, rel_tol=1e-10)
+    assert iterations < bisection_iterations / 3
+
+
+@pytest.mark.parametrize("f, a, b", [
+    (lambda x: -1.0 if x < 0.3 else 1.0, 0, 1),
+    (lambda x: 1 / (x - 0.5), 0, 1.3),
+    (lambda x: x ** 10 - 0.5, 0, 1.5),
+    (lambda x: math.atan(x) - 1, -10, 20),
+    (lambda x: math.exp(x) - 100, 0, 10),
+])
+def test_itp_never_slower_than_bisection(f, a, b):
+    _, iterations = itp(f, a, b, tol=1e-10, max_iter=200)
+    _, bisection_iterations = bisection(f, a, b, tol=1e-10, max_iter=200)
+    assert iterations <= bisection_iterations
+
+
+def test_itp_slack_trades_guarantee_for_speed():
+    f = get_function("exp(x) - 100")
+    _, strict = itp(f, 0, 10, tol=1e-10)
+    root, relaxed = itp(f, 0, 10, tol=1e-10, n0=1)
+    assert math.isclose(root, math.log(100), rel_tol=1e-10)
+    assert relaxed < strict <= math.ceil(math.log2(10 / 1e-10))
+
+
+def test_itp_iter_yields_brackets():
+    f = get_function("cos(x) - x")
+    states = list(itp_iter(f, 0, 1, tol=1e-12))
+    assert [state["n"] for state in states] == list(range(1, len(states) + 1))
+    for state in states:
+        assert state["a"] <= state["x"] <= state["b"]
+        assert state["a"] <= 0.7390851332151607 <= state["b"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
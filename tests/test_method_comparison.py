@@ -0,0 +1,50 @@
+import math
+import time
+
+import pytest
+
+from src.utils.method_comparison import BRACKETING_METHODS, OPEN_METHODS, compare_methods
+from src.utils.solve_limits import CancellationToken, Cancelled
+
+
+def test_compare_methods_with_bracket():
+    results = compare_methods("x**3 - x - 2", bracket=(1, 2), tol=1e-10)
+    assert [result["method"] for result in results] == BRACKETING_METHODS + OPEN_METHODS
+    for result in results:
+        assert result["error"] is None
+        assert result["root"] == pytest.approx(1.5213797068, abs=1e-8)
+        assert result["residual"] < 1e-9
+        assert result["evaluations"] >= result["iterations"]
+        assert result["time"] >= 0
+
+
+def test_compare_methods_histories():
+    results = {result["method"]: result for result in compare_methods("x**2 - 2", bracket=(0, 2), tol=1e-12)}
+    assert len(results["Bisection"]["history"]) == results["Bisection"]["iterations"]
+    assert results["Newton"]["history"][-1] <= 1e-12
+    assert results["Halley"]["iterations"] < results["Bisection"]["iterations"]
+
+
+def test_compare_open_methods_only():
+    results = compare_methods(math.cos, x0=1.0)
+    assert [result["method"] for result in results] == OPEN_METHODS
+    assert all(result["root"] == pytest.approx(math.pi / 2, abs=1e-5) for result in results)
+
+
+def test_compare_methods_records_failures():
+    results = {result["method"]: result for result in compare_methods("x**2 + 1", x0=0.0)}
+    assert results["Newton"]["root"] is None
+    assert "zero" in results["Newton"]["error"]
+
+
+def test_compare_methods_limits():
+    with pytest.raises(ValueError):
+        compare_methods("x - 1")
+
+    results = compare_methods("x - 1", x0=3.0, deadline=time.monotonic() - 1)
+    assert all(result["error"] for result in results)
+
+    token = CancellationToken()
+    token.cancel()
+    with pytest.raises(Cancelled):
+        compare_methods("x - 1", x0=3.0, cancel_token=token)
@@ -0,0 +1,144 @@
+import pickle
+import threading
+import time
+
+import pytest
+
+from src.algorithms.bisection import bisection
+from src.algorithms.newton import newton
+from src.utils.batch import solve_batch
+from src.utils.function_evaluation import get_function_and_derivatives
+from src.utils.metrics import REGISTRY, MetricsRegistry, failure_reason, record_solve
+from src.utils.problem_batch import solve_problems
+from src.utils.solve_limits import BudgetExhausted
+
+
+def test_counters_and_histograms():
+    registry = MetricsRegistry()
+    registry.inc("rootfinder_solves_total", method="newton", status="converged")
+    registry.inc("rootfinder_solves_total", 2, status="converged", method="newton")
+    registry.observe("rootfinder_solve_seconds", 0.003, method="newton")
+    registry.observe("rootfinder_solve_seconds", 20, method="newton")
+
+    snapshot = registry.snapshot()
+    assert snapshot["counters"][("rootfinder_solves_total", (("method", "newton"), ("status", "converged")))] == 3
+    counts, total = snapshot["histograms"][("rootfinder_solve_seconds", (("method", "newton"),))]
+    assert sum(counts) == 2 and counts[-1] == 1
+    assert total == 20.003
+
+
+def test_prometheus_format(tmp_path):
+    registry = MetricsRegistry()
+    record_solve("False Position", 0.002, 12, registry=registry)
+    record_solve("newton", 0.02, 7, ValueError("Derivative is zero. Cannot continue iteration."), registry)
+
+    text = registry.to_prometheus()
+    assert "# TYPE rootfinder_solves_total counter" in text
+    assert 'rootfinder_solves_total{method="false_position",status="converged"} 1' in text
+    assert 'rootfinder_solves_total{method="newton",status="failed"} 1' in text
+    assert 'rootfinder_failures_total{method="newton",reason="zero_derivative"} 1' in text
+    assert 'rootfinder_solve_seconds_bucket{method="newton",le="0.01"} 0' in text
+    assert 'rootfinder_solve_seconds_bucket{method="newton",le="0.05"} 1' in text
+    assert 'rootfinder_solve_seconds_bucket{method="newton",le="+Inf"} 1' in text
+    assert 'rootfinder_solve_seconds_count{method="newton"} 1' in text
+
+    path = tmp_path / "rootfinder.prom"
+    registry.write_prometheus(path)
+    assert path.read_text() == text
+
+
+def test_failure_reasons():
+    assert failure_reason(ValueError("Exceeded maximum iterations. Adjust the initial guess.")) == "max_iterations"
+    assert failure_reason(BudgetExhausted(None, None, 10)) == "budget_exhausted"
+    assert failure_reason(ZeroDivisionError("float division by zero")) == "ZeroDivisionError"
+
+
+def test_failure_reasons_do_not_depend_on_the_expression():
+    registry = MetricsRegistry()
+    for source in ["x +* 2", "foo(x)\n+ 1", "9**9**9 + x"]:
+        record_solve("newton", 0.001, 0, ValueError(f"Invalid expression: {source}"), registry)
+        record_solve("newton", 0.001, 0, ValueError(f"Could not parse {source}. Check it."), registry)
+    reasons = {dict(labels)["reason"] for name, labels in registry.snapshot()["counters"]
+               if name == "rootfinder_failures_total"}
+    assert reasons == {"invalid_expression", "ValueError"}
+
+
+def test_thread_safe_counting():
+    registry = MetricsRegistry()
+
+    def work():
+        for _ in range(1000):
+            registry.inc("rootfinder_evaluations_total", method="newton")
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert registry.snapshot()["counters"][("rootfinder_evaluations_total", (("method", "newton"),))] == 8000
+
+
+def test_merge_collected_snapshots():
+    worker, parent = MetricsRegistry(), MetricsRegistry()
+    record_solve("newton", 0.001, 5, registry=worker)
+    parent.merge(pickle.loads(pickle.dumps(worker.collect())))
+    record_solve("newton", 0.001, 5, registry=worker)
+    parent.merge(worker.collect())
+
+    counters = parent.snapshot()["counters"]
+    assert counters[("rootfinder_evaluations_total", (("method", "newton"),))] == 10
+    assert worker.snapshot() == {"counters": {}, "histograms": {}}
+
+
+def test_solvers_record_into_registry():
+    f, df, _ = get_function_and_derivatives("x**2 - 2")
+    key = ("rootfinder_solves_total", (("method", "newton"), ("status", "converged")))
+    before = REGISTRY.snapshot()["counters"].get(key, 0)
+
+    solve_batch(newton, f, [1, 2, 3], derivatives=(df,))
+    problems = [{"expression": "x**2 - 2", "method": "newton", "x0": 1.0, "tol": 1e-8, "max_iter": 50}]
+    for _ in solve_problems(problems, max_workers=1):
+        pass
+    assert REGISTRY.snapshot()["counters"][key] == before + 4
+
+
+def test_every_solve_is_recorded_once():
+    f, df, _ = get_function_and_derivatives("x**2 - 3")
+    solves = ("rootfinder_solves_total", (("method", "newton"), ("status", "converged")))
+    evaluations = ("rootfinder_evaluations_total", (("method", "newton"),))
+    failures = ("rootfinder_failures_total", (("method", "bisection"), ("reason", "no_sign_change")))
+    before = REGISTRY.snapshot()["counters"]
+
+    calls = []
+
+    def counted(func):
+        def wrapper(x):
+            calls.append(x)
+            return func(x)
+
+        return wrapper
+
+    newton(counted(f), counted(df), 1.0)
+    results = solve_batch(newton, f, [1.0], derivatives=(df,))
+    with pytest.raises(ValueError):
+        bisection(f, 2, 3)
+
+    counters = REGISTRY.snapshot()["counters"]
+    assert counters[solves] == before.get(solves, 0) + 2
+    assert counters[evaluations] == before.get(evaluations, 0) + len(calls) + results["nfev"][0]
+    assert counters[failures] == before.get(failures, 0) + 1
+
+
+def test_periodic_export(tmp_path):
+    registry = MetricsRegistry()
+    record_solve("secant", 0.001, 4, registry=registry)
+    path = tmp_path / "rootfinder.prom"
+    registry.start_export(path, interval=0.01)
+    try:
+        for _ in range(200):
+            if path.exists():
+                break
+            time.sleep(0.01)
+    finally:
+        registry.stop_export()
+    assert 'rootfinder_solves_total{method="secant",status="converged"} 1' in path.read_text()
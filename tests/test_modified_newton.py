@@ -2,7 +2,7 @@ import math
 
 import pytest
 
-from src.algorithms.modified_newton import modified_newton
+from src.algorithms.modified_newton import modified_newton, modified_newton_iter
 from src.utils.function_evaluation import get_function_and_derivatives
 
 
@@ -50,5 +50,12 @@ def test_modified_newton_large_inputs():
     assert math.isclose(root, 1, rel_tol=1e-3)
 
 
+def test_modified_newton_iter_yields_states():
+    f, df, ddf = get_function_and_derivatives("x**2 - 1")
+    states = list(modified_newton_iter(f, df, ddf, 0.5))
+    assert states[-1]["fx"] == f(states[-1]["x"])
+    assert len(states) == modified_newton(f, df, ddf, 0.5)[1]
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,72 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.algorithms.multi_start import multi_start_newton, multi_start_secant
+from src.utils.function_evaluation import get_function_and_derivatives, get_vectorized_function_and_derivatives
+from src.utils.solve_limits import BudgetExhausted, CancellationToken, Cancelled
+
+
+def test_multi_start_newton_finds_all_roots():
+    f, df, _ = get_vectorized_function_and_derivatives("sin(x) - x/10")
+    roots, counts, root_index = multi_start_newton(f, df, np.linspace(-20, 20, 2000))
+    assert len(roots) == 7
+    assert np.all(np.diff(roots) > 0)
+    assert np.allclose(f(roots), 0, atol=1e-8)
+    assert counts.sum() == np.count_nonzero(root_index >= 0)
+
+
+def test_multi_start_newton_counts():
+    f, df, _ = get_function_and_derivatives("x**3 - x")
+    roots, counts, root_index = multi_start_newton(f, df, [-2, -1.5, 0.1, 1.2, 3])
+    assert np.allclose(roots, [-1, 0, 1])
+    assert list(counts) == [2, 1, 2]
+    assert list(root_index) == [0, 0, 1, 2, 2]
+
+
+def test_multi_start_newton_masks_failed_lanes():
+    f, df, _ = get_vectorized_function_and_derivatives("x**2 - 1")
+    roots, counts, root_index = multi_start_newton(f, df, np.array([[0.0, 2.0]]))
+    assert root_index.shape == (1, 2)
+    assert root_index[0, 0] == -1
+    assert list(counts) == [1]
+
+
+def test_multi_start_newton_start_on_double_root():
+    roots, counts, root_index = multi_start_newton(lambda x: x ** 2, lambda x: 2 * x, [0.0, 1.0])
+    assert roots[0] == 0
+    assert root_index[0] == 0
+    assert root_index[1] >= 0
+    assert abs(roots[root_index[1]]) < 1e-3
+
+
+def test_multi_start_newton_budget():
+    with pytest.raises(BudgetExhausted):
+        multi_start_newton(lambda x: x ** 2 - 2, lambda x: 2 * x, np.linspace(1, 10, 100), max_fev=300)
+
+
+def test_multi_start_secant_cancelled():
+    token = CancellationToken()
+    token.cancel()
+    with pytest.raises(Cancelled):
+        multi_start_secant(math.atan, [0.5, 1.0], cancel_token=token)
+
+
+def test_multi_start_newton_complex_starts():
+    roots, counts, _ = multi_start_newton(lambda z: z ** 3 - 1, lambda z: 3 * z ** 2, [1 + 1j, -1 + 1j, -1 - 1j, 2])
+    assert np.allclose(np.sort_complex(roots), np.sort_complex(np.exp(2j * np.pi * np.arange(3) / 3)))
+    assert counts.sum() == 4
+
+
+def test_multi_start_secant():
+    f, _, _ = get_vectorized_function_and_derivatives("sin(x) - x/10")
+    roots, counts, _ = multi_start_secant(f, np.linspace(-20, 20, 2000))
+    assert len(roots) == 7
+    assert np.allclose(roots[3:], [0, 2.852341894, 7.068174358, 8.423203932], atol=1e-6)
+
+
+def test_multi_start_secant_masks_diverged_lanes():
+    roots, counts, root_index = multi_start_secant(math.atan, [0.5, 5.0])
+    assert roots == pytest.approx([0], abs=1e-12)
+    assert list(root_index) == [0, -1]
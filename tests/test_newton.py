@@ -2,7 +2,7 @@ import math
 
 import pytest
 
-from src.algorithms.newton import newton
+from src.algorithms.newton import newton, newton_iter
 from src.utils.function_evaluation import get_function_and_derivatives
 
 
@@ -60,5 +60,20 @@ def test_newton_large_inputs():
     assert math.isclose(root, 1, rel_tol=1e-3)
 
 
+def test_newton_iter_yields_steps():
+    f, df, _ = get_function_and_derivatives("x**2 - 2")
+    states = list(newton_iter(f, df, 1.5, tol=1e-12))
+    assert math.isclose(states[-1]["x"], math.sqrt(2), rel_tol=1e-12)
+    assert math.isclose(states[0]["x"], 1.5 - states[0]["step"])
+
+
+def test_newton_iter_custom_stopping_rule():
+    f, df, _ = get_function_and_derivatives("x**2 - 2")
+    for state in newton_iter(f, df, 100, tol=0, max_iter=1000):
+        if abs(state["step"]) < 1e-6:
+            break
+    assert math.isclose(state["x"], math.sqrt(2), rel_tol=1e-10)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from src.algorithms.newton_basins import newton_basins, newton_basins_grid
+from src.utils.clustering import cluster_roots
+from src.utils.function_evaluation import get_vectorized_function_and_derivatives
+
+
+def test_newton_basins_cube_roots_of_unity():
+    f, df, _ = get_vectorized_function_and_derivatives("x**3 - 1")
+    root_index, iterations, roots = newton_basins(f, df, [1.5, -1 + 1j, -1 - 1j])
+    assert np.all(root_index >= 0)
+    assert np.allclose(roots[root_index], [1, np.exp(2j * np.pi / 3), np.exp(-2j * np.pi / 3)], atol=1e-6)
+    assert np.all(iterations > 0)
+
+
+def test_newton_basins_known_roots():
+    f, df, _ = get_vectorized_function_and_derivatives("x**2 + 1")
+    root_index, _, roots = newton_basins(f, df, [2j, -2j, 0.5 + 3j], roots=[-1j, 1j])
+    assert list(root_index) == [1, 0, 1]
+    assert np.allclose(roots, [-1j, 1j])
+
+
+def test_newton_basins_zero_derivative():
+    f, df, _ = get_vectorized_function_and_derivatives("x**2 - 1")
+    root_index, iterations, _ = newton_basins(f, df, np.array([0, 2]))
+    assert root_index[0] == -1
+    assert root_index[1] == 0
+
+
+def test_newton_basins_start_on_double_root():
+    # The step at the root is 0/0, which must not overwrite the converged lane
+    root_index, iterations, roots = newton_basins(lambda z: z ** 2, lambda z: 2 * z, [0j, 1 + 0j])
+    assert root_index[0] == 0
+    assert iterations[0] == 0
+    assert roots[0] == 0
+
+
+def test_cluster_roots_skips_non_finite_values():
+    centers, labels = cluster_roots(np.array([1.0, np.nan, 1.0 + 1e-9, np.inf]), 1e-6)
+    assert centers == pytest.approx([1.0])
+    assert list(labels) == [0, -1, 0, -1]
+
+
+def test_newton_basins_non_convergence():
+    f, df, _ = get_vectorized_function_and_derivatives("x**2 + 1")
+    # Real starting points never leave the real axis, so they cannot reach the roots +i and -i
+    root_index, iterations, roots = newton_basins(f, df, np.array([0.5, 3.0]), max_iter=20)
+    assert np.all(root_index == -1)
+    assert np.all(iterations == 20)
+    assert roots.size == 0
+
+
+def test_newton_basins_preserves_shape():
+    f, df, _ = get_vectorized_function_and_derivatives("x**4 - 1")
+    starts = np.random.default_rng(0).normal(size=(4, 5)) + 1j
+    root_index, iterations, _ = newton_basins(f, df, starts)
+    assert root_index.shape == (4, 5)
+    assert iterations.shape == (4, 5)
+
+
+def test_newton_basins_grid_matches_chunk_size():
+    f, df, _ = get_vectorized_function_and_derivatives("x**3 - 1")
+    full = newton_basins_grid(f, df, (-2, 2), (-2, 2), (40, 30))
+    chunked = newton_basins_grid(f, df, (-2, 2), (-2, 2), (40, 30), roots=full[2], chunk_size=7)
+    assert full[0].shape == (30, 40)
+    assert np.array_equal(full[0], chunked[0])
+    assert np.array_equal(full[1], chunked[1])
+    assert len(full[2]) == 3
+
+
+def test_newton_basins_grid_symmetry():
+    # The basins of x**2 - 1 are the left and right half-planes
+    f, df, _ = get_vectorized_function_and_derivatives("x**2 - 1")
+    root_index, _, roots = newton_basins_grid(f, df, (-2, 2), (-1, 1), (20, 10))
+    right = np.argmin(np.abs(roots - 1))
+    assert np.all(root_index[:, 10:] == right)
+    assert np.all(root_index[:, :10] == 1 - right)
+
+
+def test_newton_basins_grid_into_memmap(tmp_path):
+    f, df, _ = get_vectorized_function_and_derivatives("x**3 - 1")
+    expected_index, expected_iterations, _ = newton_basins_grid(f, df, (-2, 2), (-2, 2), (40, 30))
+
+    out = tuple(np.lib.format.open_memmap(tmp_path / f"{name}.npy", mode="w+", dtype=np.int32, shape=(30, 40))
+                for name in ("root_index", "iterations"))
+    newton_basins_grid(f, df, (-2, 2), (-2, 2), (40, 30), chunk_size=100, out=out)
+
+    assert np.array_equal(np.load(tmp_path / "root_index.npy", mmap_mode="r"), expected_index)
+    assert np.array_equal(np.load(tmp_path / "iterations.npy", mmap_mode="r"), expected_iterations)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
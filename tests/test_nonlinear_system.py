@@ -0,0 +1,76 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.algorithms.nonlinear_system import broyden_system, broyden_system_iter, newton_system
+from src.utils.function_evaluation import get_system_and_jacobian
+
+
+def test_newton_system_typical_case():
+    # Intersection of the unit circle and the line y = x
+    F, J = get_system_and_jacobian(["x**2 + y**2 - 1", "x - y"], ["x", "y"])
+    root, _ = newton_system(F, J, [1, 0.5])
+    assert np.allclose(root, [math.sqrt(0.5), math.sqrt(0.5)], atol=1e-5)
+
+
+def test_newton_system_transcendental():
+    F, J = get_system_and_jacobian(["exp(x) - y", "x + y - 2"], ["x", "y"])
+    root, _ = newton_system(F, J, [0, 0], tol=1e-10)
+    assert np.allclose(F(root), 0, atol=1e-10)
+
+
+def test_newton_system_damping_from_far_guess():
+    F, J = get_system_and_jacobian(["atan(x) + y/2", "y - 2*z", "z - 1"], ["x", "y", "z"])
+    root, _ = newton_system(F, J, [10, 0, 0], tol=1e-10)
+    assert np.allclose(root, [math.tan(-1), 2, 1], atol=1e-8)
+
+
+def test_newton_system_singular_jacobian():
+    F, J = get_system_and_jacobian(["x**2 + y**2 - 1", "x*y - 1"], ["x", "y"])
+    with pytest.raises(ValueError) as exif:
+        newton_system(F, J, [0, 0])
+    assert "Jacobian is singular" in str(exif.value)
+
+
+def test_newton_system_non_convergence():
+    F, J = get_system_and_jacobian(["x**2 + y**2 - 1", "x - y"], ["x", "y"])
+    with pytest.raises(ValueError) as exif:
+        newton_system(F, J, [10, 3], max_iter=2)
+    assert "Exceeded maximum iterations" in str(exif.value)
+
+
+def test_broyden_system_typical_case():
+    F, J = get_system_and_jacobian(["x**2 + y**2 - 1", "x - y"], ["x", "y"])
+    root, _ = broyden_system(F, J, [1, 0.5], tol=1e-10)
+    assert np.allclose(root, [math.sqrt(0.5), math.sqrt(0.5)], atol=1e-8)
+
+
+def test_broyden_system_larger_system():
+    # A tridiagonal system in 10 unknowns
+    variables = [f"x{i}" for i in range(10)]
+    exprs = []
+    for i, var in enumerate(variables):
+        left = variables[i - 1] if i > 0 else "0"
+        right = variables[i + 1] if i < len(variables) - 1 else "0"
+        exprs.append(f"(3 - 2*{var})*{var} - {left} - 2*{right} + 1")
+    F, J = get_system_and_jacobian(exprs, variables)
+    root, _ = broyden_system(F, J, -np.ones(10), tol=1e-10)
+    assert np.max(np.abs(F(root))) <= 1e-10
+
+
+def test_broyden_system_singular_initial_jacobian():
+    F, J = get_system_and_jacobian(["x**2 + y**2 - 1", "x*y - 1"], ["x", "y"])
+    with pytest.raises(ValueError) as exif:
+        broyden_system(F, J, [0, 0])
+    assert "Jacobian is singular at the initial guess." in str(exif.value)
+
+
+def test_broyden_system_iter_residual_decreases():
+    F, J = get_system_and_jacobian(["x**2 + y**2 - 1", "x - y"], ["x", "y"])
+    norms = [np.linalg.norm(state["fx"]) for state in broyden_system_iter(F, J, [1, 0.5], tol=1e-10)]
+    assert norms == sorted(norms, reverse=True)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,73 @@
+import concurrent.futures
+import math
+import threading
+import time
+
+import pytest
+
+from src.algorithms.bisection import bisection
+from src.algorithms.parallel_bracketing import k_section, k_section_iter
+from src.utils.solve_limits import BudgetExhausted
+
+
+def cubic(x):
+    return x ** 3 - 2 * x - 5
+
+
+def test_k_section_needs_fewer_rounds_than_bisection():
+    _, bisection_rounds = bisection(cubic, 1, 3, 1e-10, 200)
+    root, rounds = k_section(cubic, 1, 3, 1e-10, 200, k=8)
+    assert root == pytest.approx(2.0945514815423265, abs=1e-10)
+    assert rounds <= math.ceil(bisection_rounds / 3)
+
+
+def test_speculative_points_converge_in_few_rounds():
+    root, rounds = k_section(cubic, 1, 3, 1e-12, 200, k=4, speculative=True)
+    assert abs(cubic(root)) <= 1e-12
+    assert rounds <= 8
+
+
+def test_points_of_a_round_are_evaluated_concurrently():
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def slow(x):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.01)
+        with lock:
+            active[0] -= 1
+        return cubic(x)
+
+    k_section(slow, 1, 3, 1e-6, 100, k=5)
+    assert peak[0] == 4
+
+
+def test_process_pool():
+    with concurrent.futures.ProcessPoolExecutor(2) as executor:
+        root, _ = k_section(math.cos, 1, 2, 1e-10, 100, k=3, executor=executor)
+    assert root == pytest.approx(math.pi / 2, abs=1e-10)
+
+
+def test_iterations_shrink_the_bracket():
+    states = list(k_section_iter(cubic, 1, 3, 1e-6, 100, k=4))
+    assert states[0]["b"] - states[0]["a"] == pytest.approx(0.5)
+    for state in states:
+        assert state["a"] <= 2.0945514815423265 <= state["b"]
+        assert state["fx"] == cubic(state["x"])
+
+
+def test_budget_carries_best_iterate():
+    with pytest.raises(BudgetExhausted) as stopped:
+        k_section(cubic, 1, 3, 1e-12, 100, k=4, max_fev=10)
+    assert stopped.value.nfev == 11
+    assert abs(stopped.value.fx) < 0.5
+
+
+def test_invalid_inputs():
+    with pytest.raises(ValueError):
+        k_section(cubic, 3, 4, k=4)
+    with pytest.raises(ValueError):
+        k_section(cubic, 1, 3, k=1)
+    with pytest.raises(ValueError):
+        k_section(cubic, 1, 3, k=2, speculative=True)
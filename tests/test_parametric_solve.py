@@ -0,0 +1,51 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.utils.function_evaluation import get_parametric_function_and_derivatives
+from src.utils.parametric_solve import ParametricSolver
+
+
+def test_parametric_function_and_derivatives():
+    parameters, f, df, ddf = get_parametric_function_and_derivatives("a*x**3 + b")
+    assert parameters == ("a", "b")
+    assert (f(2.0, 3.0, 1.0), df(2.0, 3.0, 1.0), ddf(2.0, 3.0, 1.0)) == (25.0, 36.0, 36.0)
+
+
+def test_solve_follows_the_parameter():
+    solver = ParametricSolver("a*sin(x) - x/2", x0=2.0)
+    for a in np.linspace(1, 3, 21):
+        root = solver.solve([a])
+        assert a * math.sin(root) - root / 2 == pytest.approx(0, abs=1e-10)
+        assert root > 1
+
+
+def test_warm_start_saves_iterations():
+    def count_derivative_calls(solver, values):
+        calls = []
+        df = solver.df
+        solver.df = lambda x, *values: calls.append(x) or df(x, *values)
+        solver.solve(values)
+        solver.df = df
+        return len(calls)
+
+    warm = ParametricSolver("x**2 - a", x0=1.0)
+    warm.solve([100.0])
+    cold = ParametricSolver("x**2 - a", x0=1.0)
+    assert count_derivative_calls(warm, [100.5]) * 2 < count_derivative_calls(cold, [100.5])
+    assert warm.root == pytest.approx(math.sqrt(100.5))
+
+
+def test_failed_solve_falls_back_to_initial_guess():
+    solver = ParametricSolver("x**2 - a", x0=1.0)
+    assert solver.solve([4.0]) == pytest.approx(2.0)
+    assert solver.solve([-1.0]) is None
+    assert solver.root is None
+    # The warm start is the last root found
+    assert solver.solve([9.0]) == pytest.approx(3.0)
+
+
+def test_curve():
+    solver = ParametricSolver("a*x + b")
+    np.testing.assert_allclose(solver.curve(np.array([0.0, 1.0, 2.0]), [2.0, -1.0]), [-1.0, 1.0, 3.0])
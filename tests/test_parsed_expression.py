@@ -0,0 +1,83 @@
+import math
+import threading
+
+import numpy as np
+import pytest
+import sympy as sp
+
+from src.utils.function_evaluation import get_function, get_function_and_derivatives
+from src.utils.parsed_expression import ParsedExpression, get_parsed_expression
+from src.utils.symbolic_diff import compute_derivative
+
+
+def test_get_parsed_expression_is_cached():
+    parsed = get_parsed_expression("x**2 - 3*x")
+    assert get_parsed_expression("x**2 - 3*x") is parsed
+    assert parsed.sympy_expr == sp.sympify("x**2 - 3*x")
+    assert parsed.latex.startswith("x^{2} - 3")
+
+
+def test_lazy_attributes():
+    parsed = ParsedExpression("exp(x) - 2")
+    assert "sympy_expr" not in parsed.__dict__
+    assert parsed.function(0) == -1
+    # Compiling the evaluator does not need the SymPy tree
+    assert "sympy_expr" not in parsed.__dict__
+
+
+def test_derivatives_are_kept():
+    parsed = ParsedExpression("sin(x)**2")
+    derivative = parsed.derivative()
+    assert parsed.derivative() is derivative
+    assert derivative.function(0.3) == pytest.approx(math.sin(0.6))
+    assert [expression.source for expression in parsed.derivatives(2)][1] == derivative.source
+
+
+def test_vectorized_function():
+    parsed = ParsedExpression("x**2 + 1")
+    assert np.allclose(parsed.vectorized_function(np.array([1j, 2])), [0, 5])
+    assert ParsedExpression("7").vectorized_function(np.zeros(3)).shape == (3,)
+
+
+def test_consumers_share_the_parse():
+    f, df, _ = get_function_and_derivatives("x**3 - 2*x")
+    parsed = get_parsed_expression("x**3 - 2*x")
+    assert f is parsed.function
+    assert df is parsed.derivative().function
+    assert get_function("x**3 - 2*x") is f
+    assert compute_derivative("x**3 - 2*x") == parsed.derivative().source
+
+
+def test_compiled_function_is_thread_safe():
+    f = get_function("x * 2")
+    results = {}
+
+    def evaluate(value):
+        results[value] = [f(value) for _ in range(2000)]
+
+    threads = [threading.Thread(target=evaluate, args=(value,)) for value in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(values == [2 * value] * 2000 for value, values in results.items())
+
+
+def test_parametric_function():
+    parsed = ParsedExpression("a*sin(x) - x/2 + e*k")
+    assert parsed.parameters == ("a", "k")
+    f = parsed.parametric_function(parsed.parameters)
+    assert f(1.0, 2.0, 3.0) == pytest.approx(2 * math.sin(1) - 0.5 + 3 * math.e)
+    assert parsed.parametric_function(("a", "k")) is f
+    vectorized = parsed.derivative().parametric_function(parsed.parameters, vectorized=True)
+    np.testing.assert_allclose(vectorized(np.array([0.0, 1.0]), 2.0, 3.0), 2 * np.cos([0.0, 1.0]) - 0.5)
+    assert sp.sympify(parsed.substitute({"a": 1.5, "k": 0})) == sp.sympify("1.5*sin(x) - x/2")
+
+
+def test_seed():
+    parsed = ParsedExpression("c*x**2")
+    parsed.seed("c x^{2}", ["c"], [("2*c*x", None, "simplify", 0.0), ("2*c", None, "simplify", 0.0)])
+    assert parsed.latex == "c x^{2}"
+    assert parsed.parameters == ("c",)
+    assert parsed.derivatives(2)[2].parametric_function(("c",))(5.0, 3.0) == 6.0
+    assert "sympy_expr" not in parsed.__dict__
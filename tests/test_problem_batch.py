@@ -0,0 +1,111 @@
+import csv
+import math
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from src.utils.problem_batch import export_results, load_problems, solve_problem, solve_problems
+from src.utils.result_store import STATUS_CANCELLED, STATUS_CONVERGED, STATUS_DEADLINE_EXCEEDED, STATUS_FAILED
+from src.utils.solve_limits import CancellationToken
+
+PROBLEMS_CSV = """expression,method,a,b,x0,x1,tol,variant,order
+x**2 - 2,Bisection,0,2,,,1e-10,,
+x**2 - 2,False Position,0,2,,,1e-10,Illinois,
+cos(x) - x,Newton,,,1,,1e-12,,
+x**3 - 1,Householder,,,2,,,,4
+x**2 + 1,Newton,,,0,,,,
+exp(x) - 3,Secant,,,0,1,,,
+"""
+
+
+@pytest.fixture
+def problems(tmp_path):
+    path = tmp_path / "problems.csv"
+    path.write_text(PROBLEMS_CSV)
+    return load_problems(path)
+
+
+def test_load_problems(problems):
+    assert len(problems) == 6
+    assert problems[1]["method"] == "false position"
+    assert problems[1]["variant"] == "illinois"
+    assert problems[3]["order"] == 4
+    assert problems[5]["max_iter"] == 100
+
+
+def test_load_problems_errors(tmp_path):
+    path = tmp_path / "problems.csv"
+    path.write_text("expression,method,x0\nx - 1,Bisection,0\n")
+    with pytest.raises(ValueError, match="Line 2"):
+        load_problems(path)
+
+    path.write_text("expression,speed\nx - 1,1\n")
+    with pytest.raises(ValueError):
+        load_problems(path)
+
+
+def test_solve_problem(problems):
+    (root, iterations, nfev, status), error = solve_problem(problems[2])
+    assert root == pytest.approx(0.7390851332151607)
+    assert status == STATUS_CONVERGED and error == ""
+    assert nfev > iterations
+
+    (root, _, _, status), error = solve_problem(problems[4])
+    assert math.isnan(root) and status == STATUS_FAILED
+    assert "zero" in error
+
+    (_, _, _, status), _ = solve_problem(dict(problems[0], expression="x +* 2"))
+    assert status == STATUS_FAILED
+
+
+def test_solve_problems_in_process(problems):
+    chunks = list(solve_problems(problems, chunk_size=4, max_workers=1))
+    assert [start for start, _, _ in chunks] == [0, 4]
+    results = np.concatenate([results for _, results, _ in chunks])
+    assert list(results["status"]) == [STATUS_CONVERGED] * 4 + [STATUS_FAILED, STATUS_CONVERGED]
+    assert np.allclose(results["root"][[0, 1, 3, 5]], [math.sqrt(2), math.sqrt(2), 1, math.log(3)])
+
+
+def test_solve_problems_limits(problems):
+    [(_, results, _)] = solve_problems(problems, max_workers=1, time_limit=-1)
+    assert np.all(results["status"] == STATUS_DEADLINE_EXCEEDED)
+
+    token = CancellationToken()
+    token.cancel()
+    assert list(solve_problems(problems, max_workers=1, cancel_token=token)) == []
+
+
+def test_cancel_stops_running_chunks_in_worker_processes():
+    # With tol = 0, bisection runs up to max_iter once the bracket stops shrinking, which takes minutes
+    problem = {"expression": "x**2 - 2", "method": "bisection", "a": 0.0, "b": 2.0, "tol": 0.0, "max_iter": 10 ** 9,
+               "variant": "standard", "order": 3}
+    token = CancellationToken()
+    timer = threading.Timer(3, token.cancel)
+    timer.start()
+    start = time.perf_counter()
+    chunks = list(solve_problems([problem] * 4, chunk_size=2, max_workers=2, cancel_token=token))
+    timer.cancel()
+    assert time.perf_counter() - start < 15
+    statuses = np.concatenate([results["status"] for _, results, _ in chunks])
+    assert 1 <= len(statuses) <= 2 and np.all(statuses == STATUS_CANCELLED)
+
+
+def test_solve_problems_in_worker_processes(problems):
+    chunks = list(solve_problems(problems * 3, chunk_size=5, max_workers=2))
+    assert sorted(start for start, _, _ in chunks) == [0, 5, 10, 15]
+    assert sum(len(results) for _, results, _ in chunks) == 18
+
+
+def test_export_results(problems, tmp_path):
+    [(_, results, errors)] = solve_problems(problems, max_workers=1)
+    path = tmp_path / "results.csv"
+    export_results(path, problems, results, errors)
+
+    with open(path, newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert len(rows) == 6
+    assert rows[0]["status"] == "Converged"
+    assert rows[4]["status"] == "Failed" and rows[4]["error"]
+    assert float(rows[2]["root"]) == pytest.approx(0.7390851332151607)
@@ -0,0 +1,64 @@
+import math
+
+import pytest
+
+from src.algorithms.bisection import bisection
+from src.algorithms.ridders import ridders, ridders_iter
+from src.utils.function_evaluation import get_function
+
+
+def test_ridders_typical_case():
+    f = get_function("x**2 - 3")
+    root, _ = ridders(f, 1, 2, tol=1e-10)
+    assert math.isclose(root, 3 ** 0.5, rel_tol=1e-10)
+
+
+def test_ridders_root_at_boundary():
+    f = get_function("x - 2")
+    root, iterations = ridders(f, 1, 2)
+    assert root == 2
+    assert iterations == 0
+
+
+def test_ridders_no_roots():
+    f = get_function("x + 2")
+    with pytest.raises(ValueError) as exif:
+        ridders(f, 1, 2)
+    assert "The function does not change sign" in str(exif.value)
+
+
+def test_ridders_maximum_iterations():
+    f = get_function("exp(-x) - x")
+    with pytest.raises(ValueError) as exif:
+        ridders(f, 0, 1, tol=1e-15, max_iter=1)
+    assert "Exceeded maximum iterations" in str(exif.value)
+
+
+def test_ridders_fewer_iterations_than_bisection():
+    f = get_function("exp(x) - 100")
+    root, iterations = ridders(f, 0, 10, tol=1e-10)
+    _, bisection_iterations = bisection(f, 0, 10, tol=1e-10)
+    assert math.isclose(root, math.log(100), rel_tol=1e-10)
+    assert iterations < bisection_iterations / 4
+
+
+def test_ridders_discontinuous_function():
+    # The exponential fit does not hold across a jump, but the bracket keeps the sign change
+    def f(x):
+        return -1.0 if x < 0.3 else 1.0
+
+    root, _ = ridders(f, 0, 1, tol=1e-10)
+    assert math.isclose(root, 0.3, abs_tol=1e-10)
+
+
+def test_ridders_iter_yields_brackets():
+    f = get_function("x**3 - 2*x - 5")
+    states = list(ridders_iter(f, 1, 3, tol=1e-12))
+    assert [state["n"] for state in states] == list(range(1, len(states) + 1))
+    for state in states:
+        assert state["a"] <= state["x"] <= state["b"]
+        assert state["a"] <= 2.0945514815423265 <= state["b"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,90 @@
+import time
+
+import pytest
+
+from src.utils import sandbox as sandbox_module
+from src.utils.metrics import REGISTRY
+from src.utils.parsed_expression import get_parsed_expression
+from src.utils.problem_batch import solve_problem
+from src.utils.result_store import STATUS_CONVERGED, STATUS_FAILED
+from src.utils.sandbox import ExpressionRejected, ExpressionSandbox, prepare_expression
+
+
+@pytest.fixture(scope="module")
+def sandbox():
+    sandbox = ExpressionSandbox(time_limit=1.0, memory_limit=256 * 1024 ** 2)
+    yield sandbox
+    sandbox.close()
+
+
+def test_prepared_expression_is_seeded(sandbox):
+    parsed = prepare_expression("x*sin(x) + 17", order=2, sandbox=sandbox)
+    assert parsed is get_parsed_expression("x*sin(x) + 17")
+    assert parsed.latex == "x  \\sin{\\left(x \\right)} + 17"
+    assert parsed.derivative().source == "x*cos(x) + sin(x)"
+    assert parsed.derivative().derivative().function(0) == 2
+    # Nothing was parsed with SymPy in this process
+    assert "sympy_expr" not in parsed.__dict__
+
+
+def test_parameters_are_prepared(sandbox):
+    assert prepare_expression("b*x**2 - 19", order=0, sandbox=sandbox).parameters == ("b",)
+
+
+def test_invalid_expressions_are_rejected(sandbox):
+    for source in ["x +* 2", "foo(x) + 1"]:
+        with pytest.raises(ExpressionRejected, match="Invalid expression"):
+            sandbox.prepare(source)
+
+
+def test_runaway_expression_is_stopped_and_worker_replaced(sandbox):
+    start = time.perf_counter()
+    with pytest.raises(ExpressionRejected):
+        sandbox.prepare("9**9**9 + x")
+    assert time.perf_counter() - start < 1.0 + 3
+    assert sandbox.prepare("x**2 - 23")["derivatives"][0][0] == "2*x"
+
+    # Running over a limit may be down to the load of the machine, so the outcome is not kept
+    assert ("9**9**9 + x", 1) not in sandbox._outcomes
+    assert ("x**2 - 23", 1) in sandbox._outcomes
+
+
+def test_worker_that_died_while_idle_is_replaced(sandbox):
+    sandbox.prepare("x**2 - 37")
+    worker = sandbox._idle.get()
+    worker.process.kill()
+    worker.process.join()
+    sandbox._idle.put(worker)
+    assert sandbox.prepare("x**3 - 2")["derivatives"][0][0] == "3*x**2"
+
+
+def test_worker_metrics_are_merged(sandbox):
+    REGISTRY.reset()
+    prepare_expression("x*cos(x) - 41", order=1, sandbox=sandbox)
+    stages = {dict(labels)["stage"] for name, labels in REGISTRY.snapshot()["histograms"]
+              if name == "rootfinder_expression_seconds"}
+    assert {"parse", "differentiate"} <= stages
+
+
+def test_worker_start_does_not_count_against_the_time_limit(monkeypatch):
+    # A new worker takes longer than this to set up SymPy, which must not reject the expression
+    monkeypatch.setattr(sandbox_module, "SANDBOX_WALL_MARGIN", 0.3)
+    fresh = ExpressionSandbox(time_limit=0.2)
+    try:
+        assert fresh.prepare("x**2 - 43")["derivatives"][0][0] == "2*x"
+    finally:
+        fresh.close()
+
+
+def test_memory_limit(sandbox):
+    with pytest.raises(ExpressionRejected, match="memory"):
+        sandbox.prepare("len([0] * 10**9) + x")
+    assert sandbox.prepare("x - 29")["latex"] == "x - 29"
+
+
+def test_bad_row_does_not_stop_a_batch():
+    problem = {"expression": "9**9**9 + x", "method": "newton", "x0": 1.0, "tol": 1e-8, "max_iter": 50}
+    (_, _, _, status), error = solve_problem(problem)
+    assert status == STATUS_FAILED and "limit" in error
+    (root, _, _, status), _ = solve_problem(dict(problem, expression="x**2 - 31"))
+    assert status == STATUS_CONVERGED and root == pytest.approx(31 ** 0.5)
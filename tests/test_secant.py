@@ -2,7 +2,7 @@ import math
 
 import pytest
 
-from src.algorithms.secant import secant
+from src.algorithms.secant import secant, secant_iter
 from src.utils.function_evaluation import get_function
 
 
@@ -66,5 +66,23 @@ def test_secant_small_intervals():
     assert math.isclose(root, math.sqrt(2), rel_tol=1e-10)
 
 
+def test_secant_iter_interleaved():
+    # Two solves advanced cooperatively in the same thread
+    f = get_function("x**2 - 2")
+    g = get_function("x**3 - 3")
+    steps = [secant_iter(f, 1, 1.5, tol=1e-10), secant_iter(g, 1, 1.5, tol=1e-10)]
+    last = [None, None]
+    while any(step is not None for step in steps):
+        for idx, step in enumerate(steps):
+            if step is None:
+                continue
+            try:
+                last[idx] = next(step)
+            except StopIteration:
+                steps[idx] = None
+    assert math.isclose(last[0]["x"], math.sqrt(2), rel_tol=1e-10)
+    assert math.isclose(last[1]["x"], 3 ** (1 / 3), rel_tol=1e-10)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
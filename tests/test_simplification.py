@@ -0,0 +1,84 @@
+import math
+import threading
+import time
+
+import pytest
+import sympy as sp
+
+from src.utils.metrics import REGISTRY
+from src.utils.parsed_expression import ParsedExpression
+from src.utils.simplification import simplify_bounded
+from src.utils.symbolic_diff import compute_derivative
+
+x = sp.symbols("x")
+
+
+def test_simplify_bounded_keeps_cheaper_form():
+    simplified, cse_form, strategy, seconds = simplify_bounded(sp.diff(sp.sin(x) ** 2, x))
+    assert strategy == "simplify"
+    assert simplified == sp.sin(2 * x)
+    assert cse_form is None
+    assert seconds >= 0
+
+
+def test_simplify_bounded_falls_back_to_raw_derivative():
+    derivative = sp.diff(x ** 3 - 2 * x, x)
+    simplified, _, strategy, _ = simplify_bounded(derivative)
+    assert strategy == "diff"
+    assert simplified == derivative
+
+
+def test_simplify_bounded_respects_time_limit():
+    # sp.simplify takes tens of seconds on this derivative
+    expr = sp.sympify("sin(cos(tan(exp(x) + x**2)/(1 + x)))**3/(1 + exp(-x*sin(x)))")
+    start = time.perf_counter()
+    simplified, _, strategy, _ = simplify_bounded(sp.diff(expr, x), time_limit=0.2)
+    assert time.perf_counter() - start < 2
+    assert not strategy.startswith("simplify")
+    assert float(simplified.subs(x, 0.3)) == pytest.approx(float(sp.diff(expr, x).subs(x, 0.3)))
+
+
+def test_timed_out_transforms_leave_nothing_running():
+    # sp.simplify does not finish on this derivative within the limit, and the extraction is charged to it too
+    expr = sp.diff(sp.sympify("exp(sin(x)**2)*log(1 + x**2)/(1 + cos(x))"), x)
+    # Wait for a helper process to be set up, which the time limit does not cover
+    simplify_bounded(sp.diff(sp.sin(x) ** 2, x))
+    threads = threading.active_count()
+    start = time.perf_counter()
+    simplify_bounded(expr, time_limit=0.3)
+    assert time.perf_counter() - start < 0.3 + 0.1
+    assert threading.active_count() == threads
+
+
+def test_transforms_are_not_forked_from_the_main_process(monkeypatch):
+    def fork():
+        raise AssertionError("os.fork called")
+
+    monkeypatch.setattr("os.fork", fork)
+    _, _, strategy, _ = simplify_bounded(sp.diff(sp.sin(x) ** 2, x))
+    assert strategy == "simplify"
+
+
+def test_common_subexpressions_are_evaluated_once():
+    parsed = ParsedExpression("exp(sin(x)**2)*log(1 + x**2)/(1 + cos(x))")
+    derivative = parsed.derivative()
+    assert derivative.simplify_strategy.endswith("+cse")
+    assert derivative.cse_form is not None
+    expected = float(sp.diff(parsed.sympy_expr, x).subs(x, 0.3))
+    assert derivative.function(0.3) == pytest.approx(expected)
+    assert derivative.vectorized_function(0.3) == pytest.approx(expected)
+    # The source stays a plain expression, for display and interval evaluation
+    assert "_cse" not in derivative.source
+    assert compute_derivative("exp(sin(x)**2)*log(1 + x**2)/(1 + cos(x))") == \
+        ParsedExpression("exp(sin(x)**2)*log(1 + x**2)/(1 + cos(x))").derivative().source
+
+
+def test_simplification_is_reported():
+    key = ("rootfinder_simplifications_total", (("strategy", "diff"),))
+    before = REGISTRY.snapshot()["counters"].get(key, 0)
+    derivative = ParsedExpression("x**4 + x").derivative()
+    assert derivative.simplify_strategy == "diff"
+    assert derivative.simplify_seconds < 1
+    assert REGISTRY.snapshot()["counters"][key] == before + 1
+    assert derivative.function(2) == 33
+    assert math.isclose(derivative.derivative().function(2), 48)
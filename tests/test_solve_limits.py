@@ -0,0 +1,106 @@
+import math
+import time
+
+import numpy as np
+import pytest
+
+from src.algorithms.bisection import bisection
+from src.algorithms.newton import newton, newton_iter
+from src.algorithms.newton_basins import newton_basins
+from src.algorithms.nonlinear_system import newton_system
+from src.utils.batch import solve_batch
+from src.utils.function_evaluation import get_function, get_function_and_derivatives, get_system_and_jacobian
+from src.utils.result_store import STATUS_BUDGET_EXHAUSTED, STATUS_CONVERGED, STATUS_DEADLINE_EXCEEDED
+from src.utils.solve_limits import BudgetExhausted, Cancelled, CancellationToken, DeadlineExceeded
+
+
+def test_budget_exhausted_carries_best_iterate():
+    f = get_function("x**3 - x - 2")
+    with pytest.raises(BudgetExhausted) as info:
+        bisection(f, 1, 2, tol=1e-12, max_fev=10)
+    assert info.value.nfev == 10
+    assert abs(info.value.x - 1.5213797) < 0.01
+    assert info.value.fx == f(info.value.x)
+
+
+def test_budget_counts_derivatives():
+    f, df, _ = get_function_and_derivatives("x**2 - 2")
+    newton(f, df, 1, tol=1e-10, max_fev=20)
+    with pytest.raises(BudgetExhausted) as info:
+        newton(f, df, 1, tol=1e-10, max_fev=3)
+    assert info.value.nfev == 3
+
+
+def test_budget_counts_finite_difference_evaluations():
+    calls = []
+
+    def f(x):
+        calls.append(x)
+        return math.exp(x) - 2
+
+    _, df, _ = get_function_and_derivatives(f)
+    _, iterations = newton(f, df, 1.0, tol=1e-12)
+    needed = len(calls)
+    assert needed > 2 * iterations + 2
+
+    # Each call of df evaluates f many times, and all of them count
+    calls.clear()
+    with pytest.raises(BudgetExhausted) as exif:
+        newton(f, df, 1.0, tol=1e-12, max_fev=needed - 1)
+    assert len(calls) == exif.value.nfev == needed - 1
+
+
+def test_limits_are_value_errors():
+    f, df, _ = get_function_and_derivatives("x**2 - 2")
+    with pytest.raises(ValueError):
+        newton(f, df, 1, deadline=time.monotonic() - 1)
+
+
+def test_deadline_exceeded():
+    f = get_function("x**2 - 2")
+
+    def slow(x):
+        time.sleep(0.01)
+        return f(x)
+
+    with pytest.raises(DeadlineExceeded) as info:
+        bisection(slow, 0, 2, tol=1e-15, max_iter=10000, deadline=time.monotonic() + 0.05)
+    assert 0 < info.value.nfev < 20
+
+
+def test_cancellation_between_iterations():
+    f, df, _ = get_function_and_derivatives("x**2 - 2")
+    token = CancellationToken()
+    solver = newton_iter(f, df, 10, tol=1e-12, cancel_token=token)
+    next(solver)
+    token.cancel()
+    with pytest.raises(Cancelled) as info:
+        next(solver)
+    assert info.value.x is not None
+
+
+def test_system_limits():
+    F, J = get_system_and_jacobian(["x**2 + y**2 - 4", "x - y"], ["x", "y"])
+    with pytest.raises(BudgetExhausted) as info:
+        newton_system(F, J, [1, 2], tol=1e-12, max_fev=3)
+    assert np.asarray(info.value.x).shape == (2,)
+
+
+def test_basins_budget():
+    starts = np.linspace(-2, 2, 100) + 0.5j
+    f = lambda z: z ** 2 - 1
+    df = lambda z: 2 * z
+    with pytest.raises(BudgetExhausted):
+        newton_basins(f, df, starts, max_fev=150)
+
+
+def test_solve_batch_limit_statuses():
+    f, df, _ = get_function_and_derivatives("x**2 - 2")
+    results = solve_batch(newton, f, [1, 1000], derivatives=(df,), tol=1e-10, max_fev=12)
+    assert list(results["status"]) == [STATUS_CONVERGED, STATUS_BUDGET_EXHAUSTED]
+    assert results["nfev"][1] == 12
+    assert math.isfinite(results["root"][1])
+
+    results = solve_batch(newton, f, [1], derivatives=(df,), deadline=time.monotonic() - 1)
+    assert results["status"][0] == STATUS_DEADLINE_EXCEEDED
+    assert math.isnan(results["root"][0])
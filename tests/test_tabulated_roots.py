@@ -0,0 +1,66 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.algorithms.bisection import bisection
+from src.algorithms.tabulated_roots import tabulated_roots
+from src.utils.sample_data import TabulatedFunction, load_samples
+
+
+def coarse_samples():
+    x = np.linspace(0.5, 3, 26)
+    return x, np.exp(x) - 5
+
+
+def test_pchip_is_more_accurate_than_linear():
+    x, y = coarse_samples()
+    linear, = tabulated_roots((x, y), kind="linear")
+    pchip, = tabulated_roots((x, y), kind="pchip")
+    assert abs(pchip - math.log(5)) < abs(linear - math.log(5)) / 10
+
+
+def test_chunked_roots_match_unchunked():
+    x = np.linspace(-10, 10, 2001)
+    y = np.sin(x)
+    whole = tabulated_roots((x, y))
+    np.testing.assert_allclose(whole, [k * math.pi for k in range(-3, 4)], atol=1e-7)
+    for chunk_size in [1, 6, 7, 100]:
+        np.testing.assert_array_equal(tabulated_roots((x, y), chunk_size=chunk_size), whole)
+
+
+@pytest.mark.parametrize("name", ["samples.npy", "samples.bin", "samples.csv"])
+def test_roots_from_files(tmp_path, name):
+    x, y = coarse_samples()
+    path = tmp_path / name
+    if name.endswith(".npy"):
+        np.save(path, np.column_stack([x, y]))
+    elif name.endswith(".bin"):
+        np.column_stack([x, y]).tofile(path)
+    else:
+        np.savetxt(path, np.column_stack([x, y]), delimiter=",", header="x,y", comments="")
+
+    loaded_x, loaded_y = load_samples(path)
+    np.testing.assert_allclose(loaded_x, x)
+    np.testing.assert_allclose(tabulated_roots(str(path), chunk_size=7), tabulated_roots((x, y)))
+
+
+def test_tabulated_function_with_solver():
+    f = TabulatedFunction(*coarse_samples())
+    root, _ = bisection(f, 1, 2, 1e-12, 100)
+    assert root == pytest.approx(tabulated_roots(coarse_samples())[0], abs=1e-11)
+    assert f(0.5) == pytest.approx(math.exp(0.5) - 5)
+    assert np.isnan(f(4))
+
+
+def test_zero_samples_are_roots():
+    x = np.arange(6.0)
+    y = np.array([0.0, 1.0, 0.0, -1.0, 1.0, 0.0])
+    np.testing.assert_allclose(tabulated_roots((x, y), chunk_size=1), [0, 2, 3.5, 5])
+
+
+def test_invalid_samples():
+    with pytest.raises(ValueError):
+        tabulated_roots((np.array([0.0, 2.0, 1.0]), np.array([1.0, -1.0, 1.0])))
+    with pytest.raises(ValueError):
+        tabulated_roots(coarse_samples(), kind="cubic")